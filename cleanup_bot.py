@@ -6,20 +6,13 @@ import os
 import sys
 import signal
 import time
-from pathlib import Path
 
 def cleanup_bot_sessions():
     """Clean up any existing bot sessions"""
     print("🧹 Cleaning up bot sessions...")
     
-    # Remove lock file if it exists
-    lock_file = Path(__file__).parent / "bot.lock"
-    if lock_file.exists():
-        try:
-            lock_file.unlink()
-            print("✅ Lock file removed")
-        except Exception as e:
-            print(f"⚠️ Could not remove lock file: {e}")
+    # bot.lock is left alone: the launcher's OS lock dies with its process, and deleting
+    # the file while a bot holds it would let a second launcher lock a fresh file
     
     # Try to kill any existing Python processes that might be running the bot
     try:
@@ -54,6 +47,7 @@ def cleanup_bot_sessions():
             
     except ImportError:
         print("⚠️ psutil not available, cannot check for running processes")
+        print("💡 Install it with 'pip install psutil' or stop the bot process manually")
     
     print("🧹 Cleanup completed!")
     print("💡 You can now start the bot with: python telegram_launcher.py")
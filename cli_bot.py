@@ -7,6 +7,7 @@ from pathlib import Path
 from helpers import Settings, LoggerHelper
 from job_sites import GeekJobSite, HHSite
 from services import HHLocationService, JobSearchService, JobResultsLogger
+from utils import JobFormatting
 
 logger = LoggerHelper.get_logger(__name__, prefix='cli')
 
@@ -52,8 +53,9 @@ class JobSearchBot:
                 logger.info("User cleared site selection, using default sites")
                 return Settings.get_default_site_choices()
 
-            selected = Settings.validate_site_choice(choice)
-            if selected:
+            # validate_site_choice only answers yes/no, so hand back the parsed list
+            selected = [site.strip() for site in choice.split(',')]
+            if Settings.validate_site_choice(selected):
                 logger.info(f"User selected sites: {selected}")
                 return selected
 
@@ -459,6 +461,10 @@ class JobSearchBot:
             logger.error(f"Error validating parameters: {e}")
             return False
 
+    def _clean_html_tags(self, text):
+        """Remove HTML tags (e.g. HH's <highlighttext>) from text"""
+        return JobFormatting.strip_html_tags(text)
+
     def _extract_job_info(self, job_text):
         """Extract job information from text"""
         try:
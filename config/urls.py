@@ -7,17 +7,41 @@ All URLs are now managed through the urls.json configuration file.
 
 import json
 import os
+import re
+from functools import lru_cache
 from pathlib import Path
 
 
+# Scheme, a host that does not start with a separator, and no whitespace anywhere
+_URL_RE = re.compile(r'https?://[^\s/$.?#][^\s]*\Z')
+
+# Decoded JSON files keyed by path, stored with the mtime they were read at
+_CONFIG_CACHE = {}
+
+
+def _read_json_cached(path):
+    """Load a JSON file, reusing the decoded result until the file's mtime changes.
+    
+    Raises the same errors as open()/json.load(); callers must not mutate the result.
+    """
+    path = str(path)
+    mtime = os.stat(path).st_mtime_ns
+    cached = _CONFIG_CACHE.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    with open(path, 'r', encoding='utf-8') as f:
+        config = json.load(f)
+    _CONFIG_CACHE[path] = (mtime, config)
+    return config
+
+
 def load_urls_config():
     """Load URL configuration from urls.json file."""
     config_path = Path(__file__).parent / "urls.json"
     
     if config_path.exists():
         try:
-            with open(config_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            return _read_json_cached(config_path)
         except (json.JSONDecodeError, IOError) as e:
             print(f"Warning: Could not load urls.json: {e}")
     
@@ -34,7 +58,13 @@ class URLConfig:
     """Centralized URL configuration for the application."""
     
     def __init__(self):
-        self._config = load_urls_config()
+        self._set_config(load_urls_config())
+    
+    def _set_config(self, config):
+        """Store the configuration and its flat placeholder image table."""
+        self._config = config
+        self._placeholders = config.get("external_services", {}).get("placeholder_images", {})
+        self._default_placeholder = self._placeholders.get("job_opportunity", "")
     
     @property
     def external_services(self):
@@ -53,8 +83,7 @@ class URLConfig:
     
     def get_placeholder_image(self, image_type):
         """Get placeholder image URL by type."""
-        placeholder_images = self.external_services.get("placeholder_images", {})
-        return placeholder_images.get(image_type, placeholder_images.get("job_opportunity", ""))
+        return self._placeholders.get(image_type, self._default_placeholder)
     
     def get_site_logo_url(self, site_name, employer_id, logo_filename=None, size='default'):
         """Get logo URL for a specific employer on a specific site."""
@@ -97,11 +126,10 @@ class URLConfig:
         
         # Use configuration fallback
         try:
-            with open('config/urls.json', 'r', encoding='utf-8') as f:
-                config = json.load(f)
-                templates = config.get('url_templates', {}).get('generic', {})
-                if 'vacancy' in templates:
-                    return templates['vacancy'].format(site=site_name, job_id=job_id)
+            config = _read_json_cached('config/urls.json')
+            templates = config.get('url_templates', {}).get('generic', {})
+            if 'vacancy' in templates:
+                return templates['vacancy'].format(site=site_name, job_id=job_id)
         except (FileNotFoundError, json.JSONDecodeError):
             pass
         
@@ -129,11 +157,10 @@ class URLConfig:
         
         # Use configuration templates if available
         try:
-            with open('config/urls.json', 'r', encoding='utf-8') as f:
-                config = json.load(f)
-                templates = config.get('url_templates', {}).get('generic', {})
-                if 'company' in templates:
-                    return templates['company'].format(site=site_name, company_id=company_id)
+            config = _read_json_cached('config/urls.json')
+            templates = config.get('url_templates', {}).get('generic', {})
+            if 'company' in templates:
+                return templates['company'].format(site=site_name, company_id=company_id)
         except (FileNotFoundError, json.JSONDecodeError):
             pass
         
@@ -160,11 +187,10 @@ class URLConfig:
         
         # Use configuration templates if available
         try:
-            with open('config/urls.json', 'r', encoding='utf-8') as f:
-                config = json.load(f)
-                templates = config.get('url_templates', {}).get('generic', {})
-                if 'apply' in templates:
-                    return templates['apply'].format(site=site_name, job_id=job_id)
+            config = _read_json_cached('config/urls.json')
+            templates = config.get('url_templates', {}).get('generic', {})
+            if 'apply' in templates:
+                return templates['apply'].format(site=site_name, job_id=job_id)
         except (FileNotFoundError, json.JSONDecodeError):
             pass
         
@@ -191,11 +217,10 @@ class URLConfig:
         
         # Use configuration templates if available
         try:
-            with open('config/urls.json', 'r', encoding='utf-8') as f:
-                config = json.load(f)
-                templates = config.get('url_templates', {}).get('generic', {})
-                if 'search' in templates:
-                    return templates['search'].format(site=site_name, query=query)
+            config = _read_json_cached('config/urls.json')
+            templates = config.get('url_templates', {}).get('generic', {})
+            if 'search' in templates:
+                return templates['search'].format(site=site_name, query=query)
         except (FileNotFoundError, json.JSONDecodeError):
             pass
         
@@ -222,11 +247,10 @@ class URLConfig:
         
         # Use configuration templates if available
         try:
-            with open('config/urls.json', 'r', encoding='utf-8') as f:
-                config = json.load(f)
-                templates = config.get('url_templates', {}).get('generic', {})
-                if 'api' in templates:
-                    return templates['api'].format(site=site_name)
+            config = _read_json_cached('config/urls.json')
+            templates = config.get('url_templates', {}).get('generic', {})
+            if 'api' in templates:
+                return templates['api'].format(site=site_name)
         except (FileNotFoundError, json.JSONDecodeError):
             pass
         
@@ -244,9 +268,20 @@ class URLConfig:
     
     def validate_url(self, url):
         """Validate if a URL is properly formatted."""
-        if not url:
+        if not url or not isinstance(url, str):
             return False
-        return url.startswith(('http://', 'https://'))
+        # Cheap scheme check rejects most invalid input before the regex runs
+        if not url.startswith(('http://', 'https://')):
+            return False
+        return _URL_RE.match(url) is not None
+    
+    def validate_urls(self, urls):
+        """Validate many URLs at once; returns a list of bools in input order."""
+        match = _URL_RE.match
+        return [
+            isinstance(url, str) and url.startswith(('http://', 'https://')) and match(url) is not None
+            for url in urls
+        ]
     
     def format_url_with_params(self, url_template, **params):
         """Format a URL template with parameters."""
@@ -259,7 +294,8 @@ class URLConfig:
     
     def reload_config(self):
         """Reload configuration from file."""
-        self._config = load_urls_config()
+        _CONFIG_CACHE.clear()
+        self._set_config(load_urls_config())
 
 
 # Global instance
@@ -267,16 +303,19 @@ _url_config = URLConfig()
 
 
 # Convenience functions for backward compatibility
+@lru_cache(maxsize=1024)
 def get_site_logo_url(site_name, employer_id, logo_filename=None, size='default'):
     """Get logo URL for a specific employer on a specific site."""
     return _url_config.get_site_logo_url(site_name, employer_id, logo_filename, size)
 
 
+@lru_cache(maxsize=1024)
 def get_site_vacancy_url(site_name, job_id):
     """Get vacancy URL for a specific job on a specific site."""
     return _url_config.get_site_vacancy_url(site_name, job_id)
 
 
+@lru_cache(maxsize=1024)
 def get_site_company_url(site_name, company_id):
     """Get company URL for a specific company on a specific site."""
     return _url_config.get_site_company_url(site_name, company_id)
@@ -292,6 +331,7 @@ def get_site_search_url(site_name, query):
     return _url_config.get_site_search_url(site_name, query)
 
 
+@lru_cache(maxsize=1024)
 def get_site_api_url(site_name):
     """Get API URL for a specific site."""
     return _url_config.get_site_api_url(site_name)
@@ -304,16 +344,17 @@ def get_placeholder_image(image_type):
 
 def reload_url_config():
     """Reload URL configuration from file."""
-    _url_config.reload_config() 
+    _url_config.reload_config()
+    for getter in (get_site_logo_url, get_site_vacancy_url, get_site_company_url, get_site_api_url):
+        getter.cache_clear()
 
 
 def get_placeholder_images():
     """Get placeholder image URLs from configuration"""
     try:
         # Load from urls.json
-        with open('config/urls.json', 'r', encoding='utf-8') as f:
-            config = json.load(f)
-            return config.get('external_services', {}).get('placeholder_images', {})
+        config = _read_json_cached('config/urls.json')
+        return config.get('external_services', {}).get('placeholder_images', {})
     except (FileNotFoundError, json.JSONDecodeError):
         # Return empty dict if configuration cannot be loaded
         return {}
@@ -322,12 +363,11 @@ def get_site_url(site_name, url_type, **kwargs):
     """Get site URL from configuration"""
     try:
         # Load from urls.json
-        with open('config/urls.json', 'r', encoding='utf-8') as f:
-            config = json.load(f)
-            templates = config.get('url_templates', {}).get('generic', {})
-            url_template = templates.get(url_type, '')
-            if url_template:
-                return url_template.format(site=site_name, **kwargs)
+        config = _read_json_cached('config/urls.json')
+        templates = config.get('url_templates', {}).get('generic', {})
+        url_template = templates.get(url_type, '')
+        if url_template:
+            return url_template.format(site=site_name, **kwargs)
     except (FileNotFoundError, json.JSONDecodeError):
         pass
     
@@ -526,6 +526,31 @@ class ConfigHelper:
         else:
             return f"{web_base}{job_path}"
     
+    def get_site_job_url_template(self, site_id: str) -> str:
+        """
+        Get the job URL template for a site
+        
+        Args:
+            site_id: Site identifier
+            
+        Returns:
+            Job URL with a {job_id} placeholder, or empty string if not configured
+        """
+        site_config = self.get_site_config(site_id)
+        
+        if 'urls' in site_config and 'vacancy' in site_config['urls']:
+            return site_config['urls']['vacancy']
+        
+        job_url_template = site_config.get("job_url", "")
+        if job_url_template:
+            return job_url_template
+        
+        web_base = site_config.get("web_base", "")
+        job_path = site_config.get("job_path", "")
+        if not web_base or not job_path:
+            return ""
+        return f"{web_base}{job_path}"
+    
     def get_site_employer_url(self, site_id: str, employer_id: str = None) -> str:
         """
         Get employer URL for a site
@@ -24,6 +24,8 @@ COMPANY_FIELD_RU = "Компания:"
 COMPANY_FIELD_EN = "Company:"
 LOCATION_FIELD_RU = "Локация:"
 LOCATION_FIELD_EN = "Location:"
+# Long-form Russian location label used in formatted job text
+LOCATION_LABEL_RU = "Местоположение:"
 
 # Icon mapping for different contexts
 ICON_MAPPING = {
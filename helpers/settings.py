@@ -130,11 +130,12 @@ class SettingsHelper:
         """Validate site choice input"""
         # Import config here to avoid circular import
         from helpers.config import get_all_sites
-        all_sites = list(get_all_sites().keys())
+        # Keys view keeps membership tests hashed instead of scanning a list
+        all_sites = get_all_sites().keys()
         
         if isinstance(choice, list):
-            # Handle list of sites
-            return all(site in all_sites for site in choice)
+            # Handle list of sites; an empty selection is not a valid choice
+            return bool(choice) and all(site in all_sites for site in choice)
         elif isinstance(choice, str):
             # Handle single site or comma-separated string
             if ',' in choice:
@@ -50,7 +50,72 @@ class JobSearchService:
             sites = SettingsHelper.get_default_site_choices()
             
         start_time = time.perf_counter()
-        results = {
+        results = self._new_results(keyword, location, sites)
+        
+        # Create search tasks for each site
+        search_tasks = {}
+        for site in sites:
+            search_fn = self._get_site_search(site)
+            if search_fn:
+                search_tasks[site] = self.executor.submit(search_fn, keyword, location)
+        
+        # Collect results
+        for site, future in search_tasks.items():
+            try:
+                outcome = future.result()
+            except Exception as e:
+                outcome = e
+            self._record_site_result(results, site, outcome)
+        
+        return self._finish_results(results, start_time)
+    
+    async def search_all_sites_async(self, keyword: str, location: str = None, sites: List[str] = None) -> Dict[str, Any]:
+        """
+        Search for jobs across all specified sites without blocking the event loop.
+        
+        Site searches run concurrently on the service executor and are awaited
+        together with asyncio.gather.
+        
+        Args:
+            keyword (str): Search keyword
+            location (str): Location for search (optional)
+            sites (List[str]): List of site IDs to search (optional)
+            
+        Returns:
+            Dict[str, Any]: Search results with metadata (same shape as search_all_sites)
+        """
+        if sites is None:
+            sites = SettingsHelper.get_default_site_choices()
+        
+        loop = asyncio.get_running_loop()
+        start_time = time.perf_counter()
+        results = self._new_results(keyword, location, sites)
+        
+        searched_sites = []
+        pending = []
+        for site in sites:
+            search_fn = self._get_site_search(site)
+            if search_fn:
+                searched_sites.append(site)
+                pending.append(loop.run_in_executor(self.executor, search_fn, keyword, location))
+        
+        outcomes = await asyncio.gather(*pending, return_exceptions=True)
+        for site, outcome in zip(searched_sites, outcomes):
+            self._record_site_result(results, site, outcome)
+        
+        return self._finish_results(results, start_time)
+    
+    def _get_site_search(self, site: str):
+        """Return the search method for a site ID, or None if the site is unknown"""
+        if site == 'hh':
+            return self._search_hh
+        elif site == 'geekjob':
+            return self._search_geekjob
+        return None
+    
+    def _new_results(self, keyword: str, location: str, sites: List[str]) -> Dict[str, Any]:
+        """Create an empty search results structure"""
+        return {
             'keyword': keyword,
             'location': location,
             'sites': {},
@@ -65,23 +130,12 @@ class JobSearchService:
                 'global_time_ms': 0
             }
         }
-        
-        # Create search tasks for each site
-        search_tasks = {}
-        for site in sites:
-            if site == 'hh':
-                search_tasks[site] = self.executor.submit(
-                    self._search_hh, keyword, location
-                )
-            elif site == 'geekjob':
-                search_tasks[site] = self.executor.submit(
-                    self._search_geekjob, keyword, location
-                )
-        
-        # Collect results
-        for site, future in search_tasks.items():
+    
+    def _record_site_result(self, results: Dict[str, Any], site: str, outcome) -> None:
+        """Store one site's (jobs, timing) outcome, or the exception it raised, in results"""
+        if not isinstance(outcome, BaseException):
             try:
-                jobs, timing = future.result()
+                jobs, timing = outcome
                 site_config = get_site_config(site)
                 site_name = site_config.get('name', site.title())
                 
@@ -93,30 +147,33 @@ class JobSearchService:
                     'status': 'success'
                 }
                 results['total_jobs'] += len(jobs)
-                
+                return
             except Exception as e:
-                logger.error(f"Search failed for site {site}: {e}")
-                results['sites'][site] = {
-                    'name': site.title(),
-                    'jobs': [],
-                    'jobs_count': 0,
-                    'timing_ms': 0,
-                    'status': 'error',
-                    'error': str(e)
-                }
+                outcome = e
         
-        # Calculate global timing
+        logger.error(f"Search failed for site {site}: {outcome}")
+        results['sites'][site] = {
+            'name': site.title(),
+            'jobs': [],
+            'jobs_count': 0,
+            'timing_ms': 0,
+            'status': 'error',
+            'error': str(outcome)
+        }
+    
+    def _finish_results(self, results: Dict[str, Any], start_time: float) -> Dict[str, Any]:
+        """Fill in global timing and totals, log the search summary and return results"""
         global_time = time.perf_counter() - start_time
         results['global_time_ms'] = global_time * 1000
         results['metadata']['total_jobs'] = results['total_jobs']
         results['metadata']['global_time_ms'] = results['global_time_ms']
         
         logger.info(
-            f"Search completed for '{keyword}'",
+            f"Search completed for '{results['keyword']}'",
             extra={
-                'keyword': keyword,
-                'location': location,
-                'sites': sites,
+                'keyword': results['keyword'],
+                'location': results['location'],
+                'sites': results['metadata']['sites_requested'],
                 'total_jobs': results['total_jobs'],
                 'global_time_ms': results['global_time_ms']
             }
@@ -6,6 +6,7 @@ import logging
 import os
 import sys
 from datetime import datetime
+from itertools import islice
 from pathlib import Path
 from typing import Dict, Any, Optional
 
@@ -26,9 +27,20 @@ from utils.vacancy_formatter import VacancyTelegramFormatter
 # Define conversation states
 SELECT_SITE, ENTER_KEYWORD = range(2)
 
+# Separator lines under the results header and each site section
+SITE_HEADER_RULE = '=' * 40
+SITE_SECTION_RULE = '=' * 30
+# Sites searched when the user has not picked any; resolved once per process
+DEFAULT_SITES = SettingsHelper.get_default_site_choices()
+
+
+def _build_application(token):
+    """Build the python-telegram-bot Application for the given token"""
+    return Application.builder().token(token).build()
+
 
 class TelegramBot:
-    def __init__(self):
+    def __init__(self, application_factory=_build_application):
         load_dotenv()
         self.token = os.getenv('TELEGRAM_TOKEN')
         if not self.token:
@@ -47,8 +59,11 @@ class TelegramBot:
         self.location_service = HHLocationService()
         self.job_results_logger = JobResultsLogger()
         
-        # Use Application instead of Updater with better configuration
-        self.application = Application.builder().token(self.token).build()
+        # Site display names, filled lazily (each lookup reads locale files from disk)
+        self._site_display_names = {}
+        
+        # Use Application instead of Updater; tests inject a factory returning a fake app
+        self.application = application_factory(self.token)
         self.dp = self.application  # Application includes dispatcher-like functionality
         
         # Set up error handlers
@@ -128,7 +143,7 @@ class TelegramBot:
             self.logger.error("Please run 'python cleanup_bot.py' to clean up existing sessions")
             raise
 
-    def start(self, update, context):
+    async def start(self, update, context):
         try:
             keyboard = [
                 [SettingsHelper.get_site_name('hh'), SettingsHelper.get_site_name('geekjob')],
@@ -139,44 +154,45 @@ class TelegramBot:
                 one_time_keyboard=True,
                 resize_keyboard=True
             )
-            update.message.reply_text(
+            await update.message.reply_text(
                 "Welcome to Job Search Bot! Choose a site or 'all':",
                 reply_markup=reply_markup
             )
             return SELECT_SITE
         except Exception as e:
             self.logger.error(f"Error in start handler: {e}")
-            update.message.reply_text("An error occurred. Please try again.")
+            await update.message.reply_text("An error occurred. Please try again.")
             return ConversationHandler.END
 
-    def handle_search(self, update, context):
+    async def handle_search(self, update, context):
         try:
-            sites = context.user_data.get('sites', SettingsHelper.get_default_site_choices())
+            sites = context.user_data.get('sites', DEFAULT_SITES)
             keyword = update.message.text.strip()
             if not keyword:
-                update.message.reply_text("Please enter a keyword.")
+                await update.message.reply_text("Please enter a keyword.")
                 return ENTER_KEYWORD
 
-            update.message.reply_text("Searching for jobs...")
-            results = self.search_service.search_all_sites(keyword, None, sites)
+            await update.message.reply_text("Searching for jobs...")
+            # Site searches run concurrently on the service executor, off the event loop
+            results = await self.search_service.search_all_sites_async(keyword, None, sites)
             
             # Log job results (handle None results)
             user_id = str(update.effective_user.id) if update.effective_user else None
             self.job_results_logger.log_search_results(keyword, results, user_id, "telegram")
             
-            self._display_telegram_results(update, results)
+            await self._display_telegram_results(update, results)
             return ConversationHandler.END
         except Exception as e:
             self.logger.error(f"Error in search handler: {e}")
-            update.message.reply_text("An error occurred during search. Please try again.")
+            await update.message.reply_text("An error occurred during search. Please try again.")
             return ConversationHandler.END
 
-    def _display_telegram_results(self, update, results):
+    async def _display_telegram_results(self, update, results):
         """Display optimized job search results with enhanced formatting"""
         try:
             # Validate results
             if not results or not isinstance(results, dict):
-                update.message.reply_text("❌ No results found. Please try again.")
+                await update.message.reply_text("❌ No results found. Please try again.")
                 return
 
             # Check if any jobs were found
@@ -187,18 +203,18 @@ class TelegramBot:
             )
             
             if total_jobs == 0:
-                update.message.reply_text("❌ No results found. Please try again.")
+                await update.message.reply_text("❌ No results found. Please try again.")
                 return
 
             # Build optimized message
             messages = self._build_result_messages(results)
             
             # Send messages with proper chunking
-            self._send_messages_safely(update, messages)
+            await self._send_messages_safely(update, messages)
             
         except Exception as e:
             self.logger.error(f"Error displaying results: {e}", exc_info=True)
-            update.message.reply_text("❌ An error occurred while displaying results. Please try again.")
+            await update.message.reply_text("❌ An error occurred while displaying results. Please try again.")
 
     def _build_result_messages(self, results):
         """Build optimized result messages with better formatting"""
@@ -210,12 +226,16 @@ class TelegramBot:
         total_sites = len([site for site, result in results.items() 
                           if site != 'global_time' and isinstance(result, dict) and result.get('jobs')])
         
-        header = f"🔍 <b>Результаты поиска вакансий</b>\n"
-        header += f"⏱️ Общее время: {global_time:.0f}ms\n"
-        header += f"📊 Всего найдено: {total_jobs} вакансий\n"
-        header += f"🌐 Сайтов обработано: {total_sites}\n"
-        header += f"{'=' * 40}"
-        messages.append(header)
+        messages.append("".join((
+            "🔍 <b>Результаты поиска вакансий</b>\n",
+            f"⏱️ Общее время: {global_time:.0f}ms\n",
+            f"📊 Всего найдено: {total_jobs} вакансий\n",
+            f"🌐 Сайтов обработано: {total_sites}\n",
+            SITE_HEADER_RULE,
+        )))
+        
+        # Configurable limit of jobs shown per site (read once per results message)
+        jobs_per_site = get_job_limit('main_bot_messages', 10)
         
         # Process each site's results
         for site_name, result in results.items():
@@ -230,28 +250,32 @@ class TelegramBot:
             site_display_name = self._get_site_display_name(site_name)
             
             # Enhanced site header with statistics
-            site_message = f"\n🌐 <b>{site_display_name}</b>\n"
-            site_message += f"⏱️ Время поиска: {timing:.0f}ms\n"
-            site_message += f"📊 Найдено вакансий: {len(jobs)}\n"
-            site_message += f"{'=' * 30}"
+            parts = [
+                f"\n🌐 <b>{site_display_name}</b>\n",
+                f"⏱️ Время поиска: {timing:.0f}ms\n",
+                f"📊 Найдено вакансий: {len(jobs)}\n",
+                SITE_SECTION_RULE,
+            ]
             
-            # Add jobs with creative formatting (configurable limit)
-            jobs_per_site = get_job_limit('main_bot_messages', 10)
-            for i, job in enumerate(jobs[:jobs_per_site], 1):
-                # Use creative formatting for jobs
-                creative_job = self._format_job_for_telegram(job, site_name)
-                site_message += f"\n\n{creative_job}"
+            # Add jobs with creative formatting
+            for job in islice(jobs, jobs_per_site):
+                parts.append("\n\n")
+                parts.append(self._format_job_for_telegram(job, site_name))
             
             if len(jobs) > jobs_per_site:
-                site_message += f"\n\n... and {len(jobs) - jobs_per_site} more jobs"
+                parts.append(f"\n\n... and {len(jobs) - jobs_per_site} more jobs")
             
-            messages.append(site_message)
+            messages.append("".join(parts))
         
         return messages
 
     def _get_site_display_name(self, site_name):
-        """Get optimized site display name"""
-        return SettingsHelper.get_site_name(site_name)
+        """Get optimized site display name (resolved once per site)"""
+        display_name = self._site_display_names.get(site_name)
+        if display_name is None:
+            display_name = SettingsHelper.get_site_name(site_name)
+            self._site_display_names[site_name] = display_name
+        return display_name
 
     def _clean_job_text(self, job_text):
         """Clean job text by removing technical URLs"""
@@ -261,20 +285,20 @@ class TelegramBot:
             return job_text[:logo_start] + job_text[logo_end:]
         return job_text
 
-    def _send_messages_safely(self, update, messages):
+    async def _send_messages_safely(self, update, messages):
         """Send messages with proper chunking and error handling"""
         max_length = get_job_limit('max_message_length', 1000)
         
         for message in messages:
             try:
                 if len(message) <= max_length:
-                    update.message.reply_text(message, parse_mode='HTML')
+                    await update.message.reply_text(message, parse_mode='HTML')
                 else:
                     # Split long messages
                     chunks = self._split_message(message, max_length)
                     for chunk in chunks:
                         try:
-                            update.message.reply_text(chunk, parse_mode='HTML')
+                            await update.message.reply_text(chunk, parse_mode='HTML')
                         except Exception as e:
                             self.logger.error(f"Error sending message chunk: {e}")
                             # Continue with next chunk
@@ -315,22 +339,22 @@ class TelegramBot:
         
         return chunks
 
-    def handle_site_selection(self, update, context):
+    async def handle_site_selection(self, update, context):
         try:
             site = update.message.text.lower()
             if site == 'all':
                 context.user_data['sites'] = SettingsHelper.get_default_site_choices()
             else:
                 context.user_data['sites'] = [site]
-            update.message.reply_text("Please enter a job keyword to search.")
+            await update.message.reply_text("Please enter a job keyword to search.")
             return ENTER_KEYWORD
         except Exception as e:
             self.logger.error(f"Error in site selection: {e}")
-            update.message.reply_text("An error occurred. Please try again.")
+            await update.message.reply_text("An error occurred. Please try again.")
             return ConversationHandler.END
 
-    def cancel(self, update, context):
-        update.message.reply_text("Search cancelled. Use /start to begin again.")
+    async def cancel(self, update, context):
+        await update.message.reply_text("Search cancelled. Use /start to begin again.")
         return ConversationHandler.END
 
     def _format_job_for_telegram(self, job_data, site_name):
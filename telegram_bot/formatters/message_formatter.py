@@ -3,14 +3,369 @@ Formatter for Telegram messages.
 Handles the creation and formatting of Telegram message content.
 """
 
+import logging
 import re
+from functools import lru_cache, wraps
 from helpers import SettingsHelper, ConfigHelper, LocalizationHelper, LoggerHelper
+from helpers.config import get_global_config
 from helpers.constants import SALARY_ICON, LOCATION_ICON, COMPANY_ICON, JOB_ICON, WORK_FORMAT_ICON, SOURCE_ICON
 from utils.job_formatting import JobFormatting
 from utils.vacancy_formatter import VacancyTelegramFormatter
 
 logger = LoggerHelper.get_logger(__name__, prefix='message_formatter')
 
+# Literal markers that start trailing metadata in extracted salary/location text
+SALARY_META_MARKERS = ('Требования:', 'Обязанности:', 'Requirements:', 'Responsibilities:')
+LOCATION_META_MARKERS = ('Дата публикации:', 'Опыт работы:', 'Publication date:', 'Experience:')
+
+# Lowercase job-title and location words that mark extracted text as not a salary
+SALARY_REJECT_INDICATORS = (
+    'разработчик', 'developer', 'engineer', 'программист', 'analyst', 'manager',
+    'местоположение', 'location', 'москва', 'санкт-петербург', 'дубай',
+)
+
+# Constant line prefixes for the simple message layout
+LOCATION_PREFIX = LOCATION_ICON + ' '
+SALARY_PREFIX = SALARY_ICON + ' '
+
+# Job data keys that may hold a ready-made vacancy URL, in priority order
+URL_KEYS = ('url', 'alternate_url', 'link')
+
+# Precompiled patterns for _format_description_for_telegram
+_RE_UL_OPEN = re.compile(r'<ul[^>]*>')
+_RE_UL_CLOSE = re.compile(r'</ul>')
+_RE_LI_OPEN = re.compile(r'<li[^>]*>')
+_RE_LI_CLOSE = re.compile(r'</li>')
+_RE_UNSUPPORTED_TAG = re.compile(r'<(?!/?(?:strong|b|em|i|u|code|pre)\b)[^>]*>')
+_RE_MULTI_NL = re.compile(r'\n\s*\n')
+
+# GeekJob jobFormat flags and their display labels, in display order
+GEEKJOB_FORMAT_LABELS = (
+    ('remote', 'Remote'),
+    ('parttime', 'Part-time'),
+    ('relocate', 'Relocation'),
+    ('inhouse', 'Office'),
+)
+
+
+def _cut_at_markers(text, markers):
+    """Return text up to the earliest occurrence of any marker (plain str.find, no regex)"""
+    end = len(text)
+    for marker in markers:
+        pos = text.find(marker, 0, end)
+        if pos != -1:
+            end = pos
+    return text[:end]
+
+
+def _first_present(data, keys):
+    """Return the first truthy value among keys of a dict, or None"""
+    for key in keys:
+        value = data.get(key)
+        if value:
+            return value
+    return None
+
+
+def _requires_dict(default=None):
+    """Return default from a (self, data, site, ...) method when data is not a dict"""
+    def decorator(method):
+        @wraps(method)
+        def wrapper(self, data, site, *args, **kwargs):
+            if not isinstance(data, dict):
+                return default
+            return method(self, data, site, *args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def _leading_tag_name(tag):
+    """Return the leading run of word characters of a tag body (the tag name)"""
+    end = 0
+    length = len(tag)
+    while end < length and (tag[end].isalnum() or tag[end] == '_'):
+        end += 1
+    return tag[:end]
+
+
+@lru_cache(maxsize=8)
+def _fallback_title(language):
+    """Localized title used when a job has no title of its own (cached per language)"""
+    title = LocalizationHelper.get_translation('messages', 'vacancy_not_available', language)
+    if not title or title == 'vacancy_not_available':
+        return "Job Opening" if language == 'en' else "Вакансия"
+    return title
+
+
+@lru_cache(maxsize=16)
+def _job_url_template(site):
+    """Vacancy URL template for a site (config is read once per site)"""
+    return get_global_config().get_site_job_url_template(site)
+
+
+def _job_url(site, job_id):
+    """Build a vacancy URL for a job ID from the cached site template"""
+    template = _job_url_template(site)
+    return template.format(job_id=job_id) if template else ""
+
+
+class _SiteExtractor:
+    """Per-site field extraction from a job's source_data dict (nothing found by default)"""
+    
+    site = None
+    remote_display = None
+    
+    def is_remote(self, source_data):
+        return False
+    
+    def work_format(self, source_data):
+        return None
+    
+    def experience(self, source_data):
+        return None
+    
+    def employment(self, source_data):
+        return None
+    
+    def publication_date(self, source_data):
+        return None
+    
+    def role(self, source_data):
+        return None
+    
+    def schedule(self, source_data):
+        return None
+    
+    def description(self, source_data, format_description):
+        return None
+
+
+class _HHExtractor(_SiteExtractor):
+    """HeadHunter source_data extraction"""
+    
+    site = 'hh'
+    remote_display = 'Можно работать удалённо из РФ'
+    
+    def is_remote(self, source_data):
+        schedule = source_data.get('schedule')
+        if not schedule:
+            logger.debug("ℹ️ No schedule/jobFormat data in source_data for %s", self.site)
+            return False
+        logger.debug("⏰ Raw HH schedule data: %s", schedule)
+        if not isinstance(schedule, dict):
+            logger.debug("⏰ HH schedule data is not a dict: %s", type(schedule).__name__)
+            return False
+        schedule_name = schedule.get('name', '')
+        logger.debug("⏰ HH schedule name: %s", schedule_name)
+        name_lower = schedule_name.lower()
+        if 'удален' in name_lower or 'remote' in name_lower:
+            logger.debug("✅ HH remote work detected")
+            return True
+        logger.debug("ℹ️ HH not remote work: %s", schedule_name)
+        return False
+    
+    def work_format(self, source_data):
+        logger.debug("🏢 Processing HeadHunter work format")
+        schedule = source_data.get('schedule')
+        logger.debug("⏰ Schedule data: %s", schedule)
+        if schedule:
+            schedule_name = schedule.get('name', '')
+            logger.debug("✅ HH work format extracted: %s", schedule_name)
+            return schedule_name
+        logger.debug("❌ No schedule data found in HH source data")
+        return None
+    
+    def experience(self, source_data):
+        experience_data = source_data.get('experience')
+        if not experience_data:
+            return None
+        logger.debug("✅ Found HH experience data in source_data")
+        if isinstance(experience_data, dict):
+            experience_name = experience_data.get('name', '')
+            logger.debug("👨‍💼 HH experience level from dict: %s", experience_name)
+            return experience_name
+        experience_name = str(experience_data)
+        logger.debug("👨‍💼 HH experience level from string: %s", experience_name)
+        return experience_name
+    
+    def employment(self, source_data):
+        employment_data = source_data.get('employment')
+        if not employment_data:
+            return None
+        logger.debug("✅ Found HH employment data in source_data")
+        if isinstance(employment_data, dict):
+            employment_name = employment_data.get('name', '')
+            logger.debug("💼 HH employment type from dict: %s", employment_name)
+            return employment_name
+        employment_name = str(employment_data)
+        logger.debug("💼 HH employment type from string: %s", employment_name)
+        return employment_name
+    
+    def publication_date(self, source_data):
+        for field in ('published_at', 'created_at', 'publication_date'):
+            if source_data.get(field):
+                date_value = source_data[field]
+                logger.debug("📅 Found HH %s: %s", field, date_value)
+                # Extract date part from ISO format (YYYY-MM-DD)
+                if isinstance(date_value, str) and len(date_value) >= 10:
+                    date_part = date_value[:10]
+                    logger.debug("📅 Extracted HH date: %s", date_part)
+                    return date_part
+                return str(date_value)
+        return None
+    
+    def role(self, source_data):
+        # Available from HH's get_vacancy_by_id endpoint
+        professional_roles = source_data.get('professional_roles')
+        if professional_roles and isinstance(professional_roles, list):
+            # Get the first role name
+            role = professional_roles[0]
+            if isinstance(role, dict) and role.get('name'):
+                role_name = role['name']
+                logger.debug("👔 Professional role extracted: %s", role_name)
+                return role_name
+        return None
+    
+    def schedule(self, source_data):
+        # Available from HH's get_vacancy_by_id endpoint
+        schedule_parts = []
+        
+        # Working days (e.g., "Пн-Пт")
+        working_days = source_data.get('working_days')
+        if working_days and isinstance(working_days, list):
+            day = working_days[0]
+            if isinstance(day, dict) and day.get('name'):
+                schedule_parts.append(day['name'])
+        
+        # Working hours (e.g., "09:00-18:00")
+        working_time_intervals = source_data.get('working_time_intervals')
+        if working_time_intervals and isinstance(working_time_intervals, list):
+            interval = working_time_intervals[0]
+            if isinstance(interval, dict) and interval.get('name'):
+                schedule_parts.append(interval['name'])
+        
+        if schedule_parts:
+            schedule_text = ", ".join(schedule_parts)
+            logger.debug("⏰ Working schedule extracted: %s", schedule_text)
+            return schedule_text
+        return None
+    
+    def description(self, source_data, format_description):
+        # First try to get full description from detailed vacancy data (get_vacancy_by_id)
+        if source_data.get('description'):
+            description = source_data['description']
+            if isinstance(description, str) and description and not description.isspace():
+                # Format for telegram with HTML support, preserve full content (NO LENGTH LIMITS)
+                clean_description = format_description(description)
+                if clean_description and not clean_description.isspace():
+                    logger.debug("📋 Full job description extracted: %s chars (NO TRUNCATION)", len(clean_description))
+                    logger.debug("📋 Job description preview: %.200s...", clean_description)
+                    return clean_description
+        
+        # Fallback to snippet data if full description not available
+        if source_data.get('snippet'):
+            snippet = source_data['snippet']
+            if isinstance(snippet, dict):
+                # Try snippet.description first, then snippet.requirement
+                snippet_content = None
+                if snippet.get('description'):
+                    snippet_content = snippet['description']
+                    logger.debug("📋 Using snippet.description for fallback")
+                elif snippet.get('requirement'):
+                    snippet_content = snippet['requirement']
+                    logger.debug("📋 Using snippet.requirement for fallback")
+                
+                if snippet_content:
+                    # Format for telegram with HTML support, same as full description (NO LENGTH LIMITS)
+                    clean_content = format_description(snippet_content)
+                    if clean_content and not clean_content.isspace():
+                        logger.debug("📋 Snippet content extracted: %s chars (NO TRUNCATION)", len(clean_content))
+                        logger.debug("📋 Snippet content preview: %.200s...", clean_content)
+                        return clean_content
+        return None
+
+
+class _GeekJobExtractor(_SiteExtractor):
+    """GeekJob source_data extraction (no experience, role or schedule fields)"""
+    
+    site = 'geekjob'
+    remote_display = 'Можно работать удалённо'
+    
+    def is_remote(self, source_data):
+        job_format = source_data.get('jobFormat')
+        if not job_format:
+            logger.debug("ℹ️ No schedule/jobFormat data in source_data for %s", self.site)
+            return False
+        logger.debug("🎯 Raw GeekJob jobFormat data: %s", job_format)
+        if isinstance(job_format, dict) and job_format.get('remote'):
+            logger.debug("✅ GeekJob remote work detected")
+            return True
+        logger.debug("ℹ️ GeekJob not remote work")
+        return False
+    
+    def work_format(self, source_data):
+        logger.debug("🏢 Processing GeekJob work format")
+        job_format = source_data.get('jobFormat')
+        logger.debug("⏰ Job format data: %s", job_format)
+        if job_format:
+            format_parts = [label for key, label in GEEKJOB_FORMAT_LABELS if job_format.get(key)]
+            final_format = ", ".join(format_parts) if format_parts else "Office"
+            logger.debug("✅ GeekJob work format extracted: %s", final_format)
+            return final_format
+        logger.debug("❌ No job format data found in GeekJob source data")
+        return None
+    
+    def experience(self, source_data):
+        logger.debug("ℹ️ GeekJob typically doesn't provide experience level data")
+        return None
+    
+    def employment(self, source_data):
+        job_format = source_data.get('jobFormat')
+        if job_format and isinstance(job_format, dict):
+            logger.debug("✅ Found GeekJob jobFormat data")
+            if job_format.get('parttime'):
+                logger.debug("💼 GeekJob part-time detected")
+                return "Частичная занятость"
+            logger.debug("💼 GeekJob full-time (default)")
+            return "Полная занятость"
+        return None
+    
+    def publication_date(self, source_data):
+        log_data = source_data.get('log')
+        if isinstance(log_data, dict) and log_data.get('modify'):
+            date_value = log_data['modify']
+            logger.debug("📅 Found GeekJob log.modify: %s", date_value)
+            # GeekJob uses Russian format like "28 июля", returned as-is
+            return str(date_value)
+        return None
+    
+    def description(self, source_data, format_description):
+        # Try description first, then requirements
+        geekjob_content = None
+        if source_data.get('description'):
+            geekjob_content = source_data['description']
+            logger.debug("📋 Using GeekJob description field")
+        elif source_data.get('requirements'):
+            geekjob_content = source_data['requirements']
+            logger.debug("📋 Using GeekJob requirements field")
+        
+        if geekjob_content and isinstance(geekjob_content, str) and not geekjob_content.isspace():
+            # Format for telegram with HTML support, same as HH (NO LENGTH LIMITS)
+            clean_content = format_description(geekjob_content)
+            if clean_content and not clean_content.isspace():
+                logger.debug("📋 GeekJob content extracted: %s chars (NO TRUNCATION)", len(clean_content))
+                logger.debug("📋 GeekJob content preview: %.200s...", clean_content)
+                return clean_content
+        return None
+
+
+# Site extractors resolved with one dict lookup instead of per-method site == ... ladders
+_EXTRACTORS = {
+    'hh': _HHExtractor(),
+    'geekjob': _GeekJobExtractor(),
+}
+
+
 class MessageFormatter:
     """
     Formatter for detailed Telegram messages.
@@ -119,6 +474,7 @@ class MessageFormatter:
     Key features:
     - Formats detailed job messages using VacancyTelegramFormatter
     - Provides fallback simple formatting when detailed formatting fails
+    - Batch formats a whole result page with the simple layout (format_many)
     - Handles HTML cleaning and sanitization for Telegram compatibility
     - Extracts and formats job details (title, company, location, salary, work format)
     - Supports multiple job sites (HH, GeekJob)
@@ -127,58 +483,77 @@ class MessageFormatter:
     
     def __init__(self):
         self.config_helper = ConfigHelper()
-        logger.info(f"🚀 MessageFormatter initialized")
-        logger.info(f"📋 Available methods: {[method for method in dir(self) if not method.startswith('_')]}")
+        logger.debug("🚀 MessageFormatter initialized")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("📋 Available methods: %s", [method for method in dir(self) if not method.startswith('_')])
     
     def format_telegram_message(self, job_data, site, language):
         """Format a detailed job message for Telegram with clean structured layout"""
-        logger.info(f"🚀 Starting detailed telegram message formatting for site: {site}, language: {language}")
-        logger.info(f"🔍 Job data type: {type(job_data).__name__}")
+        logger.debug("🚀 Starting detailed telegram message formatting for site: %s, language: %s", site, language)
+        logger.debug("🔍 Job data type: %s", type(job_data).__name__)
         
-        if isinstance(job_data, dict):
-            logger.info(f"📋 Job data keys: {list(job_data.keys())}")
-            job_id = job_data.get('id', 'unknown')
-            logger.info(f"🆔 Job ID: {job_id}")
+        if isinstance(job_data, dict) and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("📋 Job data keys: %s", list(job_data.keys()))
+            logger.debug("🆔 Job ID: %s", job_data.get('id', 'unknown'))
             
             if 'source_data' in job_data:
                 source_keys = list(job_data['source_data'].keys()) if isinstance(job_data['source_data'], dict) else 'N/A'
-                logger.info(f"📋 Source data keys: {source_keys}")
+                logger.debug("📋 Source data keys: %s", source_keys)
         
         # Try new clean formatting first
         try:
             clean_message = self._create_clean_telegram_message(job_data, site, language)
             if clean_message:
-                logger.info(f"✅ Using new clean formatter")
-                logger.info(f"📝 Clean message preview: {clean_message[:300]}...")
+                logger.debug("✅ Using new clean formatter")
+                logger.debug("📝 Clean message preview: %.300s...", clean_message)
                 return clean_message
         except Exception as e:
             logger.warning(f"❌ Clean formatting failed: {e}")
         
         # Fallback to VacancyTelegramFormatter
         try:
-            logger.info(f"🔧 Attempting to use VacancyTelegramFormatter for detailed formatting")
+            logger.debug("🔧 Attempting to use VacancyTelegramFormatter for detailed formatting")
             # Format the vacancy data using VacancyTelegramFormatter
             formatted_vacancy = VacancyTelegramFormatter.format_detailed_vacancy(job_data, site)
-            logger.info(f"✅ VacancyTelegramFormatter.format_detailed_vacancy completed successfully")
+            logger.debug("✅ VacancyTelegramFormatter.format_detailed_vacancy completed successfully")
             
             final_message = VacancyTelegramFormatter.create_telegram_message(formatted_vacancy)
-            logger.info(f"✅ VacancyTelegramFormatter.create_telegram_message completed successfully")
-            logger.info(f"📄 Final detailed message created (length: {len(final_message) if final_message else 0}):")
-            logger.info(f"   {final_message[:500] if final_message else 'None'}...")
+            logger.debug("✅ VacancyTelegramFormatter.create_telegram_message completed successfully")
+            logger.debug("📄 Final detailed message created (length: %s):", len(final_message) if final_message else 0)
+            logger.debug("   %.500s...", final_message or 'None')
             
             return final_message
         except Exception as e:
             logger.warning(f"❌ Failed to use VacancyTelegramFormatter for job {job_data.get('id', 'unknown')}: {e}")
-            logger.info(f"🔄 Falling back to simple formatting")
+            logger.debug("🔄 Falling back to simple formatting")
             # Fallback to simple formatting if VacancyTelegramFormatter fails
             fallback_message = self._format_simple_telegram_message(job_data, site, language)
-            logger.info(f"📄 Fallback message created (length: {len(fallback_message) if fallback_message else 0}):")
-            logger.info(f"   {fallback_message[:500] if fallback_message else 'None'}...")
+            logger.debug("📄 Fallback message created (length: %s):", len(fallback_message) if fallback_message else 0)
+            logger.debug("   %.500s...", fallback_message or 'None')
             return fallback_message
     
+    def format_many(self, jobs, site, language):
+        """
+        Format a whole page of jobs with the simple message layout.
+        
+        Per-language data (the localized fallback title) is resolved once for
+        the batch instead of once per job.
+        
+        Args:
+            jobs: Iterable of job data dicts from the search service
+            site: Site name ('hh' or 'geekjob')
+            language: Language code for localization
+            
+        Returns:
+            List of formatted message strings, one per job
+        """
+        fallback_title = _fallback_title(language)
+        logger.debug("📦 Batch formatting jobs for site: %s, language: %s", site, language)
+        return [self._format_one(job_data, site, fallback_title) for job_data in jobs]
+    
     def _create_clean_telegram_message(self, job_data, site, language):
         """Create a clean, structured Telegram message in the desired format"""
-        logger.info(f"🎨 Creating clean telegram message for site: {site}")
+        logger.debug("🎨 Creating clean telegram message for site: %s", site)
         
         # Extract job data
         source_data = job_data.get('source_data') if isinstance(job_data, dict) else job_data
@@ -290,7 +665,7 @@ class MessageFormatter:
         
         # Final validation to ensure no malformed HTML
         if self._validate_html_tags(final_message):
-            logger.info(f"✅ Clean message created with {len(message_parts)} parts - HTML validation passed")
+            logger.debug("✅ Clean message created with %s parts - HTML validation passed", len(message_parts))
             return final_message
         else:
             logger.warning(f"⚠️ HTML validation failed for final message, creating safe fallback")
@@ -305,14 +680,14 @@ class MessageFormatter:
                 safe_parts.extend(message_parts[1:])
             
             safe_message = "\n".join(safe_parts)
-            logger.info(f"✅ Safe fallback message created")
+            logger.debug("✅ Safe fallback message created")
             return safe_message
     
     def _extract_clean_job_title(self, raw_text, source_data, site):
         """Extract clean job title with clickable link"""
-        logger.info(f"🔍 Extracting clean job title for site: {site}")
-        logger.info(f"📝 Raw text preview: {raw_text[:100] if raw_text else 'None'}...")
-        logger.info(f"📋 Source data type: {type(source_data).__name__}")
+        logger.debug("🔍 Extracting clean job title for site: %s", site)
+        logger.debug("📝 Raw text preview: %.100s...", raw_text or 'None')
+        logger.debug("📋 Source data type: %s", type(source_data).__name__)
         
         # Extract title from raw text or source data
         title = None
@@ -323,8 +698,8 @@ class MessageFormatter:
             if site == 'hh' and source_data.get('name'):
                 title = source_data['name']
                 job_url = source_data.get('alternate_url', '')
-                logger.info(f"✅ HH title extracted from source data: {title}")
-                logger.info(f"🔗 HH job URL from source data: {job_url}")
+                logger.debug("✅ HH title extracted from source data: %s", title)
+                logger.debug("🔗 HH job URL from source data: %s", job_url)
             
             # GeekJob format uses 'position' field
             elif site == 'geekjob' and source_data.get('position'):
@@ -332,41 +707,40 @@ class MessageFormatter:
                 job_id = source_data.get('id', '')
                 if job_id:
                     job_url = f"https://geekjob.ru/vacancy/{job_id}"
-                logger.info(f"✅ GeekJob title extracted from source data: {title}")
-                logger.info(f"🔗 GeekJob job URL constructed: {job_url}")
+                logger.debug("✅ GeekJob title extracted from source data: %s", title)
+                logger.debug("🔗 GeekJob job URL constructed: %s", job_url)
             
             # Fallback - try both fields
             elif source_data.get('name'):
                 title = source_data['name']
                 job_url = source_data.get('alternate_url', '')
-                logger.info(f"✅ Title extracted from 'name' field: {title}")
-                logger.info(f"🔗 Job URL from source data: {job_url}")
+                logger.debug("✅ Title extracted from 'name' field: %s", title)
+                logger.debug("🔗 Job URL from source data: %s", job_url)
             elif source_data.get('position'):
                 title = source_data['position']
-                logger.info(f"✅ Title extracted from 'position' field: {title}")
+                logger.debug("✅ Title extracted from 'position' field: %s", title)
         
         if not title:
             # Extract from raw text
-            logger.info(f"🔄 Extracting title from raw text")
+            logger.debug("🔄 Extracting title from raw text")
             raw_title = JobFormatting.extract_job_title(raw_text)
-            logger.info(f"📝 Raw title extracted from text: {raw_title}")
+            logger.debug("📝 Raw title extracted from text: %s", raw_title)
             
             # Clean any existing HTML tags from the title to prevent malformed HTML
             title = JobFormatting.clean_all_html_tags(raw_title) if raw_title else ''
-            logger.info(f"🧹 Cleaned title (HTML removed): {title}")
+            logger.debug("🧹 Cleaned title (HTML removed): %s", title)
             
             # Try to extract URL from raw text
-            import re
             url_match = re.search(r'href="([^"]+)"', raw_text)
             job_url = url_match.group(1) if url_match else ''
-            logger.info(f"🔗 Job URL extracted from raw text: {job_url}")
+            logger.debug("🔗 Job URL extracted from raw text: %s", job_url)
         
         if not title:
             logger.warning(f"❌ No job title found")
             return None
         
         # Add work format to title if available
-        logger.info(f"🔍 Checking for work format to add to title")
+        logger.debug("🔍 Checking for work format to add to title")
         work_format = self._extract_work_format_for_title(source_data, site)
         if work_format:
             # Reserve space for work format when truncating
@@ -377,28 +751,28 @@ class MessageFormatter:
             # Truncate title first, then add work format
             truncated_title = self._truncate_text_with_ellipsis(title, max_title_length)
             title_with_format = f"{truncated_title} {work_format_tag}"
-            logger.info(f"✅ Title with work format (reserved {reserved_space} chars): {title_with_format}")
+            logger.debug("✅ Title with work format (reserved %s chars): %s", reserved_space, title_with_format)
         else:
             # No work format, use full configured max length for title
             title_with_format = self._truncate_text_with_ellipsis(title, self.config_helper.get_max_title_length())
-            logger.info(f"ℹ️ Title without work format: {title_with_format}")
+            logger.debug("ℹ️ Title without work format: %s", title_with_format)
         
         # Create clickable link
         if job_url:
             # Ensure title_with_format doesn't contain any HTML tags to prevent nesting
             clean_title = JobFormatting.clean_all_html_tags(title_with_format)
             final_title = f'<a href="{job_url}">{clean_title}</a>'
-            logger.info(f"🔗 Created clickable title with URL: {final_title[:100]}...")
+            logger.debug("🔗 Created clickable title with URL: %.100s...", final_title)
             
             # Validate the HTML is well-formed
             if self._validate_html_tags(final_title):
-                logger.info(f"✅ HTML validation passed for job title")
+                logger.debug("✅ HTML validation passed for job title")
             else:
                 logger.warning(f"⚠️ HTML validation failed, using clean title without link")
                 final_title = clean_title
         else:
             final_title = title_with_format
-            logger.info(f"ℹ️ Created title without URL: {final_title}")
+            logger.debug("ℹ️ Created title without URL: %s", final_title)
         
         return final_title
     
@@ -413,13 +787,13 @@ class MessageFormatter:
         
         # Truncate and add ellipsis
         truncated = text[:max_length-3].strip() + "..."
-        logger.info(f"✂️ Text truncated from {len(text)} to {len(truncated)} chars: '{text[:20]}...' -> '{truncated}'")
+        logger.debug("✂️ Text truncated from %s to %s chars: '%.20s...' -> '%s'", len(text), len(truncated), text, truncated)
         return truncated
     
     def _extract_clean_company_info(self, raw_text, source_data, site):
         """Extract clean company info with clickable link"""
-        logger.info(f"🏢 Extracting clean company info for site: {site}")
-        logger.info(f"📋 Source data type: {type(source_data).__name__}")
+        logger.debug("🏢 Extracting clean company info for site: %s", site)
+        logger.debug("📋 Source data type: %s", type(source_data).__name__)
         
         # Extract company from source data
         company_name = ''
@@ -428,31 +802,31 @@ class MessageFormatter:
         if isinstance(source_data, dict):
             # HH format uses 'employer' field
             if site == 'hh' and source_data.get('employer'):
-                logger.info(f"✅ Found HH employer data in source_data")
+                logger.debug("✅ Found HH employer data in source_data")
                 employer = source_data['employer']
                 if isinstance(employer, dict):
                     company_name = employer.get('name', '')
                     company_url = employer.get('alternate_url', '')
-                    logger.info(f"🏢 HH company name from employer dict: {company_name}")
-                    logger.info(f"🔗 HH company URL from employer dict: {company_url}")
+                    logger.debug("🏢 HH company name from employer dict: %s", company_name)
+                    logger.debug("🔗 HH company URL from employer dict: %s", company_url)
                 else:
                     company_name = str(employer)
-                    logger.info(f"🏢 HH company name from employer string: {company_name}")
+                    logger.debug("🏢 HH company name from employer string: %s", company_name)
             
             # GeekJob format uses 'company' field
             elif site == 'geekjob' and source_data.get('company'):
-                logger.info(f"✅ Found GeekJob company data in source_data")
+                logger.debug("✅ Found GeekJob company data in source_data")
                 company = source_data['company']
                 if isinstance(company, dict):
                     company_name = company.get('name', '')
                     company_id = company.get('id', '')
                     if company_id:
                         company_url = f"https://geekjob.ru/company/{company_id}"
-                    logger.info(f"🏢 GeekJob company name from company dict: {company_name}")
-                    logger.info(f"🔗 GeekJob company URL constructed: {company_url}")
+                    logger.debug("🏢 GeekJob company name from company dict: %s", company_name)
+                    logger.debug("🔗 GeekJob company URL constructed: %s", company_url)
                 else:
                     company_name = str(company)
-                    logger.info(f"🏢 GeekJob company name from company string: {company_name}")
+                    logger.debug("🏢 GeekJob company name from company string: %s", company_name)
             
             # Fallback - try both field names
             elif source_data.get('employer'):
@@ -462,24 +836,24 @@ class MessageFormatter:
                     company_url = employer.get('alternate_url', '')
                 else:
                     company_name = str(employer)
-                logger.info(f"🏢 Fallback company name from employer: {company_name}")
+                logger.debug("🏢 Fallback company name from employer: %s", company_name)
             elif source_data.get('company'):
                 company = source_data['company']
                 if isinstance(company, dict):
                     company_name = company.get('name', '')
                 else:
                     company_name = str(company)
-                logger.info(f"🏢 Fallback company name from company: {company_name}")
+                logger.debug("🏢 Fallback company name from company: %s", company_name)
         
         if not company_name:
             # Extract from raw text
-            logger.info(f"🔄 Extracting company info from raw text")
+            logger.debug("🔄 Extracting company info from raw text")
             raw_company_name = JobFormatting.extract_company_info(raw_text)
             # Clean any existing HTML tags from company name to prevent malformed HTML
             company_name = JobFormatting.clean_all_html_tags(raw_company_name) if raw_company_name else ''
             company_url = ''
-            logger.info(f"🏢 Raw company name extracted: {raw_company_name}")
-            logger.info(f"🧹 Cleaned company name (HTML removed): {company_name}")
+            logger.debug("🏢 Raw company name extracted: %s", raw_company_name)
+            logger.debug("🧹 Cleaned company name (HTML removed): %s", company_name)
         
         if not company_name:
             logger.warning(f"❌ No company name found")
@@ -493,31 +867,31 @@ class MessageFormatter:
             # Ensure company_name doesn't contain any HTML tags to prevent nesting
             clean_company = JobFormatting.clean_all_html_tags(company_name)
             final_company = f'<a href="{company_url}">@{clean_company}</a>'
-            logger.info(f"🔗 Created clickable company with URL: {final_company}")
+            logger.debug("🔗 Created clickable company with URL: %s", final_company)
             
             # Validate the HTML is well-formed
             if self._validate_html_tags(final_company):
-                logger.info(f"✅ HTML validation passed for company")
+                logger.debug("✅ HTML validation passed for company")
             else:
                 logger.warning(f"⚠️ HTML validation failed, using clean company without link")
                 final_company = f"@{clean_company}"
         else:
             clean_company = JobFormatting.clean_all_html_tags(company_name)
             final_company = f"@{clean_company}"
-            logger.info(f"ℹ️ Created company without URL: {final_company}")
+            logger.debug("ℹ️ Created company without URL: %s", final_company)
         
         return final_company
     
     def _extract_clean_salary_info(self, raw_text, source_data, site):
         """Extract clean salary without metadata"""
-        logger.info(f"💰 Extracting clean salary info for site: {site}")
-        logger.info(f"📋 Source data type: {type(source_data).__name__}")
+        logger.debug("💰 Extracting clean salary info for site: %s", site)
+        logger.debug("📋 Source data type: %s", type(source_data).__name__)
         
         # Extract from source data first
         if isinstance(source_data, dict) and source_data.get('salary'):
-            logger.info(f"✅ Found salary data in source_data")
+            logger.debug("✅ Found salary data in source_data")
             salary_data = source_data['salary']
-            logger.info(f"💰 Raw salary data: {salary_data}")
+            logger.debug("💰 Raw salary data: %s", salary_data)
             
             if isinstance(salary_data, dict):
                 salary_from = salary_data.get('from')
@@ -525,21 +899,21 @@ class MessageFormatter:
                 currency = salary_data.get('currency', 'RUR')
                 gross = salary_data.get('gross', True)
                 
-                logger.info(f"💰 Salary components - From: {salary_from}, To: {salary_to}, Currency: {currency}, Gross: {gross}")
+                logger.debug("💰 Salary components - From: %s, To: %s, Currency: %s, Gross: %s", salary_from, salary_to, currency, gross)
                 
                 # Format salary
                 if salary_from and salary_to:
                     salary_text = f"{salary_from:,} —‍ {salary_to:,}"
-                    logger.info(f"✅ Salary range: {salary_text}")
+                    logger.debug("✅ Salary range: %s", salary_text)
                 elif salary_from:
                     salary_text = f"от {salary_from:,}"
-                    logger.info(f"✅ Salary from: {salary_text}")
+                    logger.debug("✅ Salary from: %s", salary_text)
                 elif salary_to:
                     salary_text = f"до {salary_to:,}"
-                    logger.info(f"✅ Salary to: {salary_text}")
+                    logger.debug("✅ Salary to: %s", salary_text)
                 else:
                     salary_text = None
-                    logger.info(f"ℹ️ No salary amounts found")
+                    logger.debug("ℹ️ No salary amounts found")
                 
                 if salary_text:
                     # Add currency
@@ -556,28 +930,28 @@ class MessageFormatter:
                     else:
                         salary_text += "/мес"
                     
-                    logger.info(f"💰 Final formatted salary: {salary_text}")
+                    logger.debug("💰 Final formatted salary: %s", salary_text)
                     return salary_text
                 else:
                     logger.warning(f"❌ Failed to format salary from data")
             else:
-                logger.info(f"💰 Salary data is not a dict: {type(salary_data).__name__}")
+                logger.debug("💰 Salary data is not a dict: %s", type(salary_data).__name__)
         else:
-            logger.info(f"ℹ️ No salary data in source_data")
+            logger.debug("ℹ️ No salary data in source_data")
         
         # Fallback to text extraction with cleaning
-        logger.info(f"🔄 Falling back to text extraction")
+        logger.debug("🔄 Falling back to text extraction")
         salary_raw = JobFormatting.extract_salary_info(raw_text)
-        logger.info(f"💰 Raw salary from text: {salary_raw}")
+        logger.debug("💰 Raw salary from text: %s", salary_raw)
         
         if salary_raw and self._is_valid_salary_text(salary_raw):
             # Clean salary from extra metadata
             cleaned_salary = self._clean_salary_display(salary_raw)
-            logger.info(f"💰 Cleaned salary: {cleaned_salary}")
+            logger.debug("💰 Cleaned salary: %s", cleaned_salary)
             return cleaned_salary
         else:
             if salary_raw:
-                logger.warning(f"❌ Extracted text doesn't look like valid salary info: {salary_raw[:100]}...")
+                logger.warning("❌ Extracted text doesn't look like valid salary info: %.100s...", salary_raw)
             else:
                 logger.warning(f"❌ No salary information found in text")
         
@@ -586,196 +960,126 @@ class MessageFormatter:
     
     def _extract_clean_location_info(self, raw_text, source_data, site):
         """Extract clean location info"""
-        logger.info(f"📍 Extracting clean location info for site: {site}")
-        logger.info(f"📋 Source data type: {type(source_data).__name__}")
+        logger.debug("📍 Extracting clean location info for site: %s", site)
+        logger.debug("📋 Source data type: %s", type(source_data).__name__)
         
         # Extract from source data first
         if isinstance(source_data, dict) and source_data.get('area'):
-            logger.info(f"✅ Found area data in source_data")
+            logger.debug("✅ Found area data in source_data")
             area = source_data['area']
-            logger.info(f"📍 Raw area data: {area}")
+            logger.debug("📍 Raw area data: %s", area)
             
             if isinstance(area, dict):
                 location = area.get('name', '')
-                logger.info(f"📍 Location name from area: {location}")
+                logger.debug("📍 Location name from area: %s", location)
                 if location:
-                    logger.info(f"✅ Location extracted from source data: {location}")
+                    logger.debug("✅ Location extracted from source data: %s", location)
                     return location
                 else:
                     logger.warning(f"❌ No location name in area data")
             else:
-                logger.info(f"📍 Area data is not a dict: {type(area).__name__}")
+                logger.debug("📍 Area data is not a dict: %s", type(area).__name__)
         else:
-            logger.info(f"ℹ️ No area data in source_data")
+            logger.debug("ℹ️ No area data in source_data")
         
         # Fallback to text extraction
-        logger.info(f"🔄 Falling back to text extraction")
+        logger.debug("🔄 Falling back to text extraction")
         location_raw = JobFormatting.extract_location_info(raw_text)
-        logger.info(f"📍 Raw location from text: {location_raw}")
+        logger.debug("📍 Raw location from text: %s", location_raw)
         
         if location_raw:
             # Clean location from metadata
             cleaned_location = self._clean_location_display(location_raw)
-            logger.info(f"📍 Cleaned location: {cleaned_location}")
+            logger.debug("📍 Cleaned location: %s", cleaned_location)
             return cleaned_location
         
         logger.warning(f"❌ No location information found")
         return None
     
-    def _extract_clean_work_format(self, source_data, site):
-        """Extract work format info for display"""
-        logger.info(f"👩‍💻 Extracting clean work format for site: {site}")
-        logger.info(f"📋 Source data type: {type(source_data).__name__}")
+    @_requires_dict()
+    def _extract_remote(self, source_data, site, label=None):
+        """
+        Return a remote-work label when the job allows remote work
         
-        if isinstance(source_data, dict):
-            # HH format - check schedule field
-            if site == 'hh' and source_data.get('schedule'):
-                logger.info(f"✅ Found HH schedule data in source_data")
-                schedule = source_data['schedule']
-                logger.info(f"⏰ Raw HH schedule data: {schedule}")
-                
-                if isinstance(schedule, dict):
-                    schedule_name = schedule.get('name', '')
-                    logger.info(f"⏰ HH schedule name: {schedule_name}")
-                    
-                    if 'удален' in schedule_name.lower() or 'remote' in schedule_name.lower():
-                        work_format = 'Можно работать удалённо из РФ'
-                        logger.info(f"✅ HH remote work detected: {work_format}")
-                        return work_format
-                    else:
-                        logger.info(f"ℹ️ HH not remote work: {schedule_name}")
-                else:
-                    logger.info(f"⏰ HH schedule data is not a dict: {type(schedule).__name__}")
+        Args:
+            source_data: Raw job data from the site API
+            site: Site name ('hh' or 'geekjob')
+            label: Label to return, defaults to the site's own display text
             
-            # GeekJob format - check jobFormat field
-            elif site == 'geekjob' and source_data.get('jobFormat'):
-                logger.info(f"✅ Found GeekJob jobFormat data in source_data")
-                job_format = source_data['jobFormat']
-                logger.info(f"🎯 Raw GeekJob jobFormat data: {job_format}")
-                
-                if isinstance(job_format, dict) and job_format.get('remote'):
-                    work_format = 'Можно работать удалённо'
-                    logger.info(f"✅ GeekJob remote work detected: {work_format}")
-                    return work_format
-                else:
-                    logger.info(f"ℹ️ GeekJob not remote work")
-            else:
-                logger.info(f"ℹ️ No schedule/jobFormat data in source_data for {site}")
+        Returns:
+            The label if remote work is detected, otherwise None
+        """
+        logger.debug("👩‍💻 Extracting remote work format for site: %s", site)
+        
+        extractor = _EXTRACTORS.get(site)
+        if extractor and extractor.is_remote(source_data):
+            work_format = label or extractor.remote_display
+            logger.debug("✅ Remote work detected: %s", work_format)
+            return work_format
         
-        logger.info(f"ℹ️ No remote work format found")
+        logger.debug("ℹ️ No remote work format found")
         return None
     
+    def _extract_clean_work_format(self, source_data, site):
+        """Extract work format info for display"""
+        return self._extract_remote(source_data, site)
+    
     def _extract_work_format_for_title(self, source_data, site):
         """Extract work format for title display"""
-        logger.info(f"🏷️ Extracting work format for title for site: {site}")
-        logger.info(f"📋 Source data type: {type(source_data).__name__}")
-        
-        if isinstance(source_data, dict):
-            # HH format - check schedule field
-            if site == 'hh' and source_data.get('schedule'):
-                logger.info(f"✅ Found HH schedule data in source_data")
-                schedule = source_data['schedule']
-                logger.info(f"⏰ Raw HH schedule data: {schedule}")
-                
-                if isinstance(schedule, dict):
-                    schedule_name = schedule.get('name', '')
-                    logger.info(f"⏰ HH schedule name: {schedule_name}")
-                    
-                    if 'удален' in schedule_name.lower() or 'remote' in schedule_name.lower():
-                        work_format = 'Remote'
-                        logger.info(f"✅ HH remote work detected for title: {work_format}")
-                        return work_format
-                    else:
-                        logger.info(f"ℹ️ HH not remote work for title: {schedule_name}")
-                else:
-                    logger.info(f"⏰ HH schedule data is not a dict: {type(schedule).__name__}")
-            
-            # GeekJob format - check jobFormat field
-            elif site == 'geekjob' and source_data.get('jobFormat'):
-                logger.info(f"✅ Found GeekJob jobFormat data in source_data")
-                job_format = source_data['jobFormat']
-                logger.info(f"🎯 Raw GeekJob jobFormat data: {job_format}")
-                
-                if isinstance(job_format, dict) and job_format.get('remote'):
-                    work_format = 'Remote'
-                    logger.info(f"✅ GeekJob remote work detected for title: {work_format}")
-                    return work_format
-                else:
-                    logger.info(f"ℹ️ GeekJob not remote work for title")
-            else:
-                logger.info(f"ℹ️ No schedule/jobFormat data in source_data for {site}")
-        
-        logger.info(f"ℹ️ No work format for title found")
-        return None
+        return self._extract_remote(source_data, site, 'Remote')
     
     def _clean_salary_display(self, salary_text):
         """Clean salary text to remove extra metadata"""
-        logger.info(f"🧹 Cleaning salary display text")
-        logger.info(f"📝 Original salary text: {salary_text[:100] if salary_text else 'None'}...")
+        logger.debug("🧹 Cleaning salary display text")
+        logger.debug("📝 Original salary text: %.100s...", salary_text or 'None')
         
         if not salary_text:
-            logger.info(f"ℹ️ No salary text to clean")
+            logger.debug("ℹ️ No salary text to clean")
             return None
         
-        # Remove common metadata patterns
-        import re
-        
         # Remove everything after "Требования:" or "Обязанности:"
-        cleaned = re.split(r'(?:Требования|Обязанности|Requirements|Responsibilities):', salary_text)[0]
-        logger.info(f"🧹 After removing requirements/obligations: {cleaned[:100]}...")
-        
-        # Remove HTML tags
-        cleaned = JobFormatting.clean_all_html_tags(cleaned)
-        logger.info(f"🧹 After removing HTML tags: {cleaned[:100]}...")
+        cleaned = _cut_at_markers(salary_text, SALARY_META_MARKERS)
+        logger.debug("🧹 After removing requirements/obligations: %.100s...", cleaned)
         
-        # Clean up extra whitespace
-        cleaned = ' '.join(cleaned.split())
-        logger.info(f"🧹 After cleaning whitespace: {cleaned[:100]}...")
-        
-        final_cleaned = cleaned.strip()
-        logger.info(f"✅ Final cleaned salary: {final_cleaned}")
+        # Remove HTML tags (this also collapses and trims whitespace)
+        final_cleaned = JobFormatting.clean_all_html_tags(cleaned)
+        logger.debug("✅ Final cleaned salary: %s", final_cleaned)
         
         return final_cleaned
     
     def _clean_location_display(self, location_text):
         """Clean location text to remove extra metadata"""
-        logger.info(f"🧹 Cleaning location display text")
-        logger.info(f"📝 Original location text: {location_text[:100] if location_text else 'None'}...")
+        logger.debug("🧹 Cleaning location display text")
+        logger.debug("📝 Original location text: %.100s...", location_text or 'None')
         
         if not location_text:
-            logger.info(f"ℹ️ No location text to clean")
+            logger.debug("ℹ️ No location text to clean")
             return None
         
-        # Remove common metadata patterns
-        import re
-        
         # Remove everything after metadata indicators
-        cleaned = re.split(r'(?:Дата публикации|Опыт работы|Publication date|Experience):', location_text)[0]
-        logger.info(f"🧹 After removing metadata indicators: {cleaned[:100]}...")
+        cleaned = _cut_at_markers(location_text, LOCATION_META_MARKERS)
+        logger.debug("🧹 After removing metadata indicators: %.100s...", cleaned)
         
-        # Remove HTML tags
-        cleaned = JobFormatting.clean_all_html_tags(cleaned)
-        logger.info(f"🧹 After removing HTML tags: {cleaned[:100]}...")
-        
-        # Clean up extra whitespace
-        cleaned = ' '.join(cleaned.split())
-        logger.info(f"🧹 After cleaning whitespace: {cleaned[:100]}...")
-        
-        final_cleaned = cleaned.strip()
-        logger.info(f"✅ Final cleaned location: {final_cleaned}")
+        # Remove HTML tags (this also collapses and trims whitespace)
+        final_cleaned = JobFormatting.clean_all_html_tags(cleaned)
+        logger.debug("✅ Final cleaned location: %s", final_cleaned)
         
         return final_cleaned
     
     def _format_simple_telegram_message(self, job_data, site, language):
         """Fallback simple formatter for Telegram messages"""
-        logger.info(f"🚀 Starting simple telegram message formatting (fallback) for site: {site}, language: {language}")
-        logger.info(f"🔍 Job data type: {type(job_data).__name__}")
+        logger.debug("🚀 Starting simple telegram message formatting (fallback) for site: %s, language: %s", site, language)
+        return self._format_one(job_data, site, _fallback_title(language))
+    
+    def _format_one(self, job_data, site, fallback_title):
+        """Build the simple message for one job using an already resolved fallback title"""
+        logger.debug("🔍 Job data type: %s", type(job_data).__name__)
         
         job_text = job_data.get('raw', str(job_data))
-        logger.info(f"📝 Raw job text preview: {job_text[:200] if job_text else 'None'}...")
+        logger.debug("📝 Raw job text preview: %.200s...", job_text or 'None')
         
         clean_job_text = self._clean_job_text_for_display(job_text)
-        logger.info(f"🧹 Cleaned job text preview: {clean_job_text[:200] if clean_job_text else 'None'}...")
+        logger.debug("🧹 Cleaned job text preview: %.200s...", clean_job_text or 'None')
         
         job_title = JobFormatting.extract_job_title(clean_job_text)
         company_info = JobFormatting.extract_company_info(clean_job_text)
@@ -783,293 +1087,228 @@ class MessageFormatter:
         salary_info = JobFormatting.extract_salary_info(clean_job_text)
         
         # Log extracted information
-        logger.info(f"📝 Extracted job information (simple fallback):")
-        logger.info(f"   Job title: {job_title}")
-        logger.info(f"   Company info: {company_info}")
-        logger.info(f"   Location info: {location_info}")
-        logger.info(f"   Salary info: {salary_info}")
+        logger.debug("📝 Extracted job information (simple fallback):")
+        logger.debug("   Job title: %s", job_title)
+        logger.debug("   Company info: %s", company_info)
+        logger.debug("   Location info: %s", location_info)
+        logger.debug("   Salary info: %s", salary_info)
         
         work_format = self._extract_job_work_format(job_data, site)
-        logger.info(f"⏰ Work format extracted: {work_format}")
+        logger.debug("⏰ Work format extracted: %s", work_format)
         
         # Use job title without work format
         job_title_with_format = job_title
 
         job_link = self._extract_job_link(job_data, site)
-        logger.info(f"🔗 Job link extracted: {job_link}")
-        
-        # Get localized fallback title
-        from helpers.localization import LocalizationHelper
-        fallback_title = LocalizationHelper().get_translation('messages', 'vacancy_not_available', language)
-        if not fallback_title or fallback_title == 'vacancy_not_available':
-            fallback_title = "Job Opening" if language == 'en' else "Вакансия"
+        logger.debug("🔗 Job link extracted: %s", job_link)
         
         clean_job_title = JobFormatting.clean_all_html_tags(job_title_with_format) if job_title_with_format else fallback_title
-        logger.info(f"🧹 Cleaned job title: {clean_job_title}")
+        logger.debug("🧹 Cleaned job title: %s", clean_job_title)
         
         message_lines = []
-        message_lines.append(f"<b>{clean_job_title}</b>")
-        logger.info(f"📝 Job title line added: <b>{clean_job_title}</b>")
+        message_lines.append("<b>" + clean_job_title + "</b>")
+        logger.debug("📝 Job title line added: <b>%s</b>", clean_job_title)
             
         if company_info:
             clean_company_info = JobFormatting.clean_all_html_tags(company_info)
-            message_lines.append(f"@{clean_company_info}")
-            logger.info(f"🏢 Company line added: @{clean_company_info}")
+            message_lines.append("@" + clean_company_info)
+            logger.debug("🏢 Company line added: @%s", clean_company_info)
         if location_info:
             clean_location = JobFormatting.clean_all_html_tags(location_info)
-            message_lines.append(f"{LOCATION_ICON} {clean_location}")
-            logger.info(f"📍 Location line added: {LOCATION_ICON} {clean_location}")
+            message_lines.append(LOCATION_PREFIX + clean_location)
+            logger.debug("📍 Location line added: %s %s", LOCATION_ICON, clean_location)
         if salary_info:
             clean_salary = JobFormatting.clean_all_html_tags(salary_info)
-            message_lines.append(f"{SALARY_ICON} {clean_salary}")
-            logger.info(f"💰 Salary line added: {SALARY_ICON} {clean_salary}")
+            message_lines.append(SALARY_PREFIX + clean_salary)
+            logger.debug("💰 Salary line added: %s %s", SALARY_ICON, clean_salary)
 
         final_message = "\n".join(message_lines)
-        logger.info(f"📄 Final simple fallback message created:")
-        logger.info(f"   {final_message}")
+        logger.debug("📄 Final simple fallback message created:")
+        logger.debug("   %s", final_message)
         
         return final_message
     
+    @_requires_dict("")
     def _extract_job_work_format(self, job_data, site):
         """Extract work format information for inline display"""
-        logger.info(f"🔍 Extracting work format for site: {site}")
+        logger.debug("🔍 Extracting work format for site: %s", site)
         
-        if not job_data or not isinstance(job_data, dict):
-            logger.info(f"❌ Job data is not a dict: {type(job_data)}")
-            return ""
-            
-        source_data = job_data.get('source_data', {})
+        source_data = job_data.get('source_data')
         if not source_data or not isinstance(source_data, dict):
-            logger.info(f"❌ Source data is not a dict: {type(source_data)}")
+            logger.debug("❌ Source data is not a dict: %s", type(source_data))
             return ""
         
-        logger.info(f"📋 Source data keys: {list(source_data.keys())}")
-            
-        if site == 'hh':
-            logger.info(f"🏢 Processing HeadHunter work format")
-            schedule = source_data.get('schedule', {})
-            logger.info(f"⏰ Schedule data: {schedule}")
-            if schedule:
-                schedule_name = schedule.get('name', '')
-                logger.info(f"✅ HH work format extracted: {schedule_name}")
-                return schedule_name
-            else:
-                logger.info(f"❌ No schedule data found in HH source data")
-        elif site == 'geekjob':
-            logger.info(f"🏢 Processing GeekJob work format")
-            job_format = source_data.get('jobFormat', {})
-            logger.info(f"⏰ Job format data: {job_format}")
-            if job_format:
-                format_parts = []
-                if job_format.get('remote'):
-                    format_parts.append('Remote')
-                if job_format.get('parttime'):
-                    format_parts.append('Part-time')
-                if job_format.get('relocate'):
-                    format_parts.append('Relocation')
-                if job_format.get('inhouse'):
-                    format_parts.append('Office')
-                
-                final_format = ", ".join(format_parts) if format_parts else "Office"
-                logger.info(f"✅ GeekJob work format extracted: {final_format}")
-                return final_format
-            else:
-                logger.info(f"❌ No job format data found in GeekJob source data")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("📋 Source data keys: %s", list(source_data.keys()))
+        
+        extractor = _EXTRACTORS.get(site)
+        if extractor is None:
+            logger.debug("❌ Unknown site: %s", site)
         else:
-            logger.info(f"❌ Unknown site: {site}")
+            work_format = extractor.work_format(source_data)
+            if work_format is not None:
+                return work_format
         
-        logger.info(f"❌ No work format could be extracted")
+        logger.debug("❌ No work format could be extracted")
         return ""
     
     def _clean_job_text_for_display(self, job_text):
         """Clean job text for inline queries without truncating titles"""
-        logger.info(f"🧹 Starting job text cleaning for display")
-        logger.info(f"📝 Original text length: {len(job_text) if job_text else 0}")
-        logger.info(f"📝 Original text preview: {job_text[:200] if job_text else 'None'}...")
+        logger.debug("🧹 Starting job text cleaning for display")
+        logger.debug("📝 Original text length: %s", len(job_text) if job_text else 0)
+        logger.debug("📝 Original text preview: %.200s...", job_text or 'None')
         
         if not job_text:
-            logger.info(f"❌ No job text provided")
+            logger.debug("❌ No job text provided")
             return ""
         
-        # Remove logo URL if present
-        if '[LOGO_URL:' in job_text:
-            logo_start = job_text.find('[LOGO_URL:')
-            logo_end = job_text.find(']', logo_start) + 1
-            job_text = job_text[:logo_start] + job_text[logo_end:]
-            logger.info(f"🖼️ Logo URL removed from text")
-        
-        # Clean unsupported HTML tags that Telegram doesn't support
-        job_text = JobFormatting.clean_unsupported_html_tags(job_text)
-        logger.info(f"🧹 Unsupported HTML tags cleaned")
-        
-        # Additional safety: remove any remaining HTML tags completely
-        job_text = re.sub(r'<[^>]+>', '', job_text)
-        logger.info(f"🧹 All remaining HTML tags removed")
+        # Remove logo URL markers if present (one find per marker, resumed after the cut)
+        logo_start = job_text.find('[LOGO_URL:')
+        while logo_start != -1:
+            logo_end = job_text.find(']', logo_start)
+            if logo_end == -1:
+                break
+            job_text = job_text[:logo_start] + job_text[logo_end + 1:]
+            logger.debug("🖼️ Logo URL removed from text")
+            logo_start = job_text.find('[LOGO_URL:', logo_start)
+        
+        # Plain snippets carry no markup, so both tag passes can be skipped
+        if '<' in job_text:
+            # Clean unsupported HTML tags that Telegram doesn't support
+            job_text = JobFormatting.clean_unsupported_html_tags(job_text)
+            logger.debug("🧹 Unsupported HTML tags cleaned")
+            
+            # Additional safety: remove any remaining HTML tags completely
+            job_text = JobFormatting.strip_html_tags(job_text)
+            logger.debug("🧹 All remaining HTML tags removed")
         
         # Clean up extra newlines and spaces
-        job_text = job_text.replace('\n\n', '\n').strip()
-        logger.info(f"🧹 Extra newlines and spaces cleaned")
+        if '\n\n' in job_text:
+            job_text = job_text.replace('\n\n', '\n')
+        job_text = job_text.strip()
+        logger.debug("🧹 Extra newlines and spaces cleaned")
         
-        logger.info(f"✅ Text cleaning completed. Final length: {len(job_text) if job_text else 0}")
-        logger.info(f"✅ Final cleaned text preview: {job_text[:200] if job_text else 'None'}...")
+        logger.debug("✅ Text cleaning completed. Final length: %s", len(job_text) if job_text else 0)
+        logger.debug("✅ Final cleaned text preview: %.200s...", job_text or 'None')
         
         return job_text
     
     def _extract_job_link(self, job_data, site):
         """Extract job link from job data using configuration."""
-        logger.info(f"🔗 Starting job link extraction for site: {site}")
-        logger.info(f"🔍 Job data type: {type(job_data).__name__}")
-        
         if not job_data or not isinstance(job_data, dict):
-            logger.info(f"❌ Job data is not a dict: {type(job_data)}")
+            logger.debug("❌ Job data is not a dict: %s", type(job_data))
             return None
         
-        # First try to get direct URL from job data
-        direct_url = job_data.get('url') or job_data.get('alternate_url') or job_data.get('link')
+        # First try a direct URL from job data, then from source_data (raw API data)
+        direct_url = _first_present(job_data, URL_KEYS)
         if direct_url:
-            logger.info(f"✅ Direct URL found in job data: {direct_url}")
             return direct_url
-        else:
-            logger.info(f"❌ No direct URL found in job data")
-        
-        # Try to get link from source_data (raw API data)
-        source_data = job_data.get('source_data', {})
-        if source_data and isinstance(source_data, dict):
-            logger.info(f"📋 Source data available, checking for URLs")
-            # Check for direct URL in source data
-            direct_url = source_data.get('url') or source_data.get('alternate_url') or source_data.get('link')
+        
+        source_data = job_data.get('source_data')
+        if isinstance(source_data, dict):
+            direct_url = _first_present(source_data, URL_KEYS)
             if direct_url:
-                logger.info(f"✅ Direct URL found in source data: {direct_url}")
                 return direct_url
-            else:
-                logger.info(f"❌ No direct URL found in source data")
             
-            # Try to construct URL using job ID from source data
+            # Construct URL using job ID from source data
             job_id = source_data.get('id')
             if job_id:
-                logger.info(f"🆔 Job ID found in source data: {job_id}")
-                constructed_url = ConfigHelper.get_site_job_url(site, job_id)
-                logger.info(f"🔗 Constructed URL from source data ID: {constructed_url}")
-                return constructed_url
-            else:
-                logger.info(f"❌ No job ID found in source data")
-        else:
-            logger.info(f"❌ No source data available")
+                return _job_url(site, job_id)
         
         # Fallback to constructing URL using job ID from main data
         job_id = job_data.get('id')
         if job_id:
-            logger.info(f"🆔 Job ID found in main data: {job_id}")
-            constructed_url = ConfigHelper.get_site_job_url(site, job_id)
-            logger.info(f"🔗 Constructed URL from main data ID: {constructed_url}")
-            return constructed_url
-        else:
-            logger.info(f"❌ No job ID found in main data")
+            return _job_url(site, job_id)
         
-        logger.info(f"❌ No job link could be extracted")
+        logger.debug("❌ No job link could be extracted for site: %s", site)
         return None
     
     def _validate_html_tags(self, html_text):
         """Validate that HTML tags are properly formed and not nested incorrectly"""
-        import re
-        
         if not html_text:
             return True
         
-        # Check for basic HTML tag structure issues
-        # Look for malformed href attributes (duplicate href within single <a> tag)
-        # Multiple <a> tags with separate href attributes are valid
-        single_tag_pattern = r'<a[^>]*>'
-        a_tags = re.findall(single_tag_pattern, html_text)
-        for a_tag in a_tags:
-            if a_tag.count('href="') > 1:
-                logger.warning(f"⚠️ Multiple href attributes in single <a> tag: {a_tag}")
-                return False
-        
-        # Check for unclosed tags
-        open_tags = re.findall(r'<(\w+)[^>]*>', html_text)
-        close_tags = re.findall(r'</(\w+)>', html_text)
-        
-        if len(open_tags) != len(close_tags):
-            logger.warning(f"⚠️ Mismatched HTML tags - Open: {open_tags}, Close: {close_tags}")
-            return False
+        # Single pass over the tags:
+        # - an <a> tag must not carry more than one href attribute
+        #   (multiple <a> tags with separate href attributes are valid)
+        # - an <a> tag must not be opened inside another <a> (like <a><a>content</a></a>)
+        # - every opening tag needs a closing tag
+        open_count = 0
+        close_count = 0
+        a_depth = 0
+        open_resume = 0  # opening tags never overlap, a closing tag may sit inside one
+        tag_end = -1
+        tag_start = html_text.find('<')
+        while tag_start != -1:
+            if tag_end < tag_start:
+                tag_end = html_text.find('>', tag_start + 1)
+                if tag_end == -1:
+                    break
+            tag = html_text[tag_start + 1:tag_end]
+            
+            if tag.startswith('/'):
+                name = _leading_tag_name(tag[1:])
+                if name and len(name) == len(tag) - 1:
+                    close_count += 1
+                    if name == 'a' and a_depth:
+                        a_depth -= 1
+            elif tag_start >= open_resume:
+                name = _leading_tag_name(tag)
+                if name:
+                    open_count += 1
+                    open_resume = tag_end + 1
+                    if name == 'a':
+                        if tag.count('href="') > 1:
+                            logger.warning(f"⚠️ Multiple href attributes in single <a> tag: <{tag}>")
+                            return False
+                        if a_depth:
+                            logger.warning("⚠️ Nested <a> tags detected in: %.100s...", html_text)
+                            return False
+                        a_depth += 1
+            
+            tag_start = html_text.find('<', tag_start + 1)
         
-        # Check for actually nested identical tags (like <a><a>content</a></a>)
-        # This regex checks for an opening <a> tag that contains another opening <a> tag before its closing tag
-        if re.search(r'<a[^>]*>[^<]*<a[^>]*>', html_text):
-            logger.warning(f"⚠️ Nested <a> tags detected in: {html_text[:100]}...")
+        if open_count != close_count:
+            logger.warning(f"⚠️ Mismatched HTML tags - Open: {open_count}, Close: {close_count}")
             return False
         
         return True
     
+    @_requires_dict()
     def _extract_experience_level(self, source_data, site):
         """Extract experience level information"""
-        logger.info(f"👨‍💼 Extracting experience level for site: {site}")
-        logger.info(f"📋 Source data type: {type(source_data).__name__}")
+        logger.debug("👨‍💼 Extracting experience level for site: %s", site)
         
-        if isinstance(source_data, dict):
-            # HH format
-            if site == 'hh' and source_data.get('experience'):
-                logger.info(f"✅ Found HH experience data in source_data")
-                experience_data = source_data['experience']
-                if isinstance(experience_data, dict):
-                    experience_name = experience_data.get('name', '')
-                    logger.info(f"👨‍💼 HH experience level from dict: {experience_name}")
-                    return experience_name
-                else:
-                    experience_name = str(experience_data)
-                    logger.info(f"👨‍💼 HH experience level from string: {experience_name}")
-                    return experience_name
-            
-            # GeekJob format - doesn't typically have experience level
-            elif site == 'geekjob':
-                logger.info(f"ℹ️ GeekJob typically doesn't provide experience level data")
-                return None
+        extractor = _EXTRACTORS.get(site)
+        if extractor:
+            experience = extractor.experience(source_data)
+            if experience is not None:
+                return experience
         
-        logger.info(f"❌ No experience level found")
+        logger.debug("❌ No experience level found")
         return None
     
+    @_requires_dict()
     def _extract_employment_type(self, source_data, site):
         """Extract employment type information"""
-        logger.info(f"💼 Extracting employment type for site: {site}")
-        logger.info(f"📋 Source data type: {type(source_data).__name__}")
+        logger.debug("💼 Extracting employment type for site: %s", site)
         
-        if isinstance(source_data, dict):
-            # HH format
-            if site == 'hh' and source_data.get('employment'):
-                logger.info(f"✅ Found HH employment data in source_data")
-                employment_data = source_data['employment']
-                if isinstance(employment_data, dict):
-                    employment_name = employment_data.get('name', '')
-                    logger.info(f"💼 HH employment type from dict: {employment_name}")
-                    return employment_name
-                else:
-                    employment_name = str(employment_data)
-                    logger.info(f"💼 HH employment type from string: {employment_name}")
-                    return employment_name
-            
-            # GeekJob format - check jobFormat
-            elif site == 'geekjob' and source_data.get('jobFormat'):
-                logger.info(f"✅ Found GeekJob jobFormat data")
-                job_format = source_data['jobFormat']
-                if isinstance(job_format, dict):
-                    if job_format.get('parttime'):
-                        logger.info(f"💼 GeekJob part-time detected")
-                        return "Частичная занятость"
-                    else:
-                        logger.info(f"💼 GeekJob full-time (default)")
-                        return "Полная занятость"
+        extractor = _EXTRACTORS.get(site)
+        if extractor:
+            employment = extractor.employment(source_data)
+            if employment is not None:
+                return employment
         
-        logger.info(f"❌ No employment type found")
+        logger.debug("❌ No employment type found")
         return None
     
+    @_requires_dict()
     def _extract_key_skills(self, source_data, site, max_skills=3):
         """Extract key skills information"""
-        logger.info(f"🔧 Extracting key skills for site: {site}")
-        logger.info(f"📋 Source data type: {type(source_data).__name__}")
+        logger.debug("🔧 Extracting key skills for site: %s", site)
         
-        if isinstance(source_data, dict) and source_data.get('key_skills'):
-            logger.info(f"✅ Found key_skills data in source_data")
+        if source_data.get('key_skills'):
+            logger.debug("✅ Found key_skills data in source_data")
             skills_data = source_data['key_skills']
             if isinstance(skills_data, list):
                 skill_names = []
@@ -1081,96 +1320,55 @@ class MessageFormatter:
                 
                 if skill_names:
                     skills_text = ", ".join(skill_names)
-                    logger.info(f"🔧 Key skills extracted: {skills_text}")
+                    logger.debug("🔧 Key skills extracted: %s", skills_text)
                     return skills_text
         
-        logger.info(f"❌ No key skills found")
+        logger.debug("❌ No key skills found")
         return None
     
+    @_requires_dict()
     def _extract_publication_date(self, source_data, site):
         """Extract publication date information"""
-        logger.info(f"📅 Extracting publication date for site: {site}")
-        logger.info(f"📋 Source data type: {type(source_data).__name__}")
+        logger.debug("📅 Extracting publication date for site: %s", site)
         
-        if isinstance(source_data, dict):
-            # HH format - ISO date
-            if site == 'hh':
-                date_fields = ['published_at', 'created_at', 'publication_date']
-                for field in date_fields:
-                    if source_data.get(field):
-                        date_value = source_data[field]
-                        logger.info(f"📅 Found HH {field}: {date_value}")
-                        # Basic date formatting - could be enhanced
-                        if isinstance(date_value, str) and len(date_value) >= 10:
-                            # Extract date part from ISO format (YYYY-MM-DD)
-                            date_part = date_value[:10]
-                            logger.info(f"📅 Extracted HH date: {date_part}")
-                            return date_part
-                        return str(date_value)
-            
-            # GeekJob format - log.modify field
-            elif site == 'geekjob':
-                log_data = source_data.get('log', {})
-                if isinstance(log_data, dict) and log_data.get('modify'):
-                    date_value = log_data['modify']
-                    logger.info(f"📅 Found GeekJob log.modify: {date_value}")
-                    # GeekJob uses Russian format like "28 июля"
-                    # For now, just return as-is, could be enhanced with date parsing
-                    return str(date_value)
-        
-        logger.info(f"❌ No publication date found")
+        extractor = _EXTRACTORS.get(site)
+        if extractor:
+            publication_date = extractor.publication_date(source_data)
+            if publication_date is not None:
+                return publication_date
+        
+        logger.debug("❌ No publication date found")
         return None
     
+    @_requires_dict()
     def _extract_professional_role(self, source_data, site):
         """Extract professional role/category information (HH detailed info)"""
-        logger.info(f"👔 Extracting professional role for site: {site}")
-        logger.info(f"📋 Source data type: {type(source_data).__name__}")
-        
-        if isinstance(source_data, dict) and site == 'hh':
-            # Available from HH's get_vacancy_by_id endpoint
-            professional_roles = source_data.get('professional_roles', [])
-            if professional_roles and isinstance(professional_roles, list):
-                # Get the first role name
-                role = professional_roles[0]
-                if isinstance(role, dict) and role.get('name'):
-                    role_name = role['name']
-                    logger.info(f"👔 Professional role extracted: {role_name}")
-                    return role_name
-        
-        logger.info(f"❌ No professional role found")
+        logger.debug("👔 Extracting professional role for site: %s", site)
+        
+        extractor = _EXTRACTORS.get(site)
+        if extractor:
+            role = extractor.role(source_data)
+            if role is not None:
+                return role
+        
+        logger.debug("❌ No professional role found")
         return None
     
+    @_requires_dict()
     def _extract_working_schedule(self, source_data, site):
         """Extract working schedule information (HH detailed info)"""
-        logger.info(f"⏰ Extracting working schedule for site: {site}")
-        logger.info(f"📋 Source data type: {type(source_data).__name__}")
+        logger.debug("⏰ Extracting working schedule for site: %s", site)
         
-        if isinstance(source_data, dict) and site == 'hh':
-            # Available from HH's get_vacancy_by_id endpoint
-            schedule_parts = []
-            
-            # Working days (e.g., "Пн-Пт")
-            working_days = source_data.get('working_days', [])
-            if working_days and isinstance(working_days, list):
-                day = working_days[0]
-                if isinstance(day, dict) and day.get('name'):
-                    schedule_parts.append(day['name'])
-            
-            # Working hours (e.g., "09:00-18:00")
-            working_time_intervals = source_data.get('working_time_intervals', [])
-            if working_time_intervals and isinstance(working_time_intervals, list):
-                interval = working_time_intervals[0]
-                if isinstance(interval, dict) and interval.get('name'):
-                    schedule_parts.append(interval['name'])
-            
-            if schedule_parts:
-                schedule_text = ", ".join(schedule_parts)
-                logger.info(f"⏰ Working schedule extracted: {schedule_text}")
-                return schedule_text
+        extractor = _EXTRACTORS.get(site)
+        if extractor:
+            schedule = extractor.schedule(source_data)
+            if schedule is not None:
+                return schedule
         
-        logger.info(f"❌ No working schedule found")
+        logger.debug("❌ No working schedule found")
         return None
     
+    @_requires_dict()
     def _extract_job_description(self, source_data, site):
         """
         Extract full job description information (comprehensive, no length limits)
@@ -1186,65 +1384,17 @@ class MessageFormatter:
         
         All content formatted with Telegram HTML support, no truncation.
         """
-        logger.info(f"📋 Extracting job description for site: {site}")
-        logger.info(f"📋 Source data type: {type(source_data).__name__}")
+        logger.debug("📋 Extracting job description for site: %s", site)
 
-        if isinstance(source_data, dict):
-            logger.info(f"📋 Source data keys: {source_data.keys()}")
-            # HH format - prioritize description from detailed API, fallback to snippet.requirement
-            if site == 'hh':
-                # First try to get full description from detailed vacancy data (get_vacancy_by_id)
-                if source_data.get('description'):
-                    description = source_data['description']
-                    if isinstance(description, str) and len(description.strip()) > 0:
-                        # Format for telegram with HTML support, preserve full content (NO LENGTH LIMITS)
-                        clean_description = self._format_description_for_telegram(description)
-                        if clean_description and len(clean_description.strip()) > 0:
-                            logger.info(f"📋 Full job description extracted: {len(clean_description)} chars (NO TRUNCATION)")
-                            logger.info(f"📋 Job description preview: {clean_description[:200]}...")
-                            return clean_description
-                
-                # Fallback to snippet data if full description not available
-                if source_data.get('snippet'):
-                    snippet = source_data['snippet']
-                    if isinstance(snippet, dict):
-                        # Try snippet.description first, then snippet.requirement
-                        snippet_content = None
-                        if snippet.get('description'):
-                            snippet_content = snippet['description']
-                            logger.info(f"📋 Using snippet.description for fallback")
-                        elif snippet.get('requirement'):
-                            snippet_content = snippet['requirement']
-                            logger.info(f"📋 Using snippet.requirement for fallback")
-                        
-                        if snippet_content:
-                            # Format for telegram with HTML support, same as full description (NO LENGTH LIMITS)
-                            clean_content = self._format_description_for_telegram(snippet_content)
-                            if clean_content and len(clean_content.strip()) > 0:
-                                logger.info(f"📋 Snippet content extracted: {len(clean_content)} chars (NO TRUNCATION)")
-                                logger.info(f"📋 Snippet content preview: {clean_content[:200]}...")
-                                return clean_content
-            
-            # GeekJob format - check description and requirements fields
-            elif site == 'geekjob':
-                # Try description first, then requirements
-                geekjob_content = None
-                if source_data.get('description'):
-                    geekjob_content = source_data['description']
-                    logger.info(f"📋 Using GeekJob description field")
-                elif source_data.get('requirements'):
-                    geekjob_content = source_data['requirements']
-                    logger.info(f"📋 Using GeekJob requirements field")
-                
-                if geekjob_content and isinstance(geekjob_content, str) and len(geekjob_content.strip()) > 0:
-                    # Format for telegram with HTML support, same as HH (NO LENGTH LIMITS)
-                    clean_content = self._format_description_for_telegram(geekjob_content)
-                    if clean_content and len(clean_content.strip()) > 0:
-                        logger.info(f"📋 GeekJob content extracted: {len(clean_content)} chars (NO TRUNCATION)")
-                        logger.info(f"📋 GeekJob content preview: {clean_content[:200]}...")
-                        return clean_content
-        
-        logger.info(f"❌ No job description found")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("📋 Source data keys: %s", list(source_data.keys()))
+        extractor = _EXTRACTORS.get(site)
+        if extractor:
+            description = extractor.description(source_data, self._format_description_for_telegram)
+            if description is not None:
+                return description
+        
+        logger.debug("❌ No job description found")
         return None
     
     def _format_description_for_telegram(self, html_description):
@@ -1256,21 +1406,29 @@ class MessageFormatter:
         # Convert common HTML to Telegram-supported format
         description = html_description
         
-        # Replace <ul> and <li> with simple formatting
-        import re
-        description = re.sub(r'<ul[^>]*>', '', description)
-        description = re.sub(r'</ul>', '\n', description)
-        description = re.sub(r'<li[^>]*>', '• ', description)  
-        description = re.sub(r'</li>', '\n', description)
-        
-        # Keep supported HTML tags: <strong>, <b>, <em>, <i>
-        # Remove unsupported tags but keep content
-        description = re.sub(r'<(?!/?(?:strong|b|em|i|u|code|pre)\b)[^>]*>', '', description)
+        # Plain-text descriptions (common for GeekJob) skip all tag passes
+        if '<' in description:
+            # Replace <ul> and <li> with simple formatting (only passes that can match run)
+            if '<ul' in description:
+                description = _RE_UL_OPEN.sub('', description)
+            if '</ul>' in description:
+                description = _RE_UL_CLOSE.sub('\n', description)
+            if '<li' in description:
+                description = _RE_LI_OPEN.sub('• ', description)
+            if '</li>' in description:
+                description = _RE_LI_CLOSE.sub('\n', description)
+            
+            # Keep supported HTML tags: <strong>, <b>, <em>, <i>
+            # Remove unsupported tags but keep content (list-only markup has none left)
+            if '<' in description:
+                description = _RE_UNSUPPORTED_TAG.sub('', description)
         
         # Clean up extra whitespace and newlines
-        description = re.sub(r'\n\s*\n', '\n\n', description)  # Multiple newlines to double
-        description = re.sub(r'^\s+|\s+$', '', description)     # Trim start/end
-        description = re.sub(r' +', ' ', description)           # Multiple spaces to single
+        if description.count('\n') > 1:
+            description = _RE_MULTI_NL.sub('\n\n', description)  # Multiple newlines to double
+        description = description.strip()  # Trim start/end
+        while '  ' in description:
+            description = description.replace('  ', ' ')  # Multiple spaces to single
         
         return description
     
@@ -1281,33 +1439,30 @@ class MessageFormatter:
     
     def _is_valid_salary_text(self, salary_text):
         """Check if extracted text looks like valid salary information"""
-        if not salary_text or len(salary_text.strip()) == 0:
+        if not salary_text or salary_text.isspace():
             return False
         
         # If text is too long, it's probably not just salary info
         if len(salary_text) > 200:
-            logger.info(f"📏 Salary text too long ({len(salary_text)} chars), probably not just salary")
+            logger.debug("📏 Salary text too long (%s chars), probably not just salary", len(salary_text))
             return False
         
         # If it contains HTML tags, it's malformed
         if '<' in salary_text and '>' in salary_text:
-            logger.info(f"🏷️ Salary text contains HTML tags, rejecting")
+            logger.debug("🏷️ Salary text contains HTML tags, rejecting")
             return False
         
         # If it contains href attributes, it's malformed
         if 'href=' in salary_text:
-            logger.info(f"🔗 Salary text contains href attributes, rejecting")
+            logger.debug("🔗 Salary text contains href attributes, rejecting")
             return False
         
         # If it contains job titles or company names, it's not salary
-        job_indicators = ['разработчик', 'developer', 'engineer', 'программист', 'analyst', 'manager']
-        location_indicators = ['местоположение', 'location', 'москва', 'санкт-петербург', 'дубай']
-        
         salary_lower = salary_text.lower()
-        for indicator in job_indicators + location_indicators:
-            if indicator in salary_lower:
-                logger.info(f"🚫 Salary text contains job/location indicator '{indicator}', rejecting")
-                return False
+        indicator = next((item for item in SALARY_REJECT_INDICATORS if item in salary_lower), None)
+        if indicator:
+            logger.debug("🚫 Salary text contains job/location indicator '%s', rejecting", indicator)
+            return False
         
-        logger.info(f"✅ Salary text appears valid: {salary_text[:50]}...")
+        logger.debug("✅ Salary text appears valid: %.50s...", salary_text)
         return True
\ No newline at end of file
@@ -3,6 +3,7 @@
 Button actions for Telegram bot.
 """
 import json
+from functools import lru_cache
 from telegram import InlineKeyboardButton, InlineKeyboardMarkup, Update
 from telegram.ext import ContextTypes
 from helpers import LoggerHelper, SettingsHelper
@@ -10,6 +11,28 @@ from services import JobSearchService
 
 logger = LoggerHelper.get_logger(__name__, prefix='button_handlers')
 
+# Telegram objects are immutable, so the constant button is built once and shared
+SEARCH_BY_BOT_BUTTON = InlineKeyboardButton(
+    text="🔍 Search by Bot",
+    switch_inline_query_current_chat=""
+)
+
+
+@lru_cache(maxsize=4096)
+def _job_keyboard(job_link):
+    """Build the job keyboard markup for a link (cached per link)"""
+    row = []
+    
+    # View Job button (if link available)
+    if job_link:
+        row.append(InlineKeyboardButton(
+            text="🔗 View Job",
+            url=job_link
+        ))
+    
+    row.append(SEARCH_BY_BOT_BUTTON)
+    return InlineKeyboardMarkup([row])
+
 
 class ButtonHandlers:
     """Handle button callbacks for job interactions"""
@@ -44,26 +67,8 @@ class ButtonHandlers:
     
     def create_job_keyboard(self, job_link=None, site_name=None, job_title=None):
         """Create inline keyboard for job interactions"""
-        keyboard = []
-        row = []
-        
-        # View Job button (if link available)
-        if job_link:
-            row.append(InlineKeyboardButton(
-                text="🔗 View Job",
-                url=job_link
-            ))
-        
-        # Search by Bot button
-        row.append(InlineKeyboardButton(
-            text="🔍 Search by Bot",
-            switch_inline_query_current_chat=""
-        ))
-        
-        if row:
-            keyboard.append(row)
-        
-        return InlineKeyboardMarkup(keyboard)
+        # Only the link varies, so markups are shared per distinct URL
+        return _job_keyboard(job_link or None)
     
 
 
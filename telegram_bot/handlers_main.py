@@ -1,32 +1,148 @@
 """
 Handlers for Telegram bot.
 """
+import asyncio
+import time
+from collections import OrderedDict
+from functools import partial, wraps
+
 from helpers import SettingsHelper, LoggerHelper
+from telegram.constants import ChatAction
+from telegram.error import TelegramError
 from telegram.ext import CommandHandler, MessageHandler, filters, ConversationHandler, InlineQueryHandler, CallbackQueryHandler
 from controllers import TelegramInlineQueryController
 from telegram_bot.handlers.button_actions import button_handlers
 
+logger = LoggerHelper.get_logger(__name__, prefix='handlers')
+
 SELECT_SITE, ENTER_KEYWORD = range(2)
 
+# Replies accepted in the SELECT_SITE conversation state
+SITE_SELECTION_CHOICES = frozenset(('hh', 'geekjob', 'all'))
+# Sites accepted by /vacancy
+VACANCY_SITES = frozenset(('hh', 'geekjob'))
+# Sites searched by /search when the user has not picked any; resolved once per process
+DEFAULT_SITES = SettingsHelper.get_default_site_choices()
+
+
+class SiteChoiceFilter(filters.MessageFilter):
+    """Match messages whose text is exactly one of SITE_SELECTION_CHOICES (set lookup, no regex)"""
+    
+    def filter(self, message):
+        return message.text in SITE_SELECTION_CHOICES
+
+
+SITE_CHOICE_FILTER = SiteChoiceFilter(name='SiteChoiceFilter')
+
+# Sent as-is by /help; HTML so that the <placeholders> are escaped once here
+HELP_TEXT = """
+🔍 <b>Job Search Bot Help</b>
+
+<b>Commands:</b>
+• <code>/start</code> - Start a new job search
+• <code>/search &lt;keyword&gt;</code> - Search for jobs directly
+• <code>/vacancy &lt;id&gt; &lt;site&gt;</code> - Get detailed vacancy information
+• <code>/help</code> - Show this help message
+
+<b>Inline Search:</b>
+• Type <code>@your_bot_name &lt;keyword&gt;</code> in any chat
+• Get instant job results with interactive buttons
+
+<b>Button Actions:</b>
+• 🔗 <b>View Job</b> - Open job posting
+• 🔍 <b>Search by Bot</b> - Start new search
+• ✨ <b>Apply Job</b> - Get application tips
+• 📝 <b>Description</b> - View job details
+• 💼 <b>Company Jobs</b> - Browse company vacancies
+• 🔍 <b>Similar Jobs</b> - Find related positions
+
+<b>Supported Sites:</b>
+• HeadHunter (HH.ru)
+• GeekJob.ru
+
+<b>Tips:</b>
+• Use specific keywords for better results
+• Try different job titles and skills
+• Use location-based searches
+• Check company profiles for more opportunities
+
+Need help? Contact the bot administrator.
+"""
+
+
+# Telegram shows a chat action for about 5 seconds, so it is re-sent slightly sooner
+TYPING_REFRESH_INTERVAL = 4.0
+
 
-def search_command(update, context):
+async def _keep_typing(bot, chat_id):
+    """Re-send the typing action until cancelled by the caller; stops quietly if Telegram refuses it"""
+    while True:
+        try:
+            await bot.send_chat_action(chat_id, ChatAction.TYPING)
+        except TelegramError as e:
+            logger.debug(f"Typing indicator stopped for chat {chat_id}: {e}")
+            return
+        await asyncio.sleep(TYPING_REFRESH_INTERVAL)
+
+
+def typing_indicator(func):
+    """Keep the typing action visible while an async handler runs"""
+    @wraps(func)
+    async def wrapper(update, context, *args, **kwargs):
+        typing = asyncio.create_task(_keep_typing(context.bot, update.effective_chat.id))
+        try:
+            return await func(update, context, *args, **kwargs)
+        finally:
+            typing.cancel()
+    return wrapper
+
+
+# Formatted /vacancy replies keyed by (site, vacancy_id); oldest entries are evicted first
+VACANCY_CACHE_SIZE = 2048
+VACANCY_CACHE_TTL = 3600
+_vacancy_cache = OrderedDict()
+
+
+def _get_cached_vacancy(key):
+    """Return a cached vacancy message that has not expired, or None"""
+    entry = _vacancy_cache.get(key)
+    if entry is None:
+        return None
+    expires_at, message = entry
+    if expires_at < time.monotonic():
+        del _vacancy_cache[key]
+        return None
+    _vacancy_cache.move_to_end(key)
+    return message
+
+
+def _cache_vacancy(key, message):
+    """Store a formatted vacancy message, evicting the least recently used entry when full"""
+    _vacancy_cache[key] = (time.monotonic() + VACANCY_CACHE_TTL, message)
+    _vacancy_cache.move_to_end(key)
+    if len(_vacancy_cache) > VACANCY_CACHE_SIZE:
+        _vacancy_cache.popitem(last=False)
+
+
+@typing_indicator
+async def search_command(update, context, bot):
     """Handle /search <keyword> command."""
     keyword = ' '.join(context.args).strip()
     if not keyword:
-        update.message.reply_text("Please provide a keyword. Usage: /search <keyword>")
+        await update.message.reply_text("Please provide a keyword. Usage: /search <keyword>")
         return
-    bot = context.bot
-    sites = context.user_data.get('sites', SettingsHelper.get_default_site_choices())
-    update.message.reply_text(f"Searching for '{keyword}'...")
-    results = bot.search_service.search_all_sites(keyword, None, sites)
-    bot._display_telegram_results(update, results)
+    sites = context.user_data.get('sites', DEFAULT_SITES)
+    await update.message.reply_text(f"Searching for '{keyword}'...")
+    results = await bot.search_service.search_all_sites_async(keyword, None, sites)
+    await bot._display_telegram_results(update, results)
 
 
-def vacancy_command(update, context):
+@typing_indicator
+async def vacancy_command(update, context, bot):
     """Handle /vacancy <id> <site> command for detailed vacancy information."""
     args = context.args
     if len(args) < 2:
-        update.message.reply_text(
+        await update.message.reply_text(
             "Please provide vacancy ID and site. Usage: /vacancy <id> <site>\n"
             "Example: /vacancy 123456 hh"
         )
@@ -36,68 +152,39 @@ def vacancy_command(update, context):
     site = args[1].lower()
     
     # Validate site
-    if site not in ['hh', 'geekjob']:
-        update.message.reply_text("Supported sites: hh, geekjob")
+    if site not in VACANCY_SITES:
+        await update.message.reply_text("Supported sites: hh, geekjob")
         return
     
-    bot = context.bot
-    update.message.reply_text(f"Fetching detailed vacancy information for {site} ID: {vacancy_id}...")
+    await update.message.reply_text(f"Fetching detailed vacancy information for {site} ID: {vacancy_id}...")
     
     try:
         # Get detailed vacancy info (now returns formatted message directly)
-        formatted_message = bot.get_detailed_vacancy_info(vacancy_id, site)
+        cache_key = (site, vacancy_id)
+        formatted_message = _get_cached_vacancy(cache_key)
+        if formatted_message is None:
+            formatted_message = await asyncio.to_thread(bot.get_detailed_vacancy_info, vacancy_id, site)
+            if formatted_message:
+                _cache_vacancy(cache_key, formatted_message)
         
         if formatted_message:
             # Send the formatted message directly
-            update.message.reply_text(
+            await update.message.reply_text(
                 formatted_message,
                 parse_mode='HTML',
                 disable_web_page_preview=True
             )
         else:
-            update.message.reply_text(f"❌ Vacancy not found or error occurred for ID: {vacancy_id}")
+            await update.message.reply_text(f"❌ Vacancy not found or error occurred for ID: {vacancy_id}")
             
     except Exception as e:
         bot.logger.error(f"Error in vacancy command: {e}")
-        update.message.reply_text(f"❌ Error fetching vacancy information: {str(e)}")
+        await update.message.reply_text(f"❌ Error fetching vacancy information: {str(e)}")
 
 
-def help_command(update, context):
+async def help_command(update, context):
     """Handle /help command."""
-    help_text = """
-🔍 **Job Search Bot Help**
-
-**Commands:**
-• `/start` - Start a new job search
-• `/search <keyword>` - Search for jobs directly
-• `/vacancy <id> <site>` - Get detailed vacancy information
-• `/help` - Show this help message
-
-**Inline Search:**
-• Type `@your_bot_name <keyword>` in any chat
-• Get instant job results with interactive buttons
-
-**Button Actions:**
-• 🔗 **View Job** - Open job posting
-• 🔍 **Search by Bot** - Start new search
-• ✨ **Apply Job** - Get application tips
-• 📝 **Description** - View job details
-• 💼 **Company Jobs** - Browse company vacancies
-• 🔍 **Similar Jobs** - Find related positions
-
-**Supported Sites:**
-• HeadHunter (HH.ru)
-• GeekJob.ru
-
-**Tips:**
-• Use specific keywords for better results
-• Try different job titles and skills
-• Use location-based searches
-• Check company profiles for more opportunities
-
-Need help? Contact the bot administrator.
-"""
-    update.message.reply_text(help_text, parse_mode='Markdown')
+    await update.message.reply_text(HELP_TEXT, parse_mode='HTML', disable_web_page_preview=True)
 
 
 def setup_handlers(dp, bot):
@@ -112,8 +199,9 @@ def setup_handlers(dp, bot):
     
     # Add command handlers
     dp.add_handler(CommandHandler("start", bot.start))
-    dp.add_handler(CommandHandler("search", search_command))
-    dp.add_handler(CommandHandler("vacancy", vacancy_command))
+    # context.bot is the Telegram API client, so the TelegramBot is bound explicitly
+    dp.add_handler(CommandHandler("search", partial(search_command, bot=bot)))
+    dp.add_handler(CommandHandler("vacancy", partial(vacancy_command, bot=bot)))
     dp.add_handler(CommandHandler("help", help_command))
     
     # Add conversation handler
@@ -121,7 +209,7 @@ def setup_handlers(dp, bot):
         entry_points=[CommandHandler("start", bot.start)],
         states={
             SELECT_SITE: [
-                MessageHandler(filters.Regex('^(hh|geekjob|all)$'), bot.handle_site_selection)
+                MessageHandler(SITE_CHOICE_FILTER, bot.handle_site_selection)
             ],
             ENTER_KEYWORD: [
                 MessageHandler(filters.Text() & ~filters.COMMAND, bot.handle_search)
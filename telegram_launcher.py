@@ -5,10 +5,15 @@ Telegram bot launcher with process management.
 import os
 import sys
 import signal
-import atexit
 from pathlib import Path
 from helpers import LoggerHelper
 
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
 # Add project root to path
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
@@ -18,119 +23,46 @@ logger = LoggerHelper.get_logger(__name__, prefix='telegram-launcher')
 # Process lock file
 LOCK_FILE = Path(__file__).parent / "bot.lock"
 
-def cleanup_lock():
-    """Remove lock file on exit"""
-    try:
-        if LOCK_FILE.exists():
-            LOCK_FILE.unlink()
-            logger.info("Lock file removed")
-    except Exception as e:
-        logger.warning(f"Failed to remove lock file: {e}")
-
-def check_lock():
-    """Check if another bot instance is running"""
-    if LOCK_FILE.exists():
-        try:
-            # Check if the process in the lock file is still running
-            with open(LOCK_FILE, 'r') as f:
-                pid = int(f.read().strip())
-            
-            # Try to check if process exists (Windows)
-            try:
-                import psutil
-                if psutil.pid_exists(pid):
-                    # Check if it's actually our bot process
-                    try:
-                        process = psutil.Process(pid)
-                        if "telegram_launcher.py" in " ".join(process.cmdline()):
-                            logger.error(f"Bot instance already running with PID {pid}")
-                            return False
-                        else:
-                            # Different process, remove stale lock
-                            logger.info("Removing stale lock file from different process")
-                            LOCK_FILE.unlink()
-                    except (psutil.NoSuchProcess, psutil.AccessDenied):
-                        # Process doesn't exist or we can't access it
-                        pass
-            except ImportError:
-                # Fallback without psutil
-                pass
-            
-            # If we get here, the process is not running, remove stale lock
-            LOCK_FILE.unlink()
-            logger.info("Removed stale lock file")
-        except Exception as e:
-            logger.warning(f"Error checking lock file: {e}")
-            # Remove corrupted lock file
-            try:
-                LOCK_FILE.unlink()
-            except:
-                pass
+def acquire_lock():
+    """Take an exclusive OS lock on LOCK_FILE; returns the open file, or None if another instance holds it.
     
-    return True
-
-def create_lock():
-    """Create lock file with current process ID"""
+    The lock is released by the OS when the process exits, so no stale lock cleanup is needed.
+    """
+    lock_file = open(LOCK_FILE, 'a+')
     try:
-        with open(LOCK_FILE, 'w') as f:
-            f.write(str(os.getpid()))
-        logger.info(f"Created lock file with PID {os.getpid()}")
-        return True
-    except Exception as e:
-        logger.error(f"Failed to create lock file: {e}")
-        return False
+        if fcntl:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        else:
+            lock_file.seek(0)
+            msvcrt.locking(lock_file.fileno(), msvcrt.LK_NBLCK, 1)
+    except OSError:
+        lock_file.close()
+        return None
+    
+    lock_file.seek(0)
+    lock_file.truncate()
+    lock_file.write(str(os.getpid()))
+    lock_file.flush()
+    logger.info(f"Acquired lock file with PID {os.getpid()}")
+    return lock_file
 
 def signal_handler(signum, frame):
     """Handle shutdown signals"""
-    logger.info("Received shutdown signal, cleaning up...")
-    cleanup_lock()
+    logger.info("Received shutdown signal, stopping...")
     sys.exit(0)
 
-def force_cleanup():
-    """Force cleanup of any existing bot sessions"""
-    try:
-        # Remove lock file if it exists
-        if LOCK_FILE.exists():
-            LOCK_FILE.unlink()
-            logger.info("Force removed lock file")
-        
-        # Try to kill any existing Python processes that might be running the bot
-        try:
-            import psutil
-            for proc in psutil.process_iter(['pid', 'name', 'cmdline']):
-                try:
-                    cmdline = " ".join(proc.info['cmdline'])
-                    if "telegram_launcher.py" in cmdline and proc.info['pid'] != os.getpid():
-                        logger.info(f"Terminating existing bot process: {proc.info['pid']}")
-                        proc.terminate()
-                        proc.wait(timeout=5)
-                except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.TimeoutExpired):
-                    pass
-        except ImportError:
-            pass
-            
-    except Exception as e:
-        logger.warning(f"Error during force cleanup: {e}")
-
 def main():
     """Main launcher function with process management"""
     try:
-        # Register cleanup function
-        atexit.register(cleanup_lock)
-        
         # Set up signal handlers
         signal.signal(signal.SIGINT, signal_handler)
         signal.signal(signal.SIGTERM, signal_handler)
         
-        # Check if another instance is running
-        if not check_lock():
+        # Keep a reference to the lock file for the lifetime of the process
+        lock_file = acquire_lock()
+        if lock_file is None:
             logger.error("Another bot instance is already running. Please stop it first.")
-            logger.info("You can also use 'python telegram_launcher.py --force' to force cleanup")
-            sys.exit(1)
-        
-        # Create lock file
-        if not create_lock():
-            logger.error("Failed to create lock file")
+            logger.info("You can use 'python cleanup_bot.py' to terminate existing sessions")
             sys.exit(1)
         
         logger.info("Starting Telegram Job Search Bot...")
@@ -146,13 +78,6 @@ def main():
     except Exception as e:
         logger.error(f"Error starting bot: {e}")
         sys.exit(1)
-    finally:
-        cleanup_lock()
 
 if __name__ == '__main__':
-    # Check for force cleanup flag
-    if len(sys.argv) > 1 and sys.argv[1] == '--force':
-        logger.info("Force cleanup mode - cleaning up existing sessions")
-        force_cleanup()
-    
-    main() 
\ No newline at end of file
+    main()
@@ -22,141 +22,135 @@ from config.urls import (
 )
 
 
+PLACEHOLDER_IMAGE_TYPES = ("job_opportunity", "company", "geekjob", "headhunter")
+
+# (label, site, vacancy id, company id, logo args, logo kwargs); sites without logo args
+# only check the vacancy and company fallbacks
+SITE_URL_CASES = (
+    ("HeadHunter", 'hh', '12345', 'employer123', ('employer123',), {'size': '240'}),
+    ("GeekJob", 'geekjob', '67890', 'company456', (None, 'logo.png'), {}),
+    ("Fallback", 'nonexistent', '99999', 'company999', None, None),
+)
+
+
+URLS_CONFIG_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'config', 'urls.json')
+
+# HH API, GeekJob API and the job placeholder image
+DEFAULT_TEST_URLS = (
+    "https://api.hh.ru/vacancies",
+    "https://geekjob.ru/json/find/vacancy",
+    "https://img.icons8.com/color/96/000000/job.png"
+)
+
+INVALID_TEST_URLS = ("", "not-a-url", "ftp://example.com", None)
+
+
+def _write_lines(lines):
+    """Write collected report lines to stdout in a single call."""
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
+
+
 def test_url_functions():
     """Test all URL configuration functions."""
-    print("🧪 Testing URL Configuration System")
-    print("=" * 50)
-    
-    # Test placeholder images
-    print("\n📸 Testing Placeholder Images:")
+    lines = []
+    out = lines.append
     try:
-        job_img = get_placeholder_image("job_opportunity")
-        company_img = get_placeholder_image("company")
-        geekjob_img = get_placeholder_image("geekjob")
-        hh_img = get_placeholder_image("headhunter")
+        out("🧪 Testing URL Configuration System")
+        out("=" * 50)
         
-        print(f"✅ Job opportunity: {job_img}")
-        print(f"✅ Company: {company_img}")
-        print(f"✅ GeekJob: {geekjob_img}")
-        print(f"✅ HeadHunter: {hh_img}")
-    except Exception as e:
-        print(f"❌ Placeholder images failed: {e}")
-    
-    # Test HeadHunter URLs
-    print("\n🔍 Testing HeadHunter URLs:")
-    try:
-        hh_vacancy = get_site_vacancy_url('hh', '12345')
-        hh_company = get_site_company_url('hh', 'employer123')
-        hh_api = get_site_api_url('hh')
-        hh_logo = get_site_logo_url('hh', 'employer123', size='240')
+        # Test placeholder images
+        out("\n📸 Testing Placeholder Images:")
+        try:
+            for image_type in PLACEHOLDER_IMAGE_TYPES:
+                out(f"✅ {image_type}: {get_placeholder_image(image_type)}")
+        except Exception as e:
+            out(f"❌ Placeholder images failed: {e}")
         
-        print(f"✅ Vacancy: {hh_vacancy}")
-        print(f"✅ Company: {hh_company}")
-        print(f"✅ API: {hh_api}")
-        print(f"✅ Logo: {hh_logo}")
-    except Exception as e:
-        print(f"❌ HeadHunter URLs failed: {e}")
-    
-    # Test GeekJob URLs
-    print("\n🔍 Testing GeekJob URLs:")
-    try:
-        gj_vacancy = get_site_vacancy_url('geekjob', '67890')
-        gj_company = get_site_company_url('geekjob', 'company456')
-        gj_api = get_site_api_url('geekjob')
-        gj_logo = get_site_logo_url('geekjob', None, 'logo.png')
+        # Test site URLs, including the fallback for an unknown site
+        for label, site, vacancy_id, company_id, logo_args, logo_kwargs in SITE_URL_CASES:
+            out(f"\n🔍 Testing {label} URLs:")
+            try:
+                out(f"✅ Vacancy: {get_site_vacancy_url(site, vacancy_id)}")
+                out(f"✅ Company: {get_site_company_url(site, company_id)}")
+                if logo_args is not None:
+                    out(f"✅ API: {get_site_api_url(site)}")
+                    out(f"✅ Logo: {get_site_logo_url(site, *logo_args, **logo_kwargs)}")
+            except Exception as e:
+                out(f"❌ {label} URLs failed: {e}")
         
-        print(f"✅ Vacancy: {gj_vacancy}")
-        print(f"✅ Company: {gj_company}")
-        print(f"✅ API: {gj_api}")
-        print(f"✅ Logo: {gj_logo}")
-    except Exception as e:
-        print(f"❌ GeekJob URLs failed: {e}")
-    
-    # Test fallback URLs
-    print("\n🔄 Testing Fallback URLs:")
-    try:
-        # Test with non-existent site
-        fallback_vacancy = get_site_vacancy_url('nonexistent', '99999')
-        fallback_company = get_site_company_url('nonexistent', 'company999')
+        # Test configuration reloading
+        out("\n🔄 Testing Configuration Reloading:")
+        try:
+            reload_url_config()
+            out("✅ Configuration reloaded successfully")
+        except Exception as e:
+            out(f"❌ Configuration reload failed: {e}")
         
-        print(f"✅ Fallback vacancy: {fallback_vacancy}")
-        print(f"✅ Fallback company: {fallback_company}")
-    except Exception as e:
-        print(f"❌ Fallback URLs failed: {e}")
-    
-    # Test configuration reloading
-    print("\n🔄 Testing Configuration Reloading:")
-    try:
-        reload_url_config()
-        print("✅ Configuration reloaded successfully")
-    except Exception as e:
-        print(f"❌ Configuration reload failed: {e}")
-    
-    print("\n" + "=" * 50)
-    print("🎉 URL Configuration Test Complete!")
+        out("\n" + "=" * 50)
+        out("🎉 URL Configuration Test Complete!")
+    finally:
+        _write_lines(lines)
+
+
+def _check_urls(out, url_config, urls, expected):
+    """Report whether each URL validates as expected."""
+    for url, is_valid in zip(urls, url_config.validate_urls(urls)):
+        matches = is_valid == expected
+        status = "✅" if matches else "❌"
+        out(f"{status} {url}: {matches}")
 
 
 def test_url_validation():
     """Test URL validation functions."""
-    print("\n🔍 Testing URL Validation:")
-    
-    from config.urls import URLConfig
-    
-    url_config = URLConfig()
-    
-    # Test valid URLs from configuration
+    lines = []
+    out = lines.append
     try:
-        # Load URLs from configuration
-        with open('config/urls.json', 'r', encoding='utf-8') as f:
-            config = json.load(f)
-            
-        # Get URLs from configuration
-        hh_api = config.get('job_sites', {}).get('hh', {}).get('urls', {}).get('api', 'https://api.hh.ru/vacancies')
-        gj_api = config.get('job_sites', {}).get('geekjob', {}).get('urls', {}).get('api', 'https://geekjob.ru/json/find/vacancy')
-        placeholder = config.get('external_services', {}).get('placeholder_images', {}).get('job_opportunity', 'https://img.icons8.com/color/96/000000/job.png')
+        out("\n🔍 Testing URL Validation:")
+        
+        from config.urls import URLConfig
+        
+        url_config = URLConfig()
+        _check_urls(out, url_config, DEFAULT_TEST_URLS, True)
+        _check_urls(out, url_config, INVALID_TEST_URLS, False)
+    finally:
+        _write_lines(lines)
+
+
+def test_url_validation_from_config():
+    """Test URL validation against the URLs configured in urls.json."""
+    lines = []
+    out = lines.append
+    try:
+        out("\n🔍 Testing URL Validation from configuration:")
+        
+        if not os.path.exists(URLS_CONFIG_PATH):
+            out("⏭️ urls.json not found, skipping")
+            return
         
-        valid_urls = [
-            hh_api,
-            gj_api,
-            placeholder
-        ]
+        from config.urls import URLConfig
         
-        for url in valid_urls:
-            is_valid = url_config.validate_url(url)
-            status = "✅" if is_valid else "❌"
-            print(f"{status} {url}: {is_valid}")
-            
-    except (FileNotFoundError, json.JSONDecodeError):
-        # Fallback to hardcoded URLs if configuration cannot be loaded
-        valid_urls = [
-            "https://api.hh.ru/vacancies",
-            "https://geekjob.ru/json/find/vacancy",
-            "https://img.icons8.com/color/96/000000/job.png"
-        ]
+        url_config = URLConfig()
+        try:
+            with open(URLS_CONFIG_PATH, 'r', encoding='utf-8') as f:
+                config = json.load(f)
+        except json.JSONDecodeError as e:
+            out(f"❌ Could not parse urls.json: {e}")
+            return
         
-        for url in valid_urls:
-            is_valid = url_config.validate_url(url)
-            status = "✅" if is_valid else "❌"
-            print(f"{status} {url}: {is_valid}")
-    
-    # Test invalid URLs
-    invalid_urls = [
-        "",
-        "not-a-url",
-        "ftp://example.com",
-        None
-    ]
-    
-    for url in invalid_urls:
-        is_valid = url_config.validate_url(url)
-        status = "✅" if not is_valid else "❌"
-        print(f"{status} {url}: {not is_valid}")
+        hh_api = config.get('job_sites', {}).get('hh', {}).get('urls', {}).get('api', DEFAULT_TEST_URLS[0])
+        gj_api = config.get('job_sites', {}).get('geekjob', {}).get('urls', {}).get('api', DEFAULT_TEST_URLS[1])
+        placeholder = config.get('external_services', {}).get('placeholder_images', {}).get('job_opportunity', DEFAULT_TEST_URLS[2])
+        _check_urls(out, url_config, (hh_api, gj_api, placeholder), True)
+    finally:
+        _write_lines(lines)
 
 
 if __name__ == "__main__":
     try:
         test_url_functions()
         test_url_validation()
+        test_url_validation_from_config()
     except Exception as e:
         print(f"\n💥 Test failed with error: {e}")
         import traceback
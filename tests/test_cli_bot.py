@@ -5,28 +5,67 @@ Unit tests for CLI bot functionality
 
 import unittest
 from unittest.mock import Mock, patch, MagicMock
+import copy
 import sys
 import os
+from types import MappingProxyType
 
 # Add project root to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from cli_bot import JobSearchBot
-from helpers import Settings, LoggerHelper
+# cli_bot and helpers are imported in setUpClass so that collecting tests does not
+# build the whole bot dependency graph
+
+# Shared read-only fixtures; the code under test only reads them
+PYTHON_HH_PARAMS = MappingProxyType({'keyword': 'python', 'locations': ('remote',), 'sites': ('hh',)})
+EMPTY_KEYWORD_PARAMS = MappingProxyType({'keyword': '', 'locations': ('remote',), 'sites': ('hh',)})
+INVALID_SITE_PARAMS = MappingProxyType({'keyword': 'python', 'locations': ('remote',), 'sites': ('invalid_site',)})
+HH_RESULTS = MappingProxyType({
+    'sites': {'hh': {'jobs': ('job1', 'job2'), 'timing_ms': 100}},
+    'global_time': 150
+})
+HH_SINGLE_JOB_RESULTS = MappingProxyType({
+    'sites': {'hh': {'jobs': ('Python Developer at Test Corp',), 'timing_ms': 100}},
+    'global_time': 100
+})
+# input() answers: keyword, location, then empty for the remaining prompts
+PYTHON_DEFAULT_INPUTS = ("python", "", "")
+PYTHON_REMOTE_INPUTS = ("python", "remote", "", "")
+PYTHON_LIST_INPUTS = ("python", "list", "", "")
+# input() answers for run(): default sites, keyword, empty location and params, then quit
+RUN_INPUTS = ("", "python", "", "", "quit")
 
 
 class TestJobSearchBot(unittest.TestCase):
     """Test cases for JobSearchBot class"""
 
+    @classmethod
+    def setUpClass(cls):
+        """Build the bot once for the whole class"""
+        # Mock logger to avoid file operations during tests; the module logger mock
+        # records what initialization logged for test_logging_functionality
+        from cli_bot import JobSearchBot
+        from helpers import Settings
+        from services import HHLocationService, JobSearchService
+        cls.Settings = Settings
+        
+        # Service mocks are created once and reset per test; spec_set rejects misspelt attributes
+        cls._search_mock = MagicMock(spec_set=JobSearchService)
+        cls._location_mock = MagicMock(spec_set=HHLocationService)
+        
+        with patch('cli_bot.LoggerHelper'), patch('cli_bot.logger') as init_logger:
+            cls._template_bot = JobSearchBot()
+        cls._init_logger = init_logger
+
     def setUp(self):
         """Set up test fixtures"""
-        # Mock logger to avoid file operations during tests
-        with patch('cli_bot.LoggerHelper'):
-            self.bot = JobSearchBot()
+        self.bot = copy.copy(self._template_bot)
         
         # Mock the search service and location service
-        self.bot.search_service = Mock()
-        self.bot.location_service = Mock()
+        self._search_mock.reset_mock(return_value=True, side_effect=True)
+        self._location_mock.reset_mock(return_value=True, side_effect=True)
+        self.bot.search_service = self._search_mock
+        self.bot.location_service = self._location_mock
 
     def test_init(self):
         """Test bot initialization"""
@@ -45,59 +84,29 @@ class TestJobSearchBot(unittest.TestCase):
         mock_print.assert_called()
         calls = mock_print.call_args_list
         
-        # Check that we have the expected output structure
-        site_output = [call[0][0] for call in calls if 'Available job sites:' in str(call[0][0])]
-        self.assertTrue(len(site_output) > 0)
-
-    @patch('builtins.input')
-    def test_get_site_choice_default(self, mock_input):
-        """Test getting site choice with default selection"""
-        mock_input.return_value = ""
-        
-        result = self.bot._get_site_choice()
-        
-        self.assertEqual(result, Settings.get_default_site_choices())
-
-    @patch('builtins.input')
-    def test_get_site_choice_quit(self, mock_input):
-        """Test getting site choice with quit command"""
-        mock_input.return_value = "quit"
-        
-        result = self.bot._get_site_choice()
-        
-        self.assertIsNone(result)
-
-    @patch('builtins.input')
-    def test_get_site_choice_single_site(self, mock_input):
-        """Test getting site choice with single site selection"""
-        mock_input.return_value = "hh"
-        
-        result = self.bot._get_site_choice()
-        
-        self.assertEqual(result, ['hh'])
-
-    @patch('builtins.input')
-    def test_get_site_choice_multiple_sites(self, mock_input):
-        """Test getting site choice with multiple site selection"""
-        mock_input.return_value = "hh,geekjob"
-        
-        result = self.bot._get_site_choice()
-        
-        self.assertEqual(result, ['hh', 'geekjob'])
-
-    @patch('builtins.input')
-    def test_get_site_choice_clear(self, mock_input):
-        """Test getting site choice with clear command"""
-        mock_input.return_value = "clear"
-        
-        result = self.bot._get_site_choice()
-        
-        self.assertEqual(result, Settings.get_default_site_choices())
+        # Check that we have the expected output structure (the header is printed after a blank line)
+        self.assertTrue(any(
+            call.args and isinstance(call.args[0], str) and call.args[0].lstrip('\n').startswith('Available job sites:')
+            for call in calls
+        ))
+
+    def test_get_site_choice(self):
+        """Test getting site choice for default, quit, single, multiple and clear input"""
+        cases = (
+            ("", self.Settings.get_default_site_choices()),
+            ("quit", None),
+            ("hh", ['hh']),
+            ("hh,geekjob", ['hh', 'geekjob']),
+            ("clear", self.Settings.get_default_site_choices()),
+        )
+        for raw, expected in cases:
+            with self.subTest(raw=raw), patch('builtins.input', return_value=raw):
+                self.assertEqual(self.bot._get_site_choice(), expected)
 
     @patch('builtins.input')
     def test_get_search_parameters_valid_keyword(self, mock_input):
         """Test getting search parameters with valid keyword"""
-        mock_input.side_effect = ["python", "", ""]  # keyword, location, then empty for params
+        mock_input.side_effect = PYTHON_DEFAULT_INPUTS
         
         result = self.bot._get_search_parameters()
         
@@ -119,7 +128,7 @@ class TestJobSearchBot(unittest.TestCase):
     @patch('builtins.input')
     def test_get_search_parameters_with_remote_location(self, mock_input):
         """Test getting search parameters with remote location"""
-        mock_input.side_effect = ["python", "remote", "", ""]  # keyword, remote location, empty, empty params
+        mock_input.side_effect = PYTHON_REMOTE_INPUTS
         
         result = self.bot._get_search_parameters()
         
@@ -132,7 +141,7 @@ class TestJobSearchBot(unittest.TestCase):
     @patch('builtins.input')
     def test_get_search_parameters_with_location_list(self, mock_input):
         """Test getting search parameters with location list command"""
-        mock_input.side_effect = ["python", "list", "", ""]  # keyword, list, empty, empty params
+        mock_input.side_effect = PYTHON_LIST_INPUTS
         
         # Mock the location service
         self.bot.location_service.get_location_name.return_value = "Test Location"
@@ -147,11 +156,7 @@ class TestJobSearchBot(unittest.TestCase):
 
     def test_validate_search_parameters_valid(self):
         """Test validation of valid search parameters"""
-        params = {
-            'keyword': 'python',
-            'locations': ['remote'],
-            'sites': ['hh']
-        }
+        params = PYTHON_HH_PARAMS
         
         result = self.bot._validate_search_parameters(params)
         
@@ -159,11 +164,7 @@ class TestJobSearchBot(unittest.TestCase):
 
     def test_validate_search_parameters_invalid_keyword(self):
         """Test validation of search parameters with invalid keyword"""
-        params = {
-            'keyword': '',
-            'locations': ['remote'],
-            'sites': ['hh']
-        }
+        params = EMPTY_KEYWORD_PARAMS
         
         result = self.bot._validate_search_parameters(params)
         
@@ -171,11 +172,7 @@ class TestJobSearchBot(unittest.TestCase):
 
     def test_validate_search_parameters_invalid_sites(self):
         """Test validation of search parameters with invalid sites"""
-        params = {
-            'keyword': 'python',
-            'locations': ['remote'],
-            'sites': ['invalid_site']
-        }
+        params = INVALID_SITE_PARAMS
         
         result = self.bot._validate_search_parameters(params)
         
@@ -185,22 +182,9 @@ class TestJobSearchBot(unittest.TestCase):
     def test_perform_search_success(self, mock_logger):
         """Test successful search performance"""
         # Mock search results
-        mock_results = {
-            'sites': {
-                'hh': {
-                    'jobs': ['job1', 'job2'],
-                    'timing_ms': 100
-                }
-            },
-            'global_time': 150
-        }
-        self.bot.search_service.search_all_sites.return_value = mock_results
+        self.bot.search_service.search_all_sites.return_value = HH_RESULTS
         
-        params = {
-            'keyword': 'python',
-            'locations': ['remote'],
-            'sites': ['hh']
-        }
+        params = PYTHON_HH_PARAMS
         
         result = self.bot._perform_search(params)
         
@@ -213,11 +197,7 @@ class TestJobSearchBot(unittest.TestCase):
         """Test search performance with error"""
         self.bot.search_service.search_all_sites.side_effect = Exception("Search error")
         
-        params = {
-            'keyword': 'python',
-            'locations': ['remote'],
-            'sites': ['hh']
-        }
+        params = PYTHON_HH_PARAMS
         
         # Temporarily disable the logger to suppress error output
         import cli_bot
@@ -307,22 +287,13 @@ class TestJobSearchBot(unittest.TestCase):
         # Third call: location (empty - done)
         # Fourth call: extra params (empty - done)
         # Fifth call: quit
-        mock_input.side_effect = ["", "python", "", "", "quit"]
+        mock_input.side_effect = RUN_INPUTS
         
         # Mock location service to return string instead of Mock
         self.bot.location_service.get_location_name.return_value = "Test Location"
         
         # Mock search service
-        mock_results = {
-            'sites': {
-                'hh': {
-                    'jobs': ['Python Developer at Test Corp'],
-                    'timing_ms': 100
-                }
-            },
-            'global_time': 100
-        }
-        self.bot.search_service.search_all_sites.return_value = mock_results
+        self.bot.search_service.search_all_sites.return_value = HH_SINGLE_JOB_RESULTS
         
         # Mock job results logger
         with patch('cli_bot.job_results_logger') as mock_logger:
@@ -338,48 +309,37 @@ class TestJobSearchBot(unittest.TestCase):
         text_with_tags = "Делаем много проектов на <highlighttext>PHP</highlighttext> 7-8, Symfony 6."
         expected = "Делаем много проектов на PHP 7-8, Symfony 6."
         
-        # This method should be available if it exists in the bot
-        if hasattr(self.bot, '_clean_html_tags'):
-            result = self.bot._clean_html_tags(text_with_tags)
-            self.assertEqual(result, expected)
+        self.assertEqual(self.bot._clean_html_tags(text_with_tags), expected)
 
     def test_validate_site_choice(self):
         """Test site choice validation"""
         # Test valid choices
-        self.assertTrue(Settings.validate_site_choice(['hh']))
-        self.assertTrue(Settings.validate_site_choice(['geekjob']))
-        self.assertTrue(Settings.validate_site_choice(['hh', 'geekjob']))
+        self.assertTrue(self.Settings.validate_site_choice(['hh']))
+        self.assertTrue(self.Settings.validate_site_choice(['geekjob']))
+        self.assertTrue(self.Settings.validate_site_choice(['hh', 'geekjob']))
         
         # Test invalid choices
-        self.assertFalse(Settings.validate_site_choice(['invalid_site']))
-        self.assertFalse(Settings.validate_site_choice([]))
+        self.assertFalse(self.Settings.validate_site_choice(['invalid_site']))
+        self.assertFalse(self.Settings.validate_site_choice([]))
 
     def test_error_handling(self):
         """Test error handling in various scenarios"""
         # Test with None results
         self.bot.search_service.search_all_sites.return_value = None
         
-        params = {
-            'keyword': 'python',
-            'locations': ['remote'],
-            'sites': ['hh']
-        }
+        params = PYTHON_HH_PARAMS
         
         result = self.bot._perform_search(params)
         self.assertIsNone(result)
 
     def test_logging_functionality(self):
         """Test that logging works correctly"""
-        # Mock logger at module level to verify calls
-        with patch('cli_bot.logger') as mock_logger:
-            bot = JobSearchBot()
-            
-            # Verify logger was used during initialization
-            mock_logger.debug.assert_called()
+        # Verify logger was used during initialization of the shared bot
+        self._init_logger.debug.assert_called()
 
     def test_site_initialization(self):
         """Test that all sites are properly initialized"""
-        bot = JobSearchBot()
+        bot = self.bot
         
         # Check that all expected sites are available
         self.assertIn('hh', bot.sites)
@@ -394,33 +354,30 @@ class TestJobSearchBot(unittest.TestCase):
 class TestCLIBotIntegration(unittest.TestCase):
     """Integration tests for CLI bot"""
 
+    @classmethod
+    def setUpClass(cls):
+        """Build the bot once for the whole class"""
+        from cli_bot import JobSearchBot
+        from helpers import Settings
+        cls.Settings = Settings
+        
+        with patch('cli_bot.LoggerHelper'):
+            cls._template_bot = JobSearchBot()
+
     def setUp(self):
         """Set up integration test fixtures"""
-        with patch('cli_bot.Logger'):
-            self.bot = JobSearchBot()
+        self.bot = copy.copy(self._template_bot)
 
     @patch('cli_bot.JobSearchService')
     def test_full_search_workflow(self, mock_search_service):
         """Test complete search workflow"""
         # Mock search service
         mock_service = Mock()
-        mock_service.search_all_sites.return_value = {
-            'sites': {
-                'hh': {
-                    'jobs': ['Python Developer at Test Corp'],
-                    'timing_ms': 100
-                }
-            },
-            'global_time': 100
-        }
+        mock_service.search_all_sites.return_value = HH_SINGLE_JOB_RESULTS
         self.bot.search_service = mock_service
         
         # Test parameters
-        params = {
-            'keyword': 'python',
-            'locations': ['remote'],
-            'sites': ['hh']
-        }
+        params = PYTHON_HH_PARAMS
         
         # Perform search
         result = self.bot._perform_search(params)
@@ -433,9 +390,9 @@ class TestCLIBotIntegration(unittest.TestCase):
     def test_settings_integration(self):
         """Test integration with settings"""
         # Verify that bot uses correct settings
-        self.assertEqual(Settings.get_default_site_choices(), ['hh', 'geekjob'])
-        self.assertIn('hh', Settings.get_available_sites())
-        self.assertIn('geekjob', Settings.get_available_sites())
+        self.assertEqual(self.Settings.get_default_site_choices(), ['hh', 'geekjob'])
+        self.assertIn('hh', self.Settings.get_available_sites())
+        self.assertIn('geekjob', self.Settings.get_available_sites())
 
 
 if __name__ == '__main__':
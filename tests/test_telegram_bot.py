@@ -3,189 +3,183 @@
 Unit tests for Telegram bot functionality
 """
 
+import copy
 import unittest
 from unittest.mock import Mock, patch, MagicMock, AsyncMock
 import sys
 import os
 import asyncio
+from collections import OrderedDict
+from types import SimpleNamespace
 
 # Add project root to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from telegram_bot import TelegramBot
-from telegram import Update, Message, User, Chat
+from telegram.constants import ChatAction
+from telegram.error import TelegramError
 from telegram.ext import ContextTypes
-from helpers import Settings, LoggerHelper
+from helpers import Settings
+from telegram_bot import handlers_main
+from telegram_bot.handlers_main import typing_indicator
 
 
-class TestTelegramBot(unittest.TestCase):
+# Single-site search result shared by the tests that only read it
+SAMPLE_SEARCH_RESULTS = {
+    'sites': {
+        'hh': {
+            'jobs': ['Python Developer at Test Corp'],
+            'timing_ms': 100
+        }
+    },
+    'global_time': 100
+}
+
+# Single-line messages too long for one 1000-character chunk, built once at import
+LONG_MESSAGES = tuple("A" * length for length in (5000, 20000))
+
+# (label, message text, search result or raised error, expected state, expected last reply)
+HANDLE_SEARCH_CASES = (
+    ("valid keyword", "python", SAMPLE_SEARCH_RESULTS, -1, None),  # ConversationHandler.END
+    ("empty keyword", "", None, 1, "Please enter a keyword."),  # ENTER_KEYWORD state
+    ("search error", "python", Exception("Search error"), -1,
+     "An error occurred during search. Please try again."),
+    ("no results", "python", None, -1, "❌ No results found. Please try again."),
+)
+
+
+def _make_update(text=None, user_id=None, reply_text=None):
+    """Build a stand-in Update whose message replies through reply_text (a fresh AsyncMock by default)"""
+    # The handlers only read these attributes, so plain namespaces replace spec'd mocks
+    return SimpleNamespace(
+        message=SimpleNamespace(text=text, reply_text=reply_text or AsyncMock()),
+        effective_user=SimpleNamespace(id=user_id) if user_id is not None else None,
+    )
+
+
+def _fail_on_call(call_number, error):
+    """Build a side_effect that raises error on the given (1-based) call and returns None otherwise"""
+    calls = 0
+    
+    def side_effect(*args, **kwargs):
+        nonlocal calls
+        calls += 1
+        if calls == call_number:
+            raise error
+    
+    return side_effect
+
+
+def _fake_application(token):
+    """Stand-in for the Application builder; returns a fresh MagicMock app"""
+    return MagicMock()
+
+
+class TestTelegramBot(unittest.IsolatedAsyncioTestCase):
     """Test cases for TelegramBot class"""
 
     def setUp(self):
         """Set up test fixtures"""
-        # Mock the Application to avoid SSL issues during tests
-        with patch('telegram_bot.bot.Application') as mock_app:
-            mock_app.builder.return_value.token.return_value.build.return_value = Mock()
-            self.bot = TelegramBot()
+        self.bot = copy.copy(BOT)
+        self.bot._site_display_names = {}
+        self._settings = SETTINGS_HELPER
+        self._settings.get_site_name.reset_mock()
         
-        # Mock the search service and location service
+        # Mock the services and the results logger so no test writes real logs
         self.bot.search_service = Mock()
         self.bot.location_service = Mock()
+        self.bot.job_results_logger = Mock()
 
     def test_init(self):
         """Test bot initialization"""
-        # Mock environment variables
-        with patch.dict('os.environ', {'TELEGRAM_TOKEN': 'test_token'}):
-            with patch('telegram_bot.bot.Application') as mock_app:
-                mock_app.builder.return_value.token.return_value.build.return_value = Mock()
-                bot = TelegramBot()
-                
-                self.assertEqual(bot.token, 'test_token')
-                self.assertIsNotNone(bot.search_service)
-                self.assertIsNotNone(bot.location_service)
+        bot = TelegramBot(application_factory=_fake_application)
+        
+        self.assertEqual(bot.token, 'test_token')
+        self.assertIsNotNone(bot.search_service)
+        self.assertIsNotNone(bot.location_service)
 
     def test_init_missing_token(self):
         """Test bot initialization with missing token"""
-        with patch.dict('os.environ', {}, clear=True):
+        # Swap the token lookup rather than snapshotting and clearing all of os.environ
+        with patch('telegram_bot.bot.os.getenv', return_value=None):
             with patch('telegram_bot.bot.LoggerHelper'):
-                with patch('telegram_bot.bot.load_dotenv'):
-                    with self.assertRaises(ValueError):
-                        TelegramBot()
+                with self.assertRaises(ValueError):
+                    TelegramBot()
 
-    @patch('telegram_bot.bot.ReplyKeyboardMarkup')
-    def test_start_handler(self, mock_keyboard):
+    async def test_start_handler(self):
         """Test start command handler"""
         # Create mock update and context
-        update = Mock(spec=Update)
-        update.message = Mock(spec=Message)
-        update.message.reply_text = Mock()
+        update = _make_update()
         
         context = Mock(spec=ContextTypes.DEFAULT_TYPE)
         
-        # Mock settings
-        with patch('telegram_bot.bot.settings') as mock_settings:
-            mock_settings.get_site_name.side_effect = lambda x: x.upper()
-            
-            result = self.bot.start(update, context)
-            
-            # Verify reply was sent
-            update.message.reply_text.assert_called_once()
-            self.assertEqual(result, 0)  # SELECT_SITE state
+        result = await self.bot.start(update, context)
+        
+        # Verify reply was sent
+        update.message.reply_text.assert_called_once()
+        self.assertEqual(result, 0)  # SELECT_SITE state
 
-    @patch('telegram_bot.bot.ReplyKeyboardMarkup')
-    def test_start_handler_error(self, mock_keyboard):
+    async def test_start_handler_error(self):
         """Test start command handler with error"""
         # Create mock update and context
-        update = Mock(spec=Update)
-        update.message = Mock(spec=Message)
         # Set up mock to raise exception on first call, return normally on second call
-        update.message.reply_text = Mock(side_effect=[Exception("Test error"), None])
-        
-        context = Mock(spec=ContextTypes.DEFAULT_TYPE)
-        
-        # Mock settings
-        with patch('telegram_bot.bot.settings') as mock_settings:
-            mock_settings.get_site_name.side_effect = lambda x: x.upper()
-            
-            # Temporarily disable the logger to suppress error output
-            original_logger = self.bot.logger
-            self.bot.logger = Mock()
-            
-            try:
-                result = self.bot.start(update, context)
-            finally:
-                self.bot.logger = original_logger
-            
-            # Verify error message was sent (should be called twice - once in try, once in except)
-            self.assertEqual(update.message.reply_text.call_count, 2)
-            self.assertEqual(result, -1)  # ConversationHandler.END
-
-    def test_handle_search_valid_keyword(self):
-        """Test search handler with valid keyword"""
-        # Create mock update and context
-        update = Mock(spec=Update)
-        update.message = Mock(spec=Message)
-        update.message.text = "python"
-        update.message.reply_text = Mock()
-        update.effective_user = Mock(spec=User)
-        update.effective_user.id = 12345
-        
-        context = Mock(spec=ContextTypes.DEFAULT_TYPE)
-        context.user_data = {'sites': ['hh']}
-        
-        # Mock search results
-        mock_results = {
-            'sites': {
-                'hh': {
-                    'jobs': ['Python Developer at Test Corp'],
-                    'timing_ms': 100
-                }
-            },
-            'global_time': 100
-        }
-        self.bot.search_service.search_all_sites.return_value = mock_results
-        
-        # Mock job results logger
-        with patch('telegram_bot.bot.job_results_logger') as mock_logger:
-            result = self.bot.handle_search(update, context)
-            
-            # Verify search was performed
-            self.bot.search_service.search_all_sites.assert_called_once()
-            # Verify results were logged
-            mock_logger.log_search_results.assert_called_once()
-            # Verify conversation ended
-            self.assertEqual(result, -1)  # ConversationHandler.END
-
-    def test_handle_search_empty_keyword(self):
-        """Test search handler with empty keyword"""
-        # Create mock update and context
-        update = Mock(spec=Update)
-        update.message = Mock(spec=Message)
-        update.message.text = ""
-        update.message.reply_text = Mock()
+        update = _make_update(reply_text=AsyncMock(side_effect=_fail_on_call(1, Exception("Test error"))))
         
         context = Mock(spec=ContextTypes.DEFAULT_TYPE)
-        context.user_data = {'sites': ['hh']}
-        
-        result = self.bot.handle_search(update, context)
-        
-        # Verify error message was sent
-        update.message.reply_text.assert_called_with("Please enter a keyword.")
-        self.assertEqual(result, 1)  # ENTER_KEYWORD state
-
-    def test_handle_search_error(self):
-        """Test search handler with error"""
-        # Create mock update and context
-        update = Mock(spec=Update)
-        update.message = Mock(spec=Message)
-        update.message.text = "python"
-        update.message.reply_text = Mock()
-        
-        context = Mock(spec=ContextTypes.DEFAULT_TYPE)
-        context.user_data = {'sites': ['hh']}
-        
-        # Mock search service to raise exception
-        self.bot.search_service.search_all_sites.side_effect = Exception("Search error")
         
         # Temporarily disable the logger to suppress error output
         original_logger = self.bot.logger
         self.bot.logger = Mock()
         
         try:
-            result = self.bot.handle_search(update, context)
+            result = await self.bot.start(update, context)
         finally:
             self.bot.logger = original_logger
         
-        # Verify error message was sent
-        update.message.reply_text.assert_called_with("An error occurred during search. Please try again.")
+        # Verify error message was sent (should be called twice - once in try, once in except)
+        self.assertEqual(update.message.reply_text.call_count, 2)
         self.assertEqual(result, -1)  # ConversationHandler.END
 
-    def test_display_telegram_results_success(self):
+    async def test_handle_search(self):
+        """Test search handler across valid, empty, failing and empty-result searches"""
+        for label, text, search_result, expected_state, expected_reply in HANDLE_SEARCH_CASES:
+            with self.subTest(label):
+                update = _make_update(text=text, user_id=12345)
+                
+                context = Mock(spec=ContextTypes.DEFAULT_TYPE)
+                context.user_data = {'sites': ['hh']}
+                
+                self.bot.search_service = Mock(search_all_sites_async=AsyncMock())
+                if isinstance(search_result, Exception):
+                    self.bot.search_service.search_all_sites_async.side_effect = search_result
+                else:
+                    self.bot.search_service.search_all_sites_async.return_value = search_result
+                self.bot.job_results_logger.reset_mock()
+                
+                # Temporarily disable the logger to suppress error output
+                original_logger = self.bot.logger
+                self.bot.logger = Mock()
+                
+                try:
+                    result = await self.bot.handle_search(update, context)
+                finally:
+                    self.bot.logger = original_logger
+                
+                self.assertEqual(result, expected_state)
+                if expected_reply is not None:
+                    update.message.reply_text.assert_called_with(expected_reply)
+                if text:
+                    self.bot.search_service.search_all_sites_async.assert_awaited_once_with(text, None, ['hh'])
+                else:
+                    self.bot.search_service.search_all_sites_async.assert_not_called()
+                if isinstance(search_result, dict):
+                    # Verify results were logged
+                    self.bot.job_results_logger.log_search_results.assert_called_once()
+
+    async def test_display_telegram_results_success(self):
         """Test displaying successful search results"""
         # Create mock update
-        update = Mock(spec=Update)
-        update.message = Mock(spec=Message)
-        update.message.reply_text = Mock()
+        update = _make_update()
         
         # Mock search results
         results = {
@@ -202,17 +196,15 @@ class TestTelegramBot(unittest.TestCase):
             'global_time': 150
         }
         
-        self.bot._display_telegram_results(update, results)
+        await self.bot._display_telegram_results(update, results)
         
         # Verify that messages were sent
         update.message.reply_text.assert_called()
 
-    def test_display_telegram_results_empty(self):
+    async def test_display_telegram_results_empty(self):
         """Test displaying empty search results"""
         # Create mock update
-        update = Mock(spec=Update)
-        update.message = Mock(spec=Message)
-        update.message.reply_text = Mock()
+        update = _make_update()
         
         # Mock empty results
         results = {
@@ -220,40 +212,27 @@ class TestTelegramBot(unittest.TestCase):
             'global_time': 0
         }
         
-        self.bot._display_telegram_results(update, results)
+        await self.bot._display_telegram_results(update, results)
         
         # Verify that no results message was sent
         update.message.reply_text.assert_called_with("❌ No results found. Please try again.")
 
-    def test_display_telegram_results_invalid(self):
+    async def test_display_telegram_results_invalid(self):
         """Test displaying invalid search results"""
         # Create mock update
-        update = Mock(spec=Update)
-        update.message = Mock(spec=Message)
-        update.message.reply_text = Mock()
+        update = _make_update()
         
         # Mock invalid results
         results = None
         
-        self.bot._display_telegram_results(update, results)
+        await self.bot._display_telegram_results(update, results)
         
         # Verify that error message was sent
         update.message.reply_text.assert_called_with("❌ No results found. Please try again.")
 
     def test_build_result_messages(self):
         """Test building result messages"""
-        # Mock search results
-        results = {
-            'sites': {
-                'hh': {
-                    'jobs': ['Python Developer at Test Corp'],
-                    'timing_ms': 100
-                }
-            },
-            'global_time': 100
-        }
-        
-        messages = self.bot._build_result_messages(results)
+        messages = self.bot._build_result_messages(SAMPLE_SEARCH_RESULTS)
         
         # Verify messages were built
         self.assertIsInstance(messages, list)
@@ -261,14 +240,12 @@ class TestTelegramBot(unittest.TestCase):
 
     def test_get_site_display_name(self):
         """Test getting site display name"""
-        # Mock the settings module at the path where it's imported inside the method
-        with patch('helpers.SettingsHelper') as mock_settings:
-            mock_settings.get_site_name.return_value = "HeadHunter"
-            
+        # Override the class-wide upper-casing stub for this lookup
+        with patch.object(self._settings, 'get_site_name', return_value="HeadHunter") as get_site_name:
             result = self.bot._get_site_display_name('hh')
             
             self.assertEqual(result, "HeadHunter")
-            mock_settings.get_site_name.assert_called_with('hh')
+            get_site_name.assert_called_with('hh')
 
     def test_clean_job_text(self):
         """Test job text cleaning"""
@@ -281,51 +258,42 @@ class TestTelegramBot(unittest.TestCase):
 
     def test_split_message(self):
         """Test message splitting"""
-        long_message = "A" * 5000  # Very long message
-        
-        split_messages = self.bot._split_message(long_message, 1000)
-        
-        # Verify messages were split
-        self.assertIsInstance(split_messages, list)
-        self.assertTrue(len(split_messages) > 1)
-        
-        # Verify each message is within limit
-        for message in split_messages:
-            self.assertLessEqual(len(message), 1000)
+        for long_message in LONG_MESSAGES:
+            with self.subTest(length=len(long_message)):
+                split_messages = self.bot._split_message(long_message, 1000)
+                
+                # Verify messages were split
+                self.assertIsInstance(split_messages, list)
+                self.assertTrue(len(split_messages) > 1)
+                
+                # Verify each message is within limit
+                for message in split_messages:
+                    self.assertLessEqual(len(message), 1000)
 
-    def test_handle_site_selection(self):
+    async def test_handle_site_selection(self):
         """Test site selection handler"""
         # Create mock update and context
-        update = Mock(spec=Update)
-        update.message = Mock(spec=Message)
-        update.message.text = "HH"
-        update.message.reply_text = Mock()
+        update = _make_update(text="HH")
         
         context = Mock(spec=ContextTypes.DEFAULT_TYPE)
         context.user_data = {}
         
-        # Mock settings
-        with patch('telegram_bot.bot.settings') as mock_settings:
-            mock_settings.get_site_name.side_effect = lambda x: x.upper()
-            
-            result = self.bot.handle_site_selection(update, context)
-            
-            # Verify site was stored in context
-            self.assertEqual(context.user_data['sites'], ['hh'])
-            # Verify message was sent
-            update.message.reply_text.assert_called()
-            self.assertEqual(result, 1)  # ENTER_KEYWORD state
+        result = await self.bot.handle_site_selection(update, context)
+        
+        # Verify site was stored in context
+        self.assertEqual(context.user_data['sites'], ['hh'])
+        # Verify message was sent
+        update.message.reply_text.assert_called()
+        self.assertEqual(result, 1)  # ENTER_KEYWORD state
 
-    def test_cancel_handler(self):
+    async def test_cancel_handler(self):
         """Test cancel command handler"""
         # Create mock update and context
-        update = Mock(spec=Update)
-        update.message = Mock(spec=Message)
-        update.message.reply_text = Mock()
+        update = _make_update()
         
         context = Mock(spec=ContextTypes.DEFAULT_TYPE)
         
-        result = self.bot.cancel(update, context)
+        result = await self.bot.cancel(update, context)
         
         # Verify cancel message was sent
         update.message.reply_text.assert_called_with("Search cancelled. Use /start to begin again.")
@@ -409,26 +377,22 @@ class TestTelegramBot(unittest.TestCase):
         self.assertIsInstance(formatted, str)
         self.assertIn("Python Developer", formatted)
 
-    def test_send_messages_safely(self):
+    async def test_send_messages_safely(self):
         """Test safe message sending"""
         # Create mock update
-        update = Mock(spec=Update)
-        update.message = Mock(spec=Message)
-        update.message.reply_text = Mock()
+        update = _make_update()
         
         messages = ["Message 1", "Message 2", "Message 3"]
         
-        self.bot._send_messages_safely(update, messages)
+        await self.bot._send_messages_safely(update, messages)
         
         # Verify all messages were sent
         self.assertEqual(update.message.reply_text.call_count, 3)
 
-    def test_send_messages_safely_with_error(self):
+    async def test_send_messages_safely_with_error(self):
         """Test safe message sending with error"""
         # Create mock update
-        update = Mock(spec=Update)
-        update.message = Mock(spec=Message)
-        update.message.reply_text = Mock(side_effect=[None, Exception("Error"), None])
+        update = _make_update(reply_text=AsyncMock(side_effect=_fail_on_call(2, Exception("Error"))))
         
         messages = ["Message 1", "Message 2", "Message 3"]
         
@@ -438,166 +402,227 @@ class TestTelegramBot(unittest.TestCase):
         
         try:
             # Should not raise exception
-            self.bot._send_messages_safely(update, messages)
+            await self.bot._send_messages_safely(update, messages)
         finally:
             self.bot.logger = original_logger
         
         # Verify some messages were sent
         self.assertGreater(update.message.reply_text.call_count, 0)
 
-    def test_error_handling(self):
-        """Test error handling in various scenarios"""
-        # Test with None results
-        self.bot.search_service.search_all_sites.return_value = None
-        
-        # Create mock update and context
-        update = Mock(spec=Update)
-        update.message = Mock(spec=Message)
-        update.message.text = "python"
-        update.message.reply_text = Mock()
-        
-        context = Mock(spec=ContextTypes.DEFAULT_TYPE)
-        context.user_data = {'sites': ['hh']}
-        
-        result = self.bot.handle_search(update, context)
-        
-        # Should handle None results gracefully
-        self.assertEqual(result, -1)  # ConversationHandler.END
-
     def test_logging_functionality(self):
         """Test that logging works correctly"""
         # Mock logger to verify calls
         with patch('telegram_bot.bot.LoggerHelper') as mock_logger:
-            with patch.dict('os.environ', {'TELEGRAM_TOKEN': 'test_token'}):
-                with patch('telegram_bot.bot.load_dotenv'):
-                    bot = TelegramBot()
-                    
-                    # Verify logger was initialized
-                    mock_logger.get_logger.assert_called()
+            bot = TelegramBot()
+            
+            # Verify logger was initialized
+            mock_logger.get_logger.assert_called()
 
     def test_site_initialization(self):
         """Test that all sites are properly initialized"""
-        # Mock environment variables
-        with patch.dict('os.environ', {'TELEGRAM_TOKEN': 'test_token'}):
-            with patch('telegram_bot.bot.LoggerHelper'):
-                with patch('telegram_bot.bot.load_dotenv'):
-                    bot = TelegramBot()
-                    
-                    # Check that all expected sites are available
-                    self.assertIn('hh', bot.sites)
-                    self.assertIn('geekjob', bot.sites)
-                    
-                    # Check that sites have required attributes
-                    for site_id, site in bot.sites.items():
-                        self.assertIsNotNone(site)
-                        self.assertTrue(hasattr(site, 'search_jobs'))
-
-
-class TestTelegramBotIntegration(unittest.TestCase):
-    """Integration tests for Telegram bot"""
-
-    def setUp(self):
-        """Set up integration test fixtures"""
-        with patch.dict('os.environ', {'TELEGRAM_TOKEN': 'test_token'}):
-            with patch('telegram_bot.bot.LoggerHelper'):
-                with patch('telegram_bot.bot.load_dotenv'):
-                    self.bot = TelegramBot()
-
-    def test_full_search_workflow(self):
-        """Test complete search workflow"""
-        # Mock search service
-        mock_service = Mock()
-        mock_service.search_all_sites.return_value = {
-            'sites': {
-                'hh': {
-                    'jobs': ['Python Developer at Test Corp'],
-                    'timing_ms': 100
-                }
-            },
-            'global_time': 100
-        }
-        self.bot.search_service = mock_service
-        
-        # Create mock update and context
-        update = Mock(spec=Update)
-        update.message = Mock(spec=Message)
-        update.message.text = "python"
-        update.message.reply_text = Mock()
-        update.effective_user = Mock(spec=User)
-        update.effective_user.id = 12345
-        
-        context = Mock(spec=ContextTypes.DEFAULT_TYPE)
-        context.user_data = {'sites': ['hh']}
-        
-        # Mock job results logger
-        with patch('telegram_bot.bot.job_results_logger') as mock_logger:
-            result = self.bot.handle_search(update, context)
+        with patch('telegram_bot.bot.LoggerHelper'):
+            bot = TelegramBot()
             
-            # Verify search was performed
-            mock_service.search_all_sites.assert_called_once_with("python", None, ['hh'])
-            # Verify results were logged
-            mock_logger.log_search_results.assert_called_once()
-            # Verify conversation ended
-            self.assertEqual(result, -1)  # ConversationHandler.END
+            # Check that all expected sites are available
+            self.assertIn('hh', bot.sites)
+            self.assertIn('geekjob', bot.sites)
+            
+            # Check that sites have required attributes
+            for site_id, site in bot.sites.items():
+                self.assertIsNotNone(site)
+                self.assertTrue(hasattr(site, 'search_jobs'))
+
 
     def test_settings_integration(self):
         """Test integration with settings"""
         # Verify that bot uses correct settings
         self.assertEqual(Settings.get_default_site_choices(), ['hh', 'geekjob'])
-        self.assertIn('hh', Settings.get_available_sites())
-        self.assertIn('geekjob', Settings.get_available_sites())
+        sites = Settings.get_available_sites()
+        self.assertIn('hh', sites)
+        self.assertIn('geekjob', sites)
 
-    def test_application_initialization(self):
-        """Test that Telegram application is properly initialized"""
+    def test_static_config(self):
+        """Test application wiring and conversation state constants on the shared bot"""
+        from telegram_bot.bot import SELECT_SITE, ENTER_KEYWORD
+        
         self.assertIsNotNone(self.bot.application)
-        self.assertIsNotNone(self.bot.dp)
+        self.assertIs(self.bot.dp, self.bot.application)
+        # Handlers were registered on the application during initialization
+        self.bot.application.add_handler.assert_called()
+        self.assertEqual(SELECT_SITE, 0)
+        self.assertEqual(ENTER_KEYWORD, 1)
 
-    def test_handler_setup(self):
-        """Test that handlers are properly set up"""
-        # Mock the setup_handlers function
-        with patch('telegram_bot.handlers.setup_handlers') as mock_setup:
-            bot = TelegramBot()
-            
-            # Verify setup_handlers was called during initialization
-            mock_setup.assert_called_once()
+    def test_run_method(self):
+        """Test the run method"""
+        # Create bot with a fake application
+        mock_app_instance = MagicMock()
+        bot = TelegramBot(application_factory=lambda token: mock_app_instance)
+        
+        # Call run method
+        bot.run()
+        
+        # Verify run_polling was called
+        mock_app_instance.run_polling.assert_called_once()
 
 
-class TestTelegramBotAsync(unittest.TestCase):
-    """Async tests for Telegram bot"""
+class TestTypingIndicator(unittest.IsolatedAsyncioTestCase):
+    """Test cases for the typing_indicator handler decorator"""
 
     def setUp(self):
-        """Set up async test fixtures"""
-        # Mock the Application to avoid SSL issues during tests
-        with patch('telegram_bot.bot.Application') as mock_app:
-            mock_app.builder.return_value.token.return_value.build.return_value = Mock()
-            self.bot = TelegramBot()
-
-    @patch('telegram_bot.bot.Application')
-    def test_run_method(self, mock_application):
-        """Test the run method"""
-        # Mock the application instance
-        mock_app_instance = Mock()
-        mock_application.builder.return_value.token.return_value.build.return_value = mock_app_instance
-        
-        # Mock the run_polling method
-        mock_app_instance.run_polling = Mock()
-        
-        # Create bot with mocked application
-        with patch.dict('os.environ', {'TELEGRAM_TOKEN': 'test_token'}):
-            bot = TelegramBot()
-            
-            # Call run method
-            bot.run()
-            
-            # Verify run_polling was called
-            mock_app_instance.run_polling.assert_called_once()
+        """Set up a chat update and a context whose bot records the task sending chat actions"""
+        self.update = SimpleNamespace(effective_chat=SimpleNamespace(id=42))
+        self.send_error = None
+        self.typing_tasks = []
+        self.context = SimpleNamespace(
+            bot=SimpleNamespace(send_chat_action=AsyncMock(side_effect=self._send_chat_action))
+        )
+
+    async def _send_chat_action(self, chat_id, action):
+        """Record the calling (typing) task, then fail with send_error if set"""
+        self.typing_tasks.append(asyncio.current_task())
+        if self.send_error:
+            raise self.send_error
+
+    async def _handler(self, update, context):
+        """Handler body that yields once so the typing task can run"""
+        await asyncio.sleep(0)
+        return 'done'
+
+    async def test_typing_task_cancelled_after_handler(self):
+        """Test the typing task is started for the handler and cancelled once it returns"""
+        handler = AsyncMock(side_effect=self._handler)
+        
+        result = await typing_indicator(handler)(self.update, self.context)
+        await asyncio.sleep(0)
+        
+        self.assertEqual(result, 'done')
+        handler.assert_awaited_once_with(self.update, self.context)
+        self.context.bot.send_chat_action.assert_awaited_once_with(42, ChatAction.TYPING)
+        self.assertEqual(len(self.typing_tasks), 1)
+        self.assertTrue(self.typing_tasks[0].cancelled())
+
+    def test_decorator_keeps_handler_metadata(self):
+        """Test the decorated handler keeps the wrapped handler's name and docstring"""
+        async def sample_handler(update, context):
+            """Sample handler docstring"""
+        
+        decorated = typing_indicator(sample_handler)
+        
+        self.assertEqual(decorated.__name__, 'sample_handler')
+        self.assertEqual(decorated.__doc__, "Sample handler docstring")
+        self.assertTrue(asyncio.iscoroutinefunction(decorated))
+
+    async def test_typing_task_cancelled_when_handler_raises(self):
+        """Test the typing task is cancelled even when the handler fails"""
+        async def failing_handler(update, context):
+            await asyncio.sleep(0)
+            raise ValueError("boom")
+        
+        with self.assertRaises(ValueError):
+            await typing_indicator(failing_handler)(self.update, self.context)
+        await asyncio.sleep(0)
+        
+        self.assertTrue(self.typing_tasks[0].cancelled())
+
+    async def test_typing_stops_quietly_on_telegram_error(self):
+        """Test a refused chat action ends the typing task without an unretrieved exception"""
+        self.send_error = TelegramError("Flood control exceeded")
+        handler = AsyncMock(side_effect=self._handler)
+        
+        result = await typing_indicator(handler)(self.update, self.context)
+        
+        self.assertEqual(result, 'done')
+        task = self.typing_tasks[0]
+        self.assertTrue(task.done())
+        self.assertFalse(task.cancelled())
+        self.assertIsNone(task.exception())
+
+
+class TestVacancyCache(unittest.TestCase):
+    """Test cases for the /vacancy TTL/LRU message cache"""
 
-    def test_conversation_states(self):
-        """Test conversation state constants"""
-        from telegram_bot import SELECT_SITE, ENTER_KEYWORD
-        
-        self.assertEqual(SELECT_SITE, 0)
-        self.assertEqual(ENTER_KEYWORD, 1)
+    def setUp(self):
+        """Start each test with an empty cache, a small size limit and a controllable clock"""
+        self.now = 1000.0
+        for patcher in (
+            patch.object(handlers_main, '_vacancy_cache', OrderedDict()),
+            patch.object(handlers_main, 'VACANCY_CACHE_SIZE', 2),
+            patch.object(handlers_main, 'VACANCY_CACHE_TTL', 60),
+            patch('telegram_bot.handlers_main.time.monotonic', side_effect=lambda: self.now),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_hit(self):
+        """Test a cached message is returned before it expires"""
+        handlers_main._cache_vacancy(('hh', '1'), "message 1")
+        self.now += 59
+        
+        self.assertEqual(handlers_main._get_cached_vacancy(('hh', '1')), "message 1")
+        self.assertIsNone(handlers_main._get_cached_vacancy(('hh', '2')))
+
+    def test_expiry(self):
+        """Test an expired entry is a miss and is deleted from the cache"""
+        handlers_main._cache_vacancy(('hh', '1'), "message 1")
+        self.now += 61
+        
+        self.assertIsNone(handlers_main._get_cached_vacancy(('hh', '1')))
+        self.assertNotIn(('hh', '1'), handlers_main._vacancy_cache)
+
+    def test_eviction_order(self):
+        """Test the least recently used entry is evicted, counting hits as uses"""
+        handlers_main._cache_vacancy(('hh', '1'), "message 1")
+        handlers_main._cache_vacancy(('hh', '2'), "message 2")
+        # A hit moves the first entry to the most recently used end
+        handlers_main._get_cached_vacancy(('hh', '1'))
+        handlers_main._cache_vacancy(('geekjob', '3'), "message 3")
+        
+        self.assertEqual(list(handlers_main._vacancy_cache), [('hh', '1'), ('geekjob', '3')])
+        self.assertIsNone(handlers_main._get_cached_vacancy(('hh', '2')))
+
+    def test_recache_refreshes_entry(self):
+        """Test caching an existing key renews its expiry and recency"""
+        handlers_main._cache_vacancy(('hh', '1'), "old")
+        handlers_main._cache_vacancy(('hh', '2'), "message 2")
+        self.now += 50
+        handlers_main._cache_vacancy(('hh', '1'), "new")
+        self.now += 50
+        
+        self.assertEqual(list(handlers_main._vacancy_cache), [('hh', '2'), ('hh', '1')])
+        self.assertEqual(handlers_main._get_cached_vacancy(('hh', '1')), "new")
+        self.assertIsNone(handlers_main._get_cached_vacancy(('hh', '2')))
+
+
+# Built once in setUpModule; tests work on shallow copies so their mocks never leak
+BOT = None
+SETTINGS_HELPER = None
+_PATCHERS = (
+    # Test token, and no .env loading
+    patch.dict('os.environ', {'TELEGRAM_TOKEN': 'test_token'}),
+    patch('telegram_bot.bot.load_dotenv'),
+    # Site names resolve to their upper-cased ids and the reply keyboard is never
+    # really built; tests needing other names override locally
+    patch('telegram_bot.bot.SettingsHelper'),
+    patch('telegram_bot.bot.ReplyKeyboardMarkup'),
+)
+
+
+def setUpModule():
+    """Patch the environment and build the shared bot once for the whole module"""
+    global BOT, SETTINGS_HELPER
+    started = [patcher.start() for patcher in _PATCHERS]
+    SETTINGS_HELPER = started[2]
+    SETTINGS_HELPER.get_site_name.side_effect = str.upper
+    
+    # Fake the Application to avoid SSL issues during tests
+    BOT = TelegramBot(application_factory=_fake_application)
+
+
+def tearDownModule():
+    """Undo the module-wide patches"""
+    # tearDownModule rather than addModuleCleanup: pytest never runs module cleanups
+    for patcher in reversed(_PATCHERS):
+        patcher.stop()
 
 
 if __name__ == '__main__':
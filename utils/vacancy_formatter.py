@@ -2,11 +2,91 @@
 Vacancy data formatter for Telegram messages.
 Centralizes all vacancy formatting logic for telegram display.
 """
+import re
+import sys
+from datetime import datetime
+from functools import lru_cache
 from typing import Dict, Optional
-from helpers import ConfigHelper, LocalizationHelper, LoggerHelper
+from helpers import LocalizationHelper, LoggerHelper, config_helper
+from helpers.constants import DATE_ICON, JOB_ICON, LOCATION_ICON, SALARY_ICON, WORK_FORMAT_ICON
 
 logger = LoggerHelper.get_logger(__name__, prefix='vacancy-formatter')
 
+# Any HTML tag, and runs of HTML (ASCII) whitespace
+_TAG_RE = re.compile(r'<[^>]+>')
+_WS_RE = re.compile(r'[ \t\r\n\f\v]+')
+
+# Only a short preview of the description is shown, so raw HTML is cut to a few
+# times the preview length (tags included) before it is cleaned; the cut grows until
+# the cleaned text is longer than the preview, so a cut description always gets "..."
+DESCRIPTION_PREVIEW_LENGTH = 300
+DESCRIPTION_HTML_LIMIT = 2048
+
+# Line prefixes for the Telegram vacancy message
+_PREFIX_TITLE = "🎯 "
+_PREFIX_SKL = "🔧 "
+_PREFIX_DATE = DATE_ICON + " "
+_PREFIX_DESC = "\n📝 "
+
+# Plain (key, prefix) lines emitted after the company, in display order
+_MESSAGE_FIELDS = (
+    ('location', LOCATION_ICON + " "),
+    ('salary', SALARY_ICON + " "),
+    ('experience', JOB_ICON + " "),
+    ('employment', WORK_FORMAT_ICON + " "),
+)
+
+# Shared stand-in for missing or null nested objects; never mutated
+_EMPTY: Dict = {}
+
+# HH currency codes to display symbols; unknown codes are shown as-is
+_CURRENCY_SYMBOLS = {
+    'RUR': '₽',
+    'USD': '$',
+    'EUR': '€',
+    'KZT': '₸',
+    'UAH': '₴',
+    'BYR': 'Br'
+}
+
+
+# Site URL lookups walk the site config on every call; the config is static
+@lru_cache(maxsize=None)
+def _site_web_url(site_id: str) -> str:
+    """Get the cached web URL for a site."""
+    return config_helper.get_site_web_url(site_id)
+
+
+@lru_cache(maxsize=1024)
+def _site_employer_url(site_id: str, employer_id) -> str:
+    """Get the cached employer URL for a site."""
+    return config_helper.get_site_employer_url(site_id, employer_id)
+
+
+@lru_cache(maxsize=1024)
+def _site_logo_url(site_id: str, company_id, logo_filename: str) -> str:
+    """Get the cached company logo URL for a site."""
+    return config_helper.get_site_logo_url(site_id, company_id, logo_filename)
+
+
+def _intern(value):
+    """Intern small-vocabulary API strings so cached vacancies share one copy."""
+    return sys.intern(value) if type(value) is str else value
+
+
+@lru_cache(maxsize=4096)
+def _format_publication_date(date_str: str) -> str:
+    """Format publication date for display; cached since many vacancies share timestamps."""
+    if not date_str:
+        return ""
+    
+    try:
+        # Parse ISO format date
+        dt = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
+        return dt.strftime('%d.%m.%Y')
+    except Exception:
+        return date_str
+
 
 class VacancyTelegramFormatter:
     """
@@ -57,18 +137,18 @@ class VacancyTelegramFormatter:
         # Extract basic information
         vacancy_id = vacancy_data.get('id')
         title = vacancy_data.get('name', '')
-        company = vacancy_data.get('employer', {}).get('name', '')
         link = vacancy_data.get('alternate_url', '')
         
         # Extract employer information
-        employer = vacancy_data.get('employer', {})
+        employer = vacancy_data.get('employer') or _EMPTY
+        company = employer.get('name', '')
         employer_id = employer.get('id')
         employer_link = None
         if employer_id:
-            employer_link = ConfigHelper.get_site_employer_url('hh', employer_id)
+            employer_link = _site_employer_url('hh', employer_id)
         
         # Format salary
-        salary = VacancyTelegramFormatter._format_hh_salary(vacancy_data.get('salary', {}))
+        salary = VacancyTelegramFormatter._format_hh_salary(vacancy_data.get('salary'))
         
         # Process location
         location = VacancyTelegramFormatter._process_hh_location(vacancy_data)
@@ -77,17 +157,19 @@ class VacancyTelegramFormatter:
         schedule = VacancyTelegramFormatter._process_hh_schedule(vacancy_data)
         
         # Extract experience and employment
-        experience = vacancy_data.get('experience', {}).get('name', '')
-        employment = vacancy_data.get('employment', {}).get('name', '')
+        experience = vacancy_data.get('experience')
+        experience = _intern(experience.get('name', '')) if experience else ''
+        employment = vacancy_data.get('employment')
+        employment = _intern(employment.get('name', '')) if employment else ''
         
         # Extract key skills
-        key_skills = vacancy_data.get('key_skills', [])
-        skills = [skill.get('name', '') for skill in key_skills if skill.get('name')]
+        key_skills = vacancy_data.get('key_skills') or ()
+        skills = [name for skill in key_skills if (name := skill.get('name'))]
         
         # Extract description and clean HTML
         description = vacancy_data.get('description', '')
         if description:
-            description = VacancyTelegramFormatter._clean_html_tags(description)
+            description = VacancyTelegramFormatter._clean_description(description)
         
         # Extract publication date
         pub_date = VacancyTelegramFormatter._format_publication_date(vacancy_data.get('published_at'))
@@ -95,7 +177,7 @@ class VacancyTelegramFormatter:
         # Extract logo URL
         logo_url = None
         if employer:
-            logo_urls = employer.get('logo_urls', {})
+            logo_urls = employer.get('logo_urls')
             if logo_urls:
                 logo_url = logo_urls.get('original') or logo_urls.get('240')
         
@@ -125,21 +207,21 @@ class VacancyTelegramFormatter:
         title = vacancy_data.get('position', '')
         
         # Company information
-        company_data = vacancy_data.get('company', {})
+        company_data = vacancy_data.get('company') or _EMPTY
         company = company_data.get('name', '')
         company_id = company_data.get('id')
         company_link = None
         if company_id:
-            company_link = ConfigHelper.get_site_employer_url('geekjob', company_id)
+            company_link = _site_employer_url('geekjob', company_id)
         
         # Job link
-        link = f"{ConfigHelper.get_site_web_url('geekjob')}/{vacancy_id}"
+        link = f"{_site_web_url('geekjob')}/{vacancy_id}"
         
         # Salary
         salary = vacancy_data.get('salary', '')
         
         # Work format
-        job_format = vacancy_data.get('jobFormat', {})
+        job_format = vacancy_data.get('jobFormat') or _EMPTY
         format_parts = []
         if job_format.get('remote'):
             format_parts.append('Remote')
@@ -162,14 +244,14 @@ class VacancyTelegramFormatter:
         location = ", ".join(location_parts) if location_parts else ""
         
         # Publication date
-        log_info = vacancy_data.get('log', {})
-        pub_date = log_info.get('modify', '')
+        log_info = vacancy_data.get('log')
+        pub_date = log_info.get('modify', '') if log_info else ''
         
         # Logo URL
         logo_url = None
         logo_filename = company_data.get('logo')
         if company_id and logo_filename:
-            logo_url = ConfigHelper.get_site_logo_url('geekjob', company_id, logo_filename)
+            logo_url = _site_logo_url('geekjob', company_id, logo_filename)
         
         return {
             'id': vacancy_id,
@@ -216,53 +298,41 @@ class VacancyTelegramFormatter:
             else:
                 title_with_link = f"<a href=\"{link}\">{title}</a>"
             
-            parts = [f"🎯 {title_with_link}\n"]
+            parts = [_PREFIX_TITLE + title_with_link + "\n"]
+            append = parts.append
             
             # Company with link
             company = vacancy_data.get('company', '')
             employer_link = vacancy_data.get('employer_link', '')
             
             if company and employer_link:
-                parts.append(f"<a href=\"{employer_link}\">@{company}</a>")
+                append(f"<a href=\"{employer_link}\">@{company}</a>")
             elif company:
-                parts.append(f"@{company}")
-            
-            # Location
-            location = vacancy_data.get('location', '')
-            if location:
-                parts.append(f"📍 {location}")
-            
-            # Salary
-            salary = vacancy_data.get('salary', '')
-            if salary:
-                parts.append(f"💰 {salary}")
+                append("@" + company)
             
-            # Experience
-            experience = vacancy_data.get('experience', '')
-            if experience:
-                parts.append(f"💼 {experience}")
-            
-            # Employment type
-            employment = vacancy_data.get('employment', '')
-            if employment:
-                parts.append(f"⏰ {employment}")
+            # Location, salary, experience and employment type
+            for key, prefix in _MESSAGE_FIELDS:
+                value = vacancy_data.get(key)
+                if value:
+                    append(prefix + str(value))
             
             # Skills
             skills = vacancy_data.get('skills', [])
             if skills:
-                skills_text = ", ".join(skills[:5])  # Limit to 5 skills
-                parts.append(f"🔧 {skills_text}")
+                append(_PREFIX_SKL + ", ".join(skills[:5]))  # Limit to 5 skills
             
             # Publication date
             pub_date = vacancy_data.get('pub_date', '')
             if pub_date:
-                parts.append(f"📅 {pub_date}")
+                append(_PREFIX_DATE + pub_date)
             
             # Description (truncated)
             description = vacancy_data.get('description', '')
             if description:
-                truncated_desc = description[:300] + "..." if len(description) > 300 else description
-                parts.append(f"\n📝 {truncated_desc}")
+                if len(description) > DESCRIPTION_PREVIEW_LENGTH:
+                    append(_PREFIX_DESC + description[:DESCRIPTION_PREVIEW_LENGTH] + "...")
+                else:
+                    append(_PREFIX_DESC + description)
             
             return "\n".join(parts)
             
@@ -281,16 +351,7 @@ class VacancyTelegramFormatter:
         currency = salary_data.get('currency', 'RUR')
         gross = salary_data.get('gross', True)
         
-        # Currency mapping
-        currency_map = {
-            'RUR': '₽',
-            'USD': '$',
-            'EUR': '€',
-            'KZT': '₸',
-            'UAH': '₴',
-            'BYR': 'Br'
-        }
-        currency_symbol = currency_map.get(currency, currency)
+        currency_symbol = _CURRENCY_SYMBOLS.get(currency, currency)
         
         if salary_from and salary_to:
             salary_text = f"{salary_from:,} — {salary_to:,} {currency_symbol}"
@@ -309,46 +370,47 @@ class VacancyTelegramFormatter:
     @staticmethod
     def _process_hh_location(vacancy_data: Dict) -> str:
         """Process HeadHunter location information."""
-        area = vacancy_data.get('area', {})
+        area = vacancy_data.get('area')
         if area:
-            return area.get('name', '')
+            return _intern(area.get('name', ''))
         return ""
     
     @staticmethod
     def _process_hh_schedule(vacancy_data: Dict) -> str:
         """Process HeadHunter schedule information."""
-        schedule = vacancy_data.get('schedule', {})
+        schedule = vacancy_data.get('schedule')
         if schedule:
             schedule_name = schedule.get('name', '')
-            if 'удален' in schedule_name.lower() or 'remote' in schedule_name.lower():
+            name_lower = schedule_name.lower()
+            if 'удален' in name_lower or 'remote' in name_lower:
                 return 'Remote'
-            return schedule_name
+            return _intern(schedule_name)
         return ""
     
+    @staticmethod
+    def _clean_description(description: str) -> str:
+        """Clean just enough of the description HTML to fill more than the preview."""
+        limit = DESCRIPTION_HTML_LIMIT
+        while len(description) > limit:
+            cut = description[:limit]
+            # Drop a tag the cut left open
+            lt = cut.rfind('<')
+            if lt > cut.rfind('>'):
+                cut = cut[:lt]
+            text = VacancyTelegramFormatter._clean_html_tags(cut)
+            if len(text) > DESCRIPTION_PREVIEW_LENGTH:
+                return text
+            limit *= 2
+        return VacancyTelegramFormatter._clean_html_tags(description)
+    
     @staticmethod
     def _clean_html_tags(text: str) -> str:
         """Clean HTML tags from text."""
-        import re
-        
-        # Remove all HTML tags
-        text = re.sub(r'<[^>]+>', '', text)
-        
-        # Clean up extra whitespace
-        text = re.sub(r'\s+', ' ', text)
-        text = text.strip()
-        
-        return text
+        # Tag-free text only needs the whitespace pass; no tag can end past the
+        # last '>', so unclosed '<' in the tail never make the regex rescan it
+        if '<' in text:
+            end = text.rfind('>') + 1
+            text = _TAG_RE.sub('', text[:end]) + text[end:]
+        return _WS_RE.sub(' ', text).strip()
     
-    @staticmethod
-    def _format_publication_date(date_str: str) -> str:
-        """Format publication date for display."""
-        if not date_str:
-            return ""
-        
-        try:
-            from datetime import datetime
-            # Parse ISO format date
-            dt = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
-            return dt.strftime('%d.%m.%Y')
-        except Exception:
-            return date_str
\ No newline at end of file
+    _format_publication_date = staticmethod(_format_publication_date)
\ No newline at end of file
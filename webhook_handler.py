@@ -2,15 +2,19 @@ import os
 import requests
 from dotenv import load_dotenv
 from helpers import LoggerHelper
-import json
+from config.urls import load_urls_config
 
 load_dotenv()
 logger = LoggerHelper.get_logger(__name__, prefix='webhook')
 
+# Reused across calls so repeated configuration keeps the connection to the Telegram API alive
+_SESSION = requests.Session()
+REQUEST_TIMEOUT = 10
+
 def configure_webhook():
     """Configure Telegram webhook without secret token"""
     TELEGRAM_TOKEN = os.getenv('TELEGRAM_TOKEN')
-    TELEGRAM_WEBHOOK_URL = os.getenv('TELEGRAM_WEBHOOK_URL')
+    TELEGRAM_WEBHOOK_URL = os.getenv('TELEGRAM_WEBHOOK_URL') or os.getenv('WEBHOOK_URL')
 
     if not TELEGRAM_TOKEN:
         logger.error("TELEGRAM_TOKEN must be set in .env")
@@ -20,22 +24,19 @@ def configure_webhook():
         return False
 
     try:
-        # Set webhook using configuration
-        try:
-            with open('config/urls.json', 'r', encoding='utf-8') as f:
-                config = json.load(f)
-                webhook_template = config.get('external_services', {}).get('telegram_api', {}).get('webhook', '')
-                if webhook_template:
-                    webhook_url = webhook_template.format(token=TELEGRAM_TOKEN)
-                else:
-                    webhook_url = f"https://api.telegram.org/bot{TELEGRAM_TOKEN}/setWebhook"
-        except (FileNotFoundError, json.JSONDecodeError):
+        # Set webhook using configuration (urls.json is parsed once and cached by mtime)
+        config = load_urls_config()
+        webhook_template = config.get('external_services', {}).get('telegram_api', {}).get('webhook', '')
+        if webhook_template:
+            webhook_url = webhook_template.format(token=TELEGRAM_TOKEN)
+        else:
             # Fallback to hardcoded URL
             webhook_url = f"https://api.telegram.org/bot{TELEGRAM_TOKEN}/setWebhook"
         
-        response = requests.post(
+        response = _SESSION.post(
             webhook_url,
-            json={"url": TELEGRAM_WEBHOOK_URL}
+            json={"url": TELEGRAM_WEBHOOK_URL},
+            timeout=REQUEST_TIMEOUT
         )
 
         result = response.json()
@@ -2,17 +2,21 @@
 Webhook server for Telegram bot.
 """
 import asyncio
+import atexit
 import dotenv
 import logging
 import os
+import queue
 import sys
 import socket
+import threading
 from flask import Flask, request, jsonify
 from dotenv import load_dotenv
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, Any, Optional
 from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
 from services import JobSearchService, JobResultsLogger
 
@@ -38,9 +42,16 @@ logging.getLogger('job_sites.geekjob').setLevel(logging.WARNING)
 load_dotenv()
 
 app = Flask(__name__)
+# Waitress worker threads serving HTTP requests
+SERVER_THREADS = min(32, (os.cpu_count() or 4) * 4)
+# Runs the blocking search_jobs calls made from handle_search
 executor = ThreadPoolExecutor(max_workers=4)
 search_service = JobSearchService()
+# Site ids accepted in the ?sites= filter; the site config does not change at runtime
+AVAILABLE_SITES = frozenset(SettingsHelper.get_available_sites())
 job_results_logger = JobResultsLogger()
+# Search result logging is written to disk by a background thread, off the request path
+_log_queue = queue.Queue(maxsize=1024)
 
 # Initialize Telegram bot
 try:
@@ -52,20 +63,59 @@ except Exception as e:
     telegram_loop = None
 
 
+class _SiteDisplayNames(dict):
+    """Site display names; unknown sites are title-cased once and remembered"""
+
+    def __missing__(self, site_name):
+        display_name = self[site_name] = site_name.title()
+        return display_name
+
+
+_SITE_DISPLAY_NAMES = _SiteDisplayNames({
+    'hh': 'HeadHunter',
+    'geekjob': 'GeekJob'
+})
+
+
 def _get_site_display_name(site_name):
     """Get display name for site"""
-    site_names = {
-        'hh': 'HeadHunter',
-        'geekjob': 'GeekJob'
-    }
-    return site_names.get(site_name, site_name.title())
+    return _SITE_DISPLAY_NAMES[site_name]
+
+
+def _log_results_worker():
+    """Write queued (keyword, results, user_id, source) entries to the job results log"""
+    while True:
+        entry = _log_queue.get()
+        try:
+            job_results_logger.log_search_results(*entry)
+        except Exception as e:
+            logger.error(f"Failed to log search results for keyword: {entry[0]}: {e}")
+        finally:
+            _log_queue.task_done()
+
+
+def _queue_results_log(*entry):
+    """Queue search results for logging, dropping the oldest entry when the queue is full"""
+    while True:
+        try:
+            _log_queue.put_nowait(entry)
+            return
+        except queue.Full:
+            try:
+                _log_queue.get_nowait()
+                _log_queue.task_done()
+            except queue.Empty:
+                pass
+
+
+threading.Thread(target=_log_results_worker, name='results-logger', daemon=True).start()
 
 
 def search_jobs(keyword):
     """Search jobs using JobSearchService."""
     try:
         sites = request.args.get('sites', ','.join(SettingsHelper.get_default_site_choices())).split(',')
-        sites = [site.strip().lower() for site in sites if site.strip().lower() in SettingsHelper.get_available_sites()]
+        sites = [site for site in (site.strip().lower() for site in sites) if site in AVAILABLE_SITES]
         if not sites:
             logger.warning("No valid sites specified in request, using default sites")
             sites = SettingsHelper.get_default_site_choices()
@@ -73,7 +123,7 @@ def search_jobs(keyword):
         results = search_service.search_all_sites(keyword, None, sites)
         
         # Log job results for webhook
-        job_results_logger.log_search_results(keyword, results, None, "webhook")
+        _queue_results_log(keyword, results, None, "webhook")
         
         # Structure results by sites
         sites_data = {}
@@ -103,6 +153,29 @@ def search_jobs(keyword):
         return {"error": str(e)}
 
 
+def _log_update_failure(future):
+    """Log an update that failed while being processed on the bot loop"""
+    if not future.cancelled() and future.exception() is not None:
+        logger.error(f"Update processing failed: {future.exception()}")
+
+
+def _start_telegram_loop():
+    """Initialize the bot and run its event loop in a background thread"""
+    telegram_loop.run_until_complete(telegram_app.initialize())
+    threading.Thread(target=telegram_loop.run_forever, name='telegram-loop', daemon=True).start()
+    atexit.register(_stop_telegram_loop)
+
+
+def _stop_telegram_loop():
+    """Shut the bot down on its own loop, then stop the loop"""
+    try:
+        asyncio.run_coroutine_threadsafe(telegram_app.shutdown(), telegram_loop).result(timeout=10)
+    except Exception as e:
+        logger.error(f"Telegram shutdown failed: {e}")
+    finally:
+        telegram_loop.call_soon_threadsafe(telegram_loop.stop)
+
+
 # Webhook route
 @app.route('/webhook', methods=['POST'])
 def telegram_webhook():
@@ -110,30 +183,34 @@ def telegram_webhook():
         logger.error("Webhook request failed: Telegram bot not initialized")
         return jsonify({'status': 'error', 'message': 'Telegram bot not initialized'}), 500
 
+    user_id = 'unknown'
     try:
-        update = Update.de_json(request.get_json(force=True), telegram_app.bot)
+        update = Update.de_json(request.get_json(force=True, cache=False), telegram_app.bot)
         user_id = update.effective_user.id if update.effective_user else 'unknown'
+        text = update.message.text if update.message and update.message.text else 'no-text'
 
         # Single consolidated log message
         logger.info(
             f"Webhook processed | "
             f"User: {user_id} | "
             f"Type: {update.update_id} | "
-            f"Content: {update.to_dict().get('message', {}).get('text', 'no-text')}"
+            f"Content: {text}"
         )
 
-        future = executor.submit(
-            lambda: asyncio.run_coroutine_threadsafe(
-                telegram_app.process_update(update),
-                telegram_loop
-            ).result()
-        )
+        # Fire and forget: the bot loop runs the update, no request thread waits on it
+        future = asyncio.run_coroutine_threadsafe(telegram_app.process_update(update), telegram_loop)
+        future.add_done_callback(_log_update_failure)
         return jsonify({'status': 'success'}), 200
     except Exception as e:
         logger.error(f"Webhook error (User: {user_id}): {str(e)}")
         return jsonify({'status': 'error', 'message': str(e)}), 500
 
 
+# /search reply layout: a fixed header, then the first few jobs per site
+SEARCH_RESULTS_HEADER = "🔍 Search Results:"
+SEARCH_PREVIEW_JOBS = 3
+
+
 # Command handler
 async def handle_search(update: Update, context: ContextTypes.DEFAULT_TYPE):
     try:
@@ -155,12 +232,12 @@ async def handle_search(update: Update, context: ContextTypes.DEFAULT_TYPE):
                 f"Search command failed for user {update.effective_user.id}, keyword: {keyword}: {results['error']}")
             return
 
-        response = ["🔍 Search Results:"]
+        response = [SEARCH_RESULTS_HEADER]
+        append = response.append
         for site, data in results.get('sites', {}).items():
-            response.append(f"\n{data.get('name', SettingsHelper.get_site_name(site))} ({data['timing_ms']:.0f} ms):")
-            for idx, job in enumerate(data.get('jobs', [])[:3], 1):
-                response.append(f"{idx}. {job}")
-            response.append("")
+            append(f"\n{data.get('name', SettingsHelper.get_site_name(site))} ({data['timing_ms']:.0f} ms):")
+            response.extend(f"{idx}. {job}" for idx, job in enumerate(data.get('jobs', [])[:SEARCH_PREVIEW_JOBS], 1))
+            append("")
 
         message = '\n'.join(response) if len(response) > 1 else "No jobs found"
         await update.message.reply_text(message, disable_web_page_preview=True)
@@ -177,14 +254,27 @@ if telegram_app:
     telegram_app.add_handler(InlineQueryHandler(TelegramInlineQueryController.handle_inline_query))
 
 
+@lru_cache(maxsize=1)
+def _host_address():
+    """Resolve the hostname and IP once; DNS can block for seconds when misconfigured"""
+    hostname = socket.gethostname()
+    try:
+        ip_address = socket.gethostbyname(hostname)
+    except OSError as e:
+        logger.warning(f"Could not resolve {hostname}: {e}")
+        ip_address = '127.0.0.1'
+    return hostname, ip_address
+
+
 def get_server_info():
     """Server configuration information"""
+    hostname, ip_address = _host_address()
     return {
         "host": os.getenv('HOST', '0.0.0.0'),
         "port": int(os.getenv('PORT', 5000)),
         "debug": os.getenv('DEBUG', 'false').lower() == 'true',
-        "hostname": socket.gethostname(),
-        "ip_address": socket.gethostbyname(socket.gethostname()),
+        "hostname": hostname,
+        "ip_address": ip_address,
         "start_time": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
         "endpoints": {
             "search": "/search/<keyword> (GET)",
@@ -227,15 +317,30 @@ def run_server():
         except Exception as e:
             logger.error(f"Webhook configuration failed: {e}")
 
-    # Run Flask
-    if os.getenv('FLASK_ENV') == 'production':
-        from waitress import serve
-        serve(app, host=server_info['host'], port=server_info['port'])
-    else:
+    # Under the Werkzeug reloader only the child process (WERKZEUG_RUN_MAIN set) serves requests
+    serving_process = not server_info['debug'] or os.environ.get('WERKZEUG_RUN_MAIN')
+    if telegram_app and serving_process:
+        try:
+            _start_telegram_loop()
+        except Exception as e:
+            logger.error(f"Failed to start Telegram update loop: {e}")
+
+    # Run Flask under waitress; the Werkzeug dev server is only kept for its debugger
+    if server_info['debug']:
         app.run(
             host=server_info['host'],
             port=server_info['port'],
-            debug=server_info['debug']
+            debug=True
+        )
+    else:
+        from waitress import serve
+        serve(
+            app,
+            host=server_info['host'],
+            port=server_info['port'],
+            threads=SERVER_THREADS,
+            connection_limit=1000,
+            channel_timeout=30
         )
 
 